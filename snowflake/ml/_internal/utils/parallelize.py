@@ -1,11 +1,23 @@
+import collections
 import math
 from contextlib import contextmanager
 from timeit import default_timer
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 import snowflake.snowpark.functions as F
 from snowflake import snowpark
 
+# Upper bound of the number of expressions computed by a single partition. Wide selections are SQL-compile bound,
+# so partitions are sized to stay under this budget.
+MAX_EXPRESSIONS_PER_PARTITION = 500
+
+# Upper bound of the number of partition queries that run at once with `concurrent=True`, so that very wide tables do
+# not flood the queue of the warehouse.
+MAX_CONCURRENT_PARTITIONS = 8
+
 
 @contextmanager
 def timer() -> Generator[Callable[[], float], None, None]:
@@ -17,8 +29,49 @@ def timer() -> Generator[Callable[[], float], None, None]:
     yield lambda: elapser()
 
 
-def _flatten(L: Iterable[List[Any]]) -> List[Any]:
-    return [val for sublist in L for val in sublist]
+def _rows_to_ndarray(rows: Sequence[Sequence[Any]], n_cols: int) -> npt.NDArray[np.object_]:
+    """Copy query result rows into a 2D object array of shape (len(rows), n_cols)."""
+    res = np.empty((len(rows), n_cols), dtype=object)
+    for row_idx, row in enumerate(rows):
+        res[row_idx, :] = row
+    return res
+
+
+def _validate_output_cols(n_output_cols: List[int]) -> None:
+    """The given partitions, i.e. all but the last partition, must have the same number of output columns."""
+    if len(set(n_output_cols)) > 1:
+        raise Exception("All partitions must contain the same number of columns.")
+
+
+def get_partition_size(
+    n_cols: int,
+    n_exprs_per_col: int = 1,
+    max_exprs_per_partition: int = MAX_EXPRESSIONS_PER_PARTITION,
+) -> int:
+    """Computes the number of columns per partition for `map_dataframe_by_column`.
+
+    All columns fit in a single partition as long as they stay within the expression budget. Otherwise, the columns
+    are split into the fewest partitions that respect the budget, and the partitions are balanced so that the last
+    one is not left with a handful of columns.
+
+    Args:
+        n_cols: The number of columns to compute on.
+        n_exprs_per_col: The number of expressions computed for each column, e.g. the number of states.
+        max_exprs_per_partition: The maximum number of expressions computed by a single partition.
+
+    Returns:
+        The number of columns to include in each partition.
+
+    Raises:
+        Exception: If `max_exprs_per_partition` is not a positive integer.
+    """
+    if max_exprs_per_partition < 1:
+        raise Exception(
+            f"Expression budget per partition must be a positive integer, but got {max_exprs_per_partition}."
+        )
+    n_exprs = n_cols * max(n_exprs_per_col, 1)
+    n_partitions = max(math.ceil(n_exprs / max_exprs_per_partition), 1)
+    return max(math.ceil(n_cols / n_partitions), 1)
 
 
 def map_dataframe_by_column(
@@ -27,10 +80,12 @@ def map_dataframe_by_column(
     map_func: Callable[[snowpark.DataFrame, List[str]], snowpark.DataFrame],
     partition_size: int,
     statement_params: Optional[Dict[str, Any]] = None,
-) -> List[List[Any]]:
+    concurrent: bool = False,
+    max_concurrency: int = MAX_CONCURRENT_PARTITIONS,
+) -> npt.NDArray[np.object_]:
     """Applies the `map_func` to the input DataFrame by parallelizing it over subsets of the column.
 
-    Because the return results are materialized as Python lists *in memory*, this method should
+    Because the return results are materialized as a NumPy array *in memory*, this method should
     not be used on operations that are expected to return many rows.
 
     The `map_func` must satisfy the property that for an input `df` with columns C, then for any
@@ -38,26 +93,35 @@ def map_dataframe_by_column(
     where * is the list unpacking operator. This means that `map_func(df, col_subset)` should
     return r rows and c*|col_subset| columns, for constants r and c.
 
+    By default, the first n-1 partitions are combined with UNION ALL into a single query, and the last
+    partition is collected with a second query. With `concurrent=True`, every partition is instead submitted
+    as its own asynchronous query, so that many small queries are compiled and executed concurrently rather
+    than one large query. At most `max_concurrency` of them are in flight at once, and the next one is submitted
+    when the oldest one is done.
+
     Args:
         df: Input dataset to operate on.
         cols: List of column names to compute on. Must index into `df`.
         map_func: The map function applied on each partition of the DataFrame.
         partition_size: The number of columns to include in each partition. Must be a positive integer.
+            See `get_partition_size`.
         statement_params: Statement parameters for query telemetry.
+        concurrent: Whether to run the query of each partition as a concurrent asynchronous job.
+        max_concurrency: The maximum number of asynchronous jobs in flight with `concurrent=True`. Must be a
+            positive integer.
 
     Returns:
-        A Python list representation of the output of the query.
+        A 2D NumPy array of dtype object representing the output of the query.
 
     Raises:
         Exception: If the pre-conditions above are not met.
     """
     partition_id_col = "_PARTITION_ID"
-    n_output_cols = 0
-    unioned_df: Optional[snowpark.DataFrame] = None
-    last_partition_df = None
 
     if partition_size < 1:
         raise Exception(f"Partition size must be a positive integer, but got {partition_size}.")
+    if max_concurrency < 1:
+        raise Exception(f"Maximum concurrency must be a positive integer, but got {max_concurrency}.")
 
     try:
         n_partitions = math.ceil(len(df[cols].columns) / partition_size)
@@ -66,42 +130,54 @@ def map_dataframe_by_column(
 
     # This should never happen
     if n_partitions == 0:
-        return [[]]
+        return np.empty((1, 0), dtype=object)
 
-    # Create one DataFrame for the first n-1 partitions, and one for the last partition.
+    mapped_dfs: List[snowpark.DataFrame] = []
     for partition_id in range(n_partitions):
         cols_subset = cols[(partition_id * partition_size) : ((partition_id + 1) * partition_size)]
-        mapped_df = map_func(df, cols_subset)
-        if partition_id == 0:
-            n_output_cols = len(mapped_df.columns)
-
-        if partition_id == n_partitions - 1:
-            last_partition_df = mapped_df
-        else:
-            if n_output_cols != len(mapped_df.columns):
-                raise Exception("All partitions must contain the same number of columns.")
+        mapped_dfs.append(map_func(df, cols_subset))
+
+    # Rows of each partition, of size |n_partitions| x |n_rows| x |n_output_cols|
+    all_results: List[Sequence[Sequence[Any]]] = []
+    if concurrent:
+        jobs: Deque[snowpark.AsyncJob] = collections.deque()
+        for mapped_df in mapped_dfs:
+            if len(jobs) >= max_concurrency:
+                all_results.append(jobs.popleft().result())  # type: ignore[arg-type]
+            jobs.append(mapped_df.collect(statement_params=statement_params, block=False))  # type: ignore[arg-type]
+        all_results.extend(job.result() for job in jobs)  # type: ignore[misc]
+        # Infer the output widths from the results to avoid a schema query per partition.
+        n_output_cols = [
+            len(rows[0]) if len(rows) > 0 else len(mapped_df.columns)
+            for (rows, mapped_df) in zip(all_results, mapped_dfs)
+        ]
+        _validate_output_cols(n_output_cols[:-1])
+    else:
+        n_output_cols = [len(mapped_df.columns) for mapped_df in mapped_dfs[:-1]]
+        _validate_output_cols(n_output_cols)
+
+        # Create one DataFrame for the first n-1 partitions, and one for the last partition.
+        unioned_df: Optional[snowpark.DataFrame] = None
+        for partition_id, mapped_df in enumerate(mapped_dfs[:-1]):
             mapped_df = mapped_df.with_column(partition_id_col, F.lit(partition_id))
             unioned_df = mapped_df if unioned_df is None else unioned_df.union_all(mapped_df)
 
-    # Store results in a list of size |n_partitions| x |n_rows| x |n_output_cols|
-    all_results: List[List[List[Any]]] = [[] for _ in range(n_partitions - 1)]
-
-    # Collect the results of the first n-1 partitions, removing the partition_id column
-    unioned_result = unioned_df.collect(statement_params=statement_params) if unioned_df is not None else []
-    for row in unioned_result:
-        row_dict = row.as_dict()
-        partition_id = row_dict.pop(partition_id_col, None)
-        if partition_id is None:
-            raise Exception(f"Found unknown partition id {partition_id}.")
-        all_results[partition_id].append(list(row_dict.values()))
-
-    # Collect the results of the last partition
-    last_partition_result = (
-        [[]]
-        if last_partition_df is None
-        else [list(row) for row in last_partition_df.collect(statement_params=statement_params)]
-    )
-    all_results.append(last_partition_result)
+        # Collect the results of the first n-1 partitions, removing the trailing partition_id column
+        partitioned_rows: List[List[Sequence[Any]]] = [[] for _ in range(n_partitions - 1)]
+        unioned_result = unioned_df.collect(statement_params=statement_params) if unioned_df is not None else []
+        for row in unioned_result:
+            partition_id = row[-1]
+            if partition_id is None or not 0 <= partition_id < n_partitions - 1:
+                raise Exception(f"Found unknown partition id {partition_id}.")
+            partitioned_rows[partition_id].append(row[:-1])
+        all_results.extend(partitioned_rows)
+
+        # Collect the results of the last partition
+        last_partition_result = mapped_dfs[-1].collect(statement_params=statement_params)
+        all_results.append(last_partition_result)
+        n_output_cols.append(
+            len(last_partition_result[0]) if len(last_partition_result) > 0 else len(mapped_dfs[-1].columns)
+        )
 
     row_counts = {len(res) for res in all_results}
     if len(row_counts) > 1:
@@ -109,4 +185,7 @@ def map_dataframe_by_column(
             f"All partitions must return the same number of rows, but found multiple row counts: {row_counts}."
         )
 
-    return [_flatten(row) for row in list(zip(*all_results))]
+    return np.concatenate(
+        [_rows_to_ndarray(rows, n_cols) for (rows, n_cols) in zip(all_results, n_output_cols)],
+        axis=1,
+    )
@@ -0,0 +1,92 @@
+from typing import Any, List
+from unittest import mock
+
+import numpy as np
+from absl.testing import parameterized
+from absl.testing.absltest import main
+
+from snowflake import snowpark
+from snowflake.ml._internal.utils import parallelize
+
+
+class ParallelizeTest(parameterized.TestCase):
+    @parameterized.parameters(  # type: ignore[misc]
+        {"n_cols": 10, "n_exprs_per_col": 3, "expected": 10},
+        {"n_cols": 500, "n_exprs_per_col": 1, "expected": 500},
+        {"n_cols": 501, "n_exprs_per_col": 1, "expected": 251},
+        {"n_cols": 5000, "n_exprs_per_col": 2, "expected": 250},
+        {"n_cols": 3, "n_exprs_per_col": 1000, "expected": 1},
+        {"n_cols": 0, "n_exprs_per_col": 2, "expected": 1},
+    )
+    def test_get_partition_size(self, n_cols: int, n_exprs_per_col: int, expected: int) -> None:
+        partition_size = parallelize.get_partition_size(n_cols=n_cols, n_exprs_per_col=n_exprs_per_col)
+        self.assertEqual(expected, partition_size)
+
+    def test_get_partition_size_invalid_budget(self) -> None:
+        with self.assertRaisesRegex(Exception, "must be a positive integer"):
+            parallelize.get_partition_size(n_cols=10, max_exprs_per_partition=0)
+
+    def test_map_dataframe_by_column_concurrent(self) -> None:
+        cols = ["A", "B", "C", "D", "E"]
+        df = mock.MagicMock(spec=snowpark.DataFrame)
+        df.__getitem__.return_value.columns = cols
+        mapped_dfs = []
+
+        def _negate(_: snowpark.DataFrame, cols_subset: List[str]) -> Any:
+            mapped_df = mock.MagicMock(spec=snowpark.DataFrame)
+            mapped_df.collect.return_value.result.return_value = [tuple(-cols.index(col) for col in cols_subset)]
+            mapped_dfs.append(mapped_df)
+            return mapped_df
+
+        results = parallelize.map_dataframe_by_column(
+            df=df, cols=cols, map_func=_negate, partition_size=2, concurrent=True
+        )
+
+        np.testing.assert_array_equal(results, [[0, -1, -2, -3, -4]])
+        self.assertEqual(3, len(mapped_dfs))
+        for mapped_df in mapped_dfs:
+            mapped_df.collect.assert_called_once_with(statement_params=None, block=False)
+            mapped_df.union_all.assert_not_called()
+
+    def test_map_dataframe_by_column_max_concurrency(self) -> None:
+        cols = ["A", "B", "C", "D", "E"]
+        df = mock.MagicMock(spec=snowpark.DataFrame)
+        df.__getitem__.return_value.columns = cols
+        in_flight: List[int] = []
+        max_in_flight = 0
+
+        def _negate(_: snowpark.DataFrame, cols_subset: List[str]) -> Any:
+            partition_id = cols.index(cols_subset[0])
+
+            def result() -> List[Any]:
+                in_flight.remove(partition_id)
+                return [tuple(-cols.index(col) for col in cols_subset)]
+
+            def collect(**kwargs: Any) -> Any:
+                nonlocal max_in_flight
+                in_flight.append(partition_id)
+                max_in_flight = max(max_in_flight, len(in_flight))
+                job = mock.MagicMock(spec=snowpark.AsyncJob)
+                job.result.side_effect = result
+                return job
+
+            mapped_df = mock.MagicMock(spec=snowpark.DataFrame)
+            mapped_df.collect.side_effect = collect
+            return mapped_df
+
+        results = parallelize.map_dataframe_by_column(
+            df=df, cols=cols, map_func=_negate, partition_size=1, concurrent=True, max_concurrency=2
+        )
+
+        np.testing.assert_array_equal(results, [[0, -1, -2, -3, -4]])
+        self.assertEqual(2, max_in_flight)
+        self.assertEmpty(in_flight)
+
+        with self.assertRaisesRegex(Exception, "must be a positive integer"):
+            parallelize.map_dataframe_by_column(
+                df=df, cols=cols, map_func=_negate, partition_size=1, concurrent=True, max_concurrency=0
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import functools
 import inspect
-from typing import Any, Callable, List, Optional
+import io
+import posixpath
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Optional
 
 from snowflake import snowpark
 from snowflake.connector import connection
@@ -16,12 +19,18 @@ from snowflake.ml._internal.utils import (
     import_utils,
     snowpark_dataframe_utils,
 )
-from snowflake.ml.fileset import sfcfs
+from snowflake.ml.fileset import manifest, sfcfs
 from snowflake.snowpark import exceptions as snowpark_exceptions, functions
 
 # The max file size for data loading.
 TARGET_FILE_SIZE = 32 * 2**20
 
+# The default ceiling of the total size of the stage files cached on local disk.
+LOCAL_CACHE_SIZE = 10 * 2**30
+
+# The number of threads that read the parquet footers of the files when a FileSet is made.
+_FOOTER_READ_THREADS = 8
+
 # Expected type of a stage where a FileSet can be located.
 # The type is the value of the 'type' column of a `show stages` query.
 _FILESET_STAGE_TYPE = "INTERNAL NO CSE"
@@ -55,6 +64,8 @@ class FileSet:
         name: str,
         sf_connection: Optional[connection.SnowflakeConnection] = None,
         snowpark_session: Optional[snowpark.Session] = None,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = LOCAL_CACHE_SIZE,
     ) -> None:
         """Create a FileSet based on an existing stage directory.
 
@@ -66,6 +77,9 @@ class FileSet:
             target_stage_loc: A string of the Snowflake stage path where the FileSet will be stored.
                 It needs to be an absolute path with the form of "@{database}.{schema}.{stage}/{optional directory}/".
             name: The name of the FileSet. It is the name of the directory which holds result stage files.
+            local_cache_dir: Optional. A local directory where the stage files are cached when they are read, so that
+                they are downloaded once across epochs and processes. It can be shared by concurrent processes.
+            local_cache_size: The ceiling of the total size in bytes of the files cached in `local_cache_dir`.
 
         Raises:
             SnowflakeMLException: An error occurred when not exactly one of sf_connection and snowpark_session is given.
@@ -110,14 +124,15 @@ class FileSet:
         self._target_stage_loc = target_stage_loc
         _validate_target_stage_loc(self._snowpark_session, self._target_stage_loc)
         self._name = name
-        # We want the whole file to be downloaded into memory upon the first head.
-        # Because the actual file size might be larger TARGET_FILE_SIZE, we use a larger buffer ceiling.
+        # The buffering of files is left to the file system, which reads a row group of a parquet file by concurrent
+        # requests of the chunks that are read, instead of the rest of the file from the row group on.
         self._fs = sfcfs.SFFileSystem(
             snowpark_session=self._snowpark_session,
-            cache_type="bytes",
-            block_size=2 * TARGET_FILE_SIZE,
+            local_cache_dir=local_cache_dir,
+            local_cache_size=local_cache_size,
         )
         self._files: List[str] = []
+        self._manifest_files: Optional[List[manifest.ManifestFile]] = None
         self._is_deleted = False
 
         _get_fileset_query_id_or_raise(self.files(), self._fileset_absolute_path())
@@ -132,10 +147,15 @@ class FileSet:
         sf_connection: Optional[connection.SnowflakeConnection] = None,
         query: str = "",
         shuffle: bool = False,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = LOCAL_CACHE_SIZE,
     ) -> "FileSet":
         """Creates a FileSet object given a SQL query.
 
-        The result FileSet object captures the query result deterministically as stage files.
+        The result FileSet object captures the query result deterministically as stage files. A manifest of the files
+        with their sizes, row counts and row groups is written as "<target_stage_loc>/.fileset_manifests/<name>.json",
+        so that they are listed from it instead of by a LIST query of all the files. Writing the manifest costs one more
+        LIST query of the files and a read of the footer of each file.
 
         Args:
             target_stage_loc: A string of the Snowflake stage path where the FileSet will be stored.
@@ -148,6 +168,9 @@ class FileSet:
             query: A string of Snowflake SQL query to be executed. Mutually exclusive to `snowpark_dataframe`. Must
                 also specify `sf_connection`.
             shuffle: A boolean represents whether the data should be shuffled globally. Default to be false.
+            local_cache_dir: Optional. A local directory where the stage files are cached when they are read, so that
+                they are downloaded once across epochs and processes. It can be shared by concurrent processes.
+            local_cache_size: The ceiling of the total size in bytes of the files cached in `local_cache_dir`.
 
         Returns:
             A FileSet object.
@@ -241,7 +264,7 @@ class FileSet:
             # "partition_by=name" assigns the same sharding key <name> to all rows, resulting in all the generated files
             # located in <target_stage_loc>/<name>/ directory.
             # typing: snowpark's function signature is bogus.
-            casted_df.write.copy_into_location(  # type:ignore[call-overload]
+            copy_result = casted_df.write.copy_into_location(  # type:ignore[call-overload]
                 location=target_stage_loc,
                 file_format_type="parquet",
                 header=True,
@@ -263,7 +286,19 @@ class FileSet:
             else:
                 raise fileset_errors.FileSetError(str(e))
 
-        return cls(target_stage_loc=target_stage_loc, name=name, snowpark_session=snowpark_session)
+        _write_manifest(
+            snowpark_session,
+            _fileset_absolute_path(target_stage_loc, name),
+            _manifest_path(target_stage_loc, name),
+            copy_result,
+        )
+        return cls(
+            target_stage_loc=target_stage_loc,
+            name=name,
+            snowpark_session=snowpark_session,
+            local_cache_dir=local_cache_dir,
+            local_cache_size=local_cache_size,
+        )
 
     @property
     def name(self) -> str:
@@ -271,16 +306,73 @@ class FileSet:
         return self._name
 
     def _list_files(self) -> List[str]:
-        """Private helper function that lists all files in this fileset and caches the results for subsequent use."""
+        """Private helper function that lists all files in this fileset and caches the results for subsequent use.
+
+        The files are listed from the manifest of the FileSet, and their details are passed on to the file system so
+        that it opens them without listing them. A FileSet without a manifest is listed by a LIST query of its files.
+
+        Returns:
+            The absolute stage paths of the files in this FileSet.
+        """
         if self._files:
             return self._files
         loc = self._fileset_absolute_path()
 
-        # TODO(zzhu)[SNOW-703491]: We could use manifest file to speed up file listing
-        files = self._fs.ls(loc)
+        self._manifest_files = self._read_manifest()
+        if self._manifest_files is None:
+            files = self._fs.ls(loc)
+        else:
+            files = [loc + f.name for f in self._manifest_files]
+            self._fs.add_file_info(
+                [
+                    {"name": file, "size": f.size, "type": "file", "md5": f.md5}
+                    for file, f in zip(files, self._manifest_files)
+                ]
+            )
         self._files = [f"sfc://{file}" for file in files]
         return self._files
 
+    def _read_manifest(self) -> Optional[List[manifest.ManifestFile]]:
+        """Read the manifest of the FileSet, or return None if the FileSet has no manifest.
+
+        A manifest is left behind when its FileSet is deleted by a release without manifests, and such a release could
+        make another FileSet of the same name. So the manifest is only used if the first file in it is in the FileSet,
+        which is checked by a LIST query of the pattern of that file.
+
+        Returns:
+            The metadata of the files of the FileSet, or None if the FileSet has no manifest.
+        """
+        try:
+            manifest_files = manifest.loads(self._fs.cat_file(_manifest_path(self._target_stage_loc, self.name)))
+        except fileset_errors.StageFileNotFoundError:
+            return None
+        if not manifest_files:
+            return None
+        file_pattern = ".*/" + manifest_files[0].name.replace(".", "[.]")
+        file_rows = self._snowpark_session.sql(
+            f"LIST {self._fileset_absolute_path()} PATTERN = '{file_pattern}'"
+        ).collect(
+            statement_params=telemetry.get_function_usage_statement_params(
+                project=_PROJECT,
+                function_name=telemetry.get_statement_params_full_func_name(
+                    inspect.currentframe(), self.__class__.__name__
+                ),
+            ),
+        )
+        if not file_rows:
+            return None
+        return manifest_files
+
+    def _row_group_counts(self) -> Optional[Dict[str, int]]:
+        """Get the number of row groups of each file from the manifest, if they are known for every file."""
+        if self._manifest_files is None or any(f.row_group_row_counts is None for f in self._manifest_files):
+            return None
+        return {
+            file: len(f.row_group_row_counts)
+            for file, f in zip(self._list_files(), self._manifest_files)
+            if f.row_group_row_counts is not None
+        }
+
     def _fileset_absolute_path(self) -> str:
         """Get the Snowflake absolute path to this FileSet directory."""
         return _fileset_absolute_path(self._target_stage_loc, self.name)
@@ -337,7 +429,8 @@ class FileSet:
     def to_torch_datapipe(self, *, batch_size: int, shuffle: bool = False, drop_last_batch: bool = True) -> Any:
         """Transform the Snowflake data into a ready-to-use Pytorch datapipe.
 
-        Return a Pytorch datapipe which iterates on rows of data.
+        Return a Pytorch datapipe which iterates on rows of data. When it is read by a DataLoader with several
+        workers, or by several distributed ranks, the data is split among them.
 
         Args:
             batch_size: It specifies the size of each data batch which will be
@@ -368,7 +461,9 @@ class FileSet:
         self._fs.optimize_read(self._list_files())
 
         input_dp = IterableWrapper(self._list_files())
-        return torch_datapipe_module.ReadAndParseParquet(input_dp, self._fs, batch_size, shuffle, drop_last_batch)
+        return torch_datapipe_module.ReadAndParseParquet(
+            input_dp, self._fs, batch_size, shuffle, drop_last_batch, row_group_counts=self._row_group_counts()
+        )
 
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
@@ -441,24 +536,24 @@ class FileSet:
     @snowpark._internal.utils.private_preview(version="0.2.0")
     @_raise_if_deleted
     def delete(self) -> None:
-        """Delete the FileSet directory and all the stage files in it.
+        """Delete the FileSet directory and all the stage files in it, as well as the manifest of the FileSet.
 
         If not called, the FileSet and all its stage files will stay in Snowflake stage.
 
         Raises:
             SnowflakeMLException: An error occurred when the FileSet cannot get deleted.
         """
-        delete_sql = f"remove {self._fileset_absolute_path()}"
+        statement_params = telemetry.get_function_usage_statement_params(
+            project=_PROJECT,
+            function_name=telemetry.get_statement_params_full_func_name(
+                inspect.currentframe(), self.__class__.__name__
+            ),
+        )
         try:
-            self._snowpark_session.sql(delete_sql).collect(
-                statement_params=telemetry.get_function_usage_statement_params(
-                    project=_PROJECT,
-                    function_name=telemetry.get_statement_params_full_func_name(
-                        inspect.currentframe(), self.__class__.__name__
-                    ),
-                ),
-            )
+            for path in [self._fileset_absolute_path(), _manifest_path(self._target_stage_loc, self.name)]:
+                self._snowpark_session.sql(f"remove {path}").collect(statement_params=statement_params)
             self._files = []
+            self._manifest_files = None
             self._is_deleted = True
         except snowpark_exceptions.SnowparkClientException as e:
             raise snowml_exceptions.SnowflakeMLException(
@@ -513,6 +608,68 @@ def _get_fileset_query_id_or_raise(files: List[str], fileset_absolute_path: str)
     return query_id
 
 
+def _write_manifest(
+    snowpark_session: snowpark.Session,
+    fileset_absolute_path: str,
+    manifest_path: str,
+    copy_result: List[snowpark.Row],
+) -> None:
+    """Write the manifest of a FileSet.
+
+    The files are listed by a LIST query, and the row groups of each file are read from its footer.
+
+    Args:
+        snowpark_session: A snowpark session.
+        fileset_absolute_path: The Snowflake absolute path to the FileSet directory.
+        manifest_path: The Snowflake absolute path to the manifest of the FileSet.
+        copy_result: The detailed output of the COPY query that wrote the files, with the row count of each file.
+    """
+    fs = sfcfs.SFFileSystem(snowpark_session=snowpark_session)
+    files = [f for f in fs.ls(fileset_absolute_path, detail=True) if f["type"] == "file"]
+    query_id = _get_fileset_query_id_or_raise([f"sfc://{f['name']}" for f in files], fileset_absolute_path)
+    if query_id is None:
+        return
+    row_counts = {posixpath.basename(row["FILE_NAME"]): row["ROW_COUNT"] for row in copy_result}
+    row_group_row_counts = _read_row_group_row_counts(fs, [f["name"] for f in files])
+    manifest_files = [
+        manifest.ManifestFile(
+            name=posixpath.basename(f["name"]),
+            size=f["size"],
+            md5=f["md5"],
+            row_count=row_counts.get(posixpath.basename(f["name"])),
+            row_group_row_counts=row_group_counts,
+        )
+        for f, row_group_counts in zip(files, row_group_row_counts)
+    ]
+    snowpark_session.file.put_stream(
+        io.BytesIO(manifest.dumps(manifest_files)), manifest_path, auto_compress=False, overwrite=True
+    )
+
+
+def _read_row_group_row_counts(fs: sfcfs.SFFileSystem, files: List[str]) -> List[Optional[List[int]]]:
+    """Read the number of rows in each row group of the given parquet files from their footers.
+
+    Args:
+        fs: The file system of the files.
+        files: The stage paths of the parquet files.
+
+    Returns:
+        The number of rows in each row group of every file, or None for every file if pyarrow is not installed.
+    """
+    pq, pyarrow_available = import_utils.import_or_get_dummy("pyarrow.parquet")
+    if not pyarrow_available or not files:
+        return [None] * len(files)
+
+    def read_row_group_row_counts(file: str) -> List[int]:
+        with fs.open(file, mode="rb") as f:
+            metadata = pq.read_metadata(f)
+        return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+    fs.optimize_read(files)
+    with futures.ThreadPoolExecutor(max_workers=_FOOTER_READ_THREADS) as executor:
+        return list(executor.map(read_row_group_row_counts, files))
+
+
 def _validate_target_stage_loc(snowpark_session: snowpark.Session, target_stage_loc: str) -> bool:
     """Validate the input stage location is in the right format and the target stage is an internal SSE stage.
 
@@ -580,3 +737,19 @@ def _fileset_absolute_path(target_stage_loc: str, fileset_name: str) -> str:
         target_fileset_loc += "/"
     target_fileset_loc += fileset_name + "/"
     return target_fileset_loc
+
+
+def _manifest_path(target_stage_loc: str, fileset_name: str) -> str:
+    """Get the Snowflake absolute path to the manifest of a FileSet.
+
+    Args:
+        target_stage_loc: A string of the location where the FileSet lives in.
+        fileset_name: The name of the FileSet.
+
+    Returns:
+        The absolute path to the manifest in Snowflake, in the form of
+            '@<database>.<schema>.<stage>/<optional_directories>/.fileset_manifests/<fileset_name>.json'.
+    """
+    return _fileset_absolute_path(target_stage_loc, manifest.MANIFEST_DIR_NAME) + manifest.manifest_file_name(
+        fileset_name
+    )
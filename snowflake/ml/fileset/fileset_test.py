@@ -1,11 +1,19 @@
 import collections
+import dataclasses
+import io
+import os
+import threading
+from typing import Any, Dict, List, Tuple
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 from absl.testing import absltest
 
 from snowflake import snowpark
 from snowflake.connector import connection
 from snowflake.ml._internal.exceptions import fileset_errors
-from snowflake.ml.fileset import fileset
+from snowflake.ml.fileset import fileset, manifest, sfcfs, stage_fs
+from snowflake.ml.test_utils import range_request_server
 from snowflake.snowpark import types
 
 MockResultMetaData = collections.namedtuple("MockResultMetaData", ["name", "type_code", "precision", "scale"])
@@ -25,8 +33,16 @@ class FileSetTest(absltest.TestCase):
         )
         self.mock_df = self.df_collect_patcher.start()
 
+        # The FileSets in these tests have no manifest, and are listed by LIST queries.
+        self.write_manifest_patcher = absltest.mock.patch("snowflake.ml.fileset.fileset._write_manifest")
+        self.write_manifest_patcher.start()
+        self.read_manifest_patcher = absltest.mock.patch.object(fileset.FileSet, "_read_manifest", return_value=None)
+        self.read_manifest_patcher.start()
+
     def tearDown(self) -> None:
         self.df_collect_patcher.stop()
+        self.write_manifest_patcher.stop()
+        self.read_manifest_patcher.stop()
 
     def test_init_with_wrong_args(self) -> None:
         """Test if any error could be raised when FileSet is initiated with invalid args."""
@@ -260,7 +276,18 @@ class FileSetTest(absltest.TestCase):
             name="test",
             sf_connection=self.mock_connection,
         )
-        test_fileset.delete()
+        self.mock_df.side_effect = None
+        with absltest.mock.patch.object(
+            snowpark.Session, "sql", autospec=True, side_effect=snowpark.Session.sql
+        ) as mock_sql:
+            test_fileset.delete()
+        self.assertListEqual(
+            [call.args[1] for call in mock_sql.call_args_list],
+            [
+                "remove @mydb.mychema.mystage/mydir/test/",
+                "remove @mydb.mychema.mystage/mydir/.fileset_manifests/test.json",
+            ],
+        )
         self.assertEmpty(test_fileset._files)
         self.assertRaises(fileset_errors.FileSetAlreadyDeletedError, test_fileset.delete)
         self.assertRaises(fileset_errors.FileSetAlreadyDeletedError, test_fileset.to_torch_datapipe, shuffle=True)
@@ -286,5 +313,204 @@ class FileSetTest(absltest.TestCase):
             )
 
 
+class FileSetManifestTest(absltest.TestCase):
+    """Testing the manifest of FileSet."""
+
+    def setUp(self) -> None:
+        self.mock_connection = absltest.mock.MagicMock(spec=connection.SnowflakeConnection)
+        self.mock_connection.is_closed.return_value = False
+        self.mock_connection._telemetry = absltest.mock.Mock()
+        self.mock_connection._session_parameters = absltest.mock.Mock()
+
+        self.df_collect_patcher = absltest.mock.patch(
+            "snowflake.snowpark.dataframe.DataFrame.collect", return_value="random res"
+        )
+        self.mock_collect = self.df_collect_patcher.start()
+
+        self.loc = "@mydb.mychema.mystage/mydir/test/"
+        self.query_id = "01aa0162-0405-9f0d-000c-a90103dfc8"
+        self.manifest_path = "@mydb.mychema.mystage/mydir/.fileset_manifests/test.json"
+        self.file_names = [
+            "data_01aa0162-0405-9f0d-000c-a90103dfc8_015_1_0.snappy.parquet",
+            "data_01aa0162-0405-9f0d-000c-a90103dfc8_015_1_1.snappy.parquet",
+        ]
+        self.manifest_files = [
+            manifest.ManifestFile(
+                name=self.file_names[0], size=100, md5="md5_0", row_count=5, row_group_row_counts=[3, 2]
+            ),
+            manifest.ManifestFile(name=self.file_names[1], size=50, md5="md5_1", row_count=1, row_group_row_counts=[1]),
+        ]
+
+    def tearDown(self) -> None:
+        self.df_collect_patcher.stop()
+
+    def test_write_manifest(self) -> None:
+        """Test if the manifest holds the sizes, MD5, row counts and row groups of the files."""
+        file_data = {}
+        for name, manifest_file in zip(self.file_names, self.manifest_files):
+            f = io.BytesIO()
+            table = pa.table({"col": list(range(sum(manifest_file.row_group_row_counts or [])))})
+            pq.write_table(table, f, row_group_size=manifest_file.row_group_row_counts[0])
+            file_data[self.loc + name] = f.getvalue()
+        self.manifest_files = [
+            dataclasses.replace(f, size=len(file_data[self.loc + f.name])) for f in self.manifest_files
+        ]
+
+        with absltest.mock.patch("snowflake.ml.fileset.sfcfs.SFFileSystem", autospec=True) as MockSFFileSystem:
+            instance = MockSFFileSystem.return_value
+            instance.ls.return_value = [
+                {"name": self.loc + f.name, "size": f.size, "type": "file", "md5": f.md5} for f in self.manifest_files
+            ]
+            instance.open.side_effect = lambda file, mode: io.BytesIO(file_data[file])
+            mock_session = absltest.mock.MagicMock()
+            copy_result = [
+                snowpark.Row(FILE_NAME=f"test/{f.name}", FILE_SIZE=f.size, ROW_COUNT=f.row_count)
+                for f in self.manifest_files
+            ]
+
+            fileset._write_manifest(mock_session, self.loc, self.manifest_path, copy_result)
+
+            instance.ls.assert_called_once_with(self.loc, detail=True)
+            mock_session.file.put_stream.assert_called_once_with(
+                absltest.mock.ANY, self.manifest_path, auto_compress=False, overwrite=True
+            )
+            stream = mock_session.file.put_stream.call_args.args[0]
+            self.assertListEqual(manifest.loads(stream.read()), self.manifest_files)
+
+    def test_manifest_path(self) -> None:
+        """Test if the manifest is outside of the FileSet directory, which releases without manifests list."""
+        self.assertEqual(fileset._manifest_path("@mydb.mychema.mystage/mydir", "test"), self.manifest_path)
+        self.assertEqual(fileset._manifest_path("@mydb.mychema.mystage/mydir/", "test"), self.manifest_path)
+        self.assertFalse(self.manifest_path.startswith(self.loc))
+
+    def test_files_from_manifest(self) -> None:
+        """Test if the files of a FileSet are listed from its manifest instead of by a LIST query."""
+        with absltest.mock.patch("snowflake.ml.fileset.sfcfs.SFFileSystem", autospec=True) as MockSFFileSystem:
+            instance = MockSFFileSystem.return_value
+            instance.cat_file.return_value = manifest.dumps(self.manifest_files)
+            # The LIST query of the first file in the manifest finds it in the FileSet.
+            self.mock_collect.return_value = [
+                snowpark.Row(name=f"mystage/mydir/test/{self.file_names[0]}", size=100, md5="md5_0", last_modified="")
+            ]
+            test_fileset = fileset.FileSet(
+                target_stage_loc="@mydb.mychema.mystage/mydir",
+                name="test",
+                sf_connection=self.mock_connection,
+            )
+            expected_files = [f"sfc://{self.loc}{name}" for name in self.file_names]
+            self.assertListEqual(expected_files, test_fileset.files())
+            instance.cat_file.assert_called_once_with(self.manifest_path)
+            instance.ls.assert_not_called()
+            instance.add_file_info.assert_called_once_with(
+                [{"name": self.loc + f.name, "size": f.size, "type": "file", "md5": f.md5} for f in self.manifest_files]
+            )
+            self.assertDictEqual(test_fileset._row_group_counts(), dict(zip(expected_files, [2, 1])))
+
+    def test_files_without_manifest(self) -> None:
+        """Test if the files of a FileSet without a manifest are listed by a LIST query."""
+        with absltest.mock.patch("snowflake.ml.fileset.sfcfs.SFFileSystem", autospec=True) as MockSFFileSystem:
+            instance = MockSFFileSystem.return_value
+            instance.cat_file.side_effect = fileset_errors.StageFileNotFoundError("Stage file doesn't exist.")
+            instance.ls.return_value = [self.loc + name for name in self.file_names]
+            test_fileset = fileset.FileSet(
+                target_stage_loc="@mydb.mychema.mystage/mydir",
+                name="test",
+                sf_connection=self.mock_connection,
+            )
+            expected_files = [f"sfc://{self.loc}{name}" for name in self.file_names]
+            self.assertListEqual(expected_files, test_fileset.files())
+            instance.cat_file.assert_called_once_with(self.manifest_path)
+            instance.ls.assert_called_once_with(self.loc)
+            instance.add_file_info.assert_not_called()
+            self.assertIsNone(test_fileset._row_group_counts())
+
+    def test_files_with_stale_manifest(self) -> None:
+        """Test if the manifest of a deleted FileSet is not used to list the files of a FileSet of the same name."""
+        with absltest.mock.patch("snowflake.ml.fileset.sfcfs.SFFileSystem", autospec=True) as MockSFFileSystem:
+            instance = MockSFFileSystem.return_value
+            instance.cat_file.return_value = manifest.dumps(self.manifest_files)
+            # The stage is validated, and then the LIST query of the first file in the manifest returns no rows.
+            self.mock_collect.side_effect = ["random res", []]
+            other_file_names = [
+                name.replace(self.query_id, "01aa0162-0405-9f0d-000c-a90103dfc9") for name in self.file_names
+            ]
+            instance.ls.return_value = [self.loc + name for name in other_file_names]
+            test_fileset = fileset.FileSet(
+                target_stage_loc="@mydb.mychema.mystage/mydir",
+                name="test",
+                sf_connection=self.mock_connection,
+            )
+            self.assertListEqual([f"sfc://{self.loc}{name}" for name in other_file_names], test_fileset.files())
+            instance.add_file_info.assert_not_called()
+            self.assertIsNone(test_fileset._row_group_counts())
+
+    def test_read_parquet_ranges(self) -> None:
+        """Test if the row groups read from a FileSet are fetched by fewer requests and bytes than by a bytes cache."""
+        # Incompressible columns, so that the row groups are as large as they are in memory.
+        table = pa.table({name: pa.array([os.urandom(10000) for _ in range(400)]) for name in ["a", "b"]})
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, row_group_size=100, compression="none", use_dictionary=False)
+        http_server = range_request_server.RangeRequestServer(buffer.getvalue())
+        threading.Thread(target=http_server.serve_forever, daemon=True).start()
+        self.addCleanup(http_server.server_close)
+        self.addCleanup(http_server.shutdown)
+        manifest_files = [
+            manifest.ManifestFile(
+                name=self.file_names[0],
+                size=len(http_server.content),
+                md5="md5",
+                row_count=400,
+                row_group_row_counts=[100] * 4,
+            )
+        ]
+
+        def mock_presigned_url_fetcher(
+            stagefs: stage_fs.SFStageFileSystem, files: List[str], lifetime: int = 0
+        ) -> List[Tuple[str, str]]:
+            return [(file, http_server.url) for file in files]
+
+        class BytesCacheFileSystem(sfcfs.SFFileSystem):
+            """The file system of FileSets of earlier releases, which buffers the rest of a file from a read on."""
+
+            def __init__(self, **kwargs: Any) -> None:
+                super().__init__(cache_type="bytes", block_size=2 * fileset.TARGET_FILE_SIZE, **kwargs)
+
+        # The dataset of a datapipe checks its files by a LIST query of their directory.
+        self.mock_collect.return_value = [
+            snowpark.Row(name=f"mystage/mydir/test/{f.name}", size=f.size, md5=f.md5, last_modified="")
+            for f in manifest_files
+        ]
+        num_requests: Dict[str, List[int]] = {}
+        fetched_bytes: Dict[str, List[int]] = {}
+        with absltest.mock.patch.object(
+            stage_fs.SFStageFileSystem, "_fetch_presigned_urls", new=mock_presigned_url_fetcher
+        ), absltest.mock.patch.object(fileset.FileSet, "_read_manifest", return_value=manifest_files):
+            for name, file_system in [("ranges", sfcfs.SFFileSystem), ("bytes", BytesCacheFileSystem)]:
+                with absltest.mock.patch.object(sfcfs, "SFFileSystem", new=file_system):
+                    test_fileset = fileset.FileSet(
+                        target_stage_loc="@mydb.mychema.mystage/mydir",
+                        name="test",
+                        sf_connection=self.mock_connection,
+                    )
+                num_requests[name] = []
+                fetched_bytes[name] = []
+                # The second epoch reopens the file.
+                for _ in range(2):
+                    http_server.reset()
+                    dp = test_fileset.to_torch_datapipe(batch_size=100)
+                    self.assertListEqual(
+                        [row for batch in dp for row in batch["a"]], [row.as_py() for row in table["a"]]
+                    )
+                    num_requests[name].append(len(http_server.ranges))
+                    fetched_bytes[name].append(sum(end - start for start, end in http_server.ranges))
+
+        # Every row group is fetched by one request in both cases, and the footer is fetched once, by the first epoch.
+        self.assertListEqual(num_requests["ranges"], [5, 4])
+        self.assertListEqual(num_requests["bytes"], [6, 6])
+        # The bytes cache fetches the rest of the file from each row group on.
+        self.assertLess(fetched_bytes["ranges"][0], len(http_server.content) * 1.1)
+        self.assertGreater(fetched_bytes["bytes"][0], len(http_server.content) * 2)
+
+
 if __name__ == "__main__":
     absltest.main()
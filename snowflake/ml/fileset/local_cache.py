@@ -0,0 +1,94 @@
+import hashlib
+import logging
+import os
+import tempfile
+from typing import IO, Callable, List, Tuple
+
+from fsspec.implementations import local
+
+# The prefix of the files that are being written into the cache directory.
+_TEMP_FILE_PREFIX = ".tmp-"
+
+
+class LocalFileCache:
+    """A content-addressed cache of files in a local directory, with a size cap and least recently used eviction.
+
+    The cache can be shared by concurrent processes: an entry is written into a temporary file and atomically renamed
+    to its key, so that an entry is either absent or complete, and entries that are evicted by another process while
+    they are read stay readable through the opened file.
+
+    Args:
+        cache_dir: The local directory of the cached files. It is created if it does not exist.
+        max_bytes: The ceiling of the total size of the cached files. The least recently used files are evicted when
+            it is exceeded.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Get the cache key of a file, from the parts that identify its content, e.g. its path and checksum."""
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def open(self, key: str, fetch: Callable[[IO[bytes]], None]) -> local.LocalFileOpener:
+        """Open the cached file of the key for reading, and fetch it into the cache if it is not cached.
+
+        Args:
+            key: The cache key of the file.
+            fetch: A function that writes the content of the file into the given binary file object.
+
+        Returns:
+            A fsspec file-like object of the cached file.
+
+        # noqa: DAR401
+        """
+        path = os.path.join(self._cache_dir, key)
+        try:
+            # The modification time tracks the recency of use. It is touched before the file is opened, so that no
+            # opened file is left behind if the file is evicted by another process in between.
+            os.utime(path)
+            return local.LocalFileOpener(path, "rb")
+        except FileNotFoundError:
+            pass
+
+        fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=_TEMP_FILE_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                fetch(temp_file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        logging.debug(f"Cached {key} in {self._cache_dir}.")
+
+        # The file is opened before the eviction, so that it stays readable even if it is evicted.
+        f = local.LocalFileOpener(path, "rb")
+        self._evict()
+        return f
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the total size of the cached files is under the ceiling."""
+        entries: List[Tuple[float, int, str]] = []
+        total_bytes = 0
+        for entry in os.scandir(self._cache_dir):
+            if entry.name.startswith(_TEMP_FILE_PREFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # The file was evicted by another process.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
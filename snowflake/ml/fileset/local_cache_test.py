@@ -0,0 +1,120 @@
+import os
+import tempfile
+from typing import IO, Callable, List
+
+from absl.testing import absltest
+
+from snowflake.ml.fileset import local_cache
+
+
+class LocalFileCacheTest(absltest.TestCase):
+    """Testing LocalFileCache class."""
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+        self.fetched = 0
+
+    def _fetcher(self, content: bytes) -> Callable[[IO[bytes]], None]:
+        def fetch(f: IO[bytes]) -> None:
+            self.fetched += 1
+            f.write(content)
+
+        return fetch
+
+    def test_key(self) -> None:
+        """Test if the key is stable and distinguishes the parts that identify a file."""
+        self.assertEqual(local_cache.LocalFileCache.key("a", "b"), local_cache.LocalFileCache.key("a", "b"))
+        self.assertNotEqual(local_cache.LocalFileCache.key("a", "b"), local_cache.LocalFileCache.key("ab", ""))
+
+    def test_open(self) -> None:
+        """Test if a file is fetched on the first open, and read from the cache afterwards."""
+        cache = local_cache.LocalFileCache(self.cache_dir, 100)
+        for _ in range(3):
+            with cache.open("k1", self._fetcher(b"hello")) as f:
+                self.assertEqual(f.read(), b"hello")
+        self.assertEqual(self.fetched, 1)
+
+        # The cache can be shared by another instance, e.g. in another process.
+        other_cache = local_cache.LocalFileCache(self.cache_dir, 100)
+        with other_cache.open("k1", self._fetcher(b"hello")) as f:
+            self.assertEqual(f.read(), b"hello")
+        self.assertEqual(self.fetched, 1)
+
+    def test_open_failed_fetch(self) -> None:
+        """Test if a failed fetch leaves nothing in the cache."""
+
+        def fetch(f: IO[bytes]) -> None:
+            f.write(b"partial")
+            raise OSError("broken")
+
+        cache = local_cache.LocalFileCache(self.cache_dir, 100)
+        with self.assertRaises(OSError):
+            cache.open("k1", fetch)
+        self.assertListEqual(os.listdir(self.cache_dir), [])
+
+        with cache.open("k1", self._fetcher(b"hello")) as f:
+            self.assertEqual(f.read(), b"hello")
+        self.assertListEqual(os.listdir(self.cache_dir), ["k1"])
+
+    def test_open_evicted_by_other_process(self) -> None:
+        """Test if a file that is evicted by another process while it is opened is fetched again."""
+        cache = local_cache.LocalFileCache(self.cache_dir, 100)
+        cache.open("k1", self._fetcher(b"hello")).close()
+
+        utime = os.utime
+
+        def utime_and_evict(path: str) -> None:
+            utime(path)
+            os.remove(path)
+
+        opened_files: List[local_cache.local.LocalFileOpener] = []
+        opener = local_cache.local.LocalFileOpener
+
+        def open_and_track(path: str, mode: str) -> local_cache.local.LocalFileOpener:
+            opened_files.append(opener(path, mode))
+            return opened_files[-1]
+
+        with absltest.mock.patch("os.utime", side_effect=utime_and_evict, autospec=True):
+            with absltest.mock.patch.object(local_cache.local, "LocalFileOpener", side_effect=open_and_track):
+                with cache.open("k1", self._fetcher(b"hello")) as f:
+                    self.assertEqual(f.read(), b"hello")
+        self.assertEqual(self.fetched, 2)
+        # No file is left open.
+        self.assertLen(opened_files, 1)
+        self.assertTrue(all(f.closed for f in opened_files))
+
+    def test_evict(self) -> None:
+        """Test if the least recently used files are evicted when the size cap is exceeded."""
+        cache = local_cache.LocalFileCache(self.cache_dir, 25)
+        for i, key in enumerate(["k1", "k2"]):
+            cache.open(key, self._fetcher(b"0123456789")).close()
+            os.utime(os.path.join(self.cache_dir, key), (i, i))
+        # k1 is used again, so k2 becomes the least recently used file.
+        cache.open("k1", self._fetcher(b"0123456789")).close()
+
+        with cache.open("k3", self._fetcher(b"0123456789")) as f:
+            self.assertEqual(f.read(), b"0123456789")
+        self.assertListEqual(sorted(os.listdir(self.cache_dir)), ["k1", "k3"])
+        self.assertEqual(self.fetched, 3)
+
+    def test_evict_opened_file(self) -> None:
+        """Test if a file that is larger than the size cap is still readable after it is evicted."""
+        cache = local_cache.LocalFileCache(self.cache_dir, 5)
+        with cache.open("k1", self._fetcher(b"0123456789")) as f:
+            self.assertListEqual(os.listdir(self.cache_dir), [])
+            self.assertEqual(f.read(), b"0123456789")
+
+    def test_ignore_temp_files(self) -> None:
+        """Test if the files that are being written by other processes are not evicted."""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=local_cache._TEMP_FILE_PREFIX)
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"0" * 100)
+        cache = local_cache.LocalFileCache(self.cache_dir, 20)
+        cache.open("k1", self._fetcher(b"0123456789")).close()
+        self.assertListEqual(sorted(os.listdir(self.cache_dir)), sorted(["k1", os.path.basename(temp_path)]))
+
+
+if __name__ == "__main__":
+    absltest.main()
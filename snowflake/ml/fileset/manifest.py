@@ -0,0 +1,71 @@
+import json
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+# The directory, next to the FileSet directories of a stage location, which holds the manifests of the FileSets. It
+# is outside of the FileSet directories so that releases without manifests do not list the manifests as data files.
+MANIFEST_DIR_NAME = ".fileset_manifests"
+
+# The version of the manifest format, which is increased when the format changes incompatibly.
+_MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestFile:
+    """The metadata of a stage file of a FileSet.
+
+    Args:
+        name: The name of the file in the FileSet directory.
+        size: The size of the file in bytes.
+        md5: The MD5 of the file, as given by a LIST query.
+        row_count: The number of rows in the file, if known.
+        row_group_row_counts: The number of rows in each row group of the parquet file, if known.
+    """
+
+    name: str
+    size: int
+    md5: Optional[str] = None
+    row_count: Optional[int] = None
+    row_group_row_counts: Optional[List[int]] = None
+
+
+def manifest_file_name(fileset_name: str) -> str:
+    """Get the name of the manifest of a FileSet in the manifest directory of its stage location.
+
+    Args:
+        fileset_name: The name of the FileSet.
+
+    Returns:
+        The name of the manifest file.
+    """
+    return f"{fileset_name}.json"
+
+
+def dumps(files: List[ManifestFile]) -> bytes:
+    """Serialize the metadata of the files of a FileSet into a manifest.
+
+    Args:
+        files: The metadata of the files, in the order in which they are listed.
+
+    Returns:
+        The content of the manifest file.
+    """
+    return json.dumps({"version": _MANIFEST_VERSION, "files": [asdict(f) for f in files]}).encode()
+
+
+def loads(data: bytes) -> List[ManifestFile]:
+    """Deserialize the metadata of the files of a FileSet from a manifest.
+
+    Args:
+        data: The content of the manifest file.
+
+    Returns:
+        The metadata of the files, in the order in which they are listed.
+
+    Raises:
+        ValueError: An error occurred when the manifest is written in a version that is not supported.
+    """
+    manifest = json.loads(data)
+    if manifest.get("version") != _MANIFEST_VERSION:
+        raise ValueError(f"Unsupported FileSet manifest version {manifest.get('version')}.")
+    return [ManifestFile(**f) for f in manifest["files"]]
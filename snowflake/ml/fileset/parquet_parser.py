@@ -1,17 +1,27 @@
 import collections
-from typing import Any, Deque, Dict, Iterator, List
+import types
+from concurrent import futures
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 import fsspec
 import numpy as np
 import numpy.typing as npt
 import pyarrow as pa
 import pyarrow.dataset as ds
+from pyarrow import fs as pa_fs
+
+from snowflake.ml.fileset import sfcfs, stage_fs
 
 _EMPTY_RECORD_BATCH = pa.RecordBatch.from_arrays([], [])
 
-# The row count for batches read from PyArrow Dataset. This number should be large enough so that
-# dataset.to_batches() would read in a very large portion of, if not entirely, a parquet file.
-_DEFAULT_DATASET_BATCH_SIZE = 1000000
+# The number of row groups that are read and decoded in background threads ahead of the consumption of their batches.
+_DEFAULT_PREFETCH_ROW_GROUPS = 2
+
+# The ceiling of the decoded bytes of prefetched row groups that are waiting to be consumed.
+_DEFAULT_PREFETCH_BYTES = 512 * 2**20
+
+# The row count of the buffer in which rows of several row groups, likely from several files, are shuffled together.
+_DEFAULT_SHUFFLE_BUFFER_SIZE = 100000
 
 
 class _RecordBatchesBuffer:
@@ -35,6 +45,22 @@ class _RecordBatchesBuffer:
         return popped
 
 
+class _ProjectedFSSpecHandler(pa_fs.FSSpecHandler):
+    """A handler of a fsspec file system that opens files with the names of the columns that are going to be read.
+
+    The stage file systems read the chunks of these columns only, when they fetch a row group of a parquet file.
+    """
+
+    def __init__(self, fs: fsspec.AbstractFileSystem, columns: List[str]) -> None:
+        super().__init__(fs)
+        self._columns = columns
+
+    def open_input_file(self, path: str) -> pa.PythonFile:
+        if not self.fs.isfile(path):
+            raise FileNotFoundError(path)
+        return pa.PythonFile(self.fs.open(path, mode="rb", columns=self._columns), mode="r")
+
+
 class ParquetParser:
     """Read and parse the given parquet files and yield batched numpy array in dict.
 
@@ -43,9 +69,25 @@ class ParquetParser:
         filesystem: A fsspec/pyarrow file system that is used to open given file URIs.
         batch_size: Specifies the size of each batch that will be yield
         shuffle: Whether the data in the file will be shuffled. If set to be true, it will first randomly shuffle
-            the order of files, and then shuflle the order of rows in each file.
+            the order of files and the order of row groups in each file, and then shuffle the rows of consecutive
+            row groups in a buffer of `shuffle_buffer_size` rows.
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
             get dropped if its size is smaller than the given batch_size.
+        prefetch_row_groups: The number of row groups that are read and decoded in background threads while the
+            batches of the current one are consumed. If set to 0, row groups are streamed on the caller's thread when
+            they are needed.
+        prefetch_bytes: The ceiling of the decoded bytes of prefetched row groups waiting to be consumed. No more
+            row groups are prefetched while it is reached, but the next one is always read.
+        shuffle_buffer_size: The row count of the shuffle buffer. When the buffer is full, its rows are shuffled
+            and half of them are yielded. A larger buffer mixes rows from more files with more memory.
+        columns: The names of the columns to read. All columns are read by default.
+        seed: The seed of the shuffle. If not set, the global numpy random state is used. It must be set, and be the
+            same for every shard, to shuffle sharded data.
+        num_shards: The number of shards that the data is split into, e.g. one per data loading worker.
+        shard_index: The index of the shard to read, in [0, num_shards). The files are split among the shards if
+            there are at least as many files as shards, and their row groups otherwise.
+        row_group_counts: Optional. The number of row groups of each file, e.g. from a FileSet manifest. If the row
+            groups are split among the shards, a shard only opens the files that hold some of its row groups.
 
     Returns:
         A PyTorch iterable datapipe that yields batched numpy array in dict. The keys will be the column names in
@@ -59,13 +101,28 @@ class ParquetParser:
         batch_size: int,
         shuffle: bool = True,
         drop_last_batch: bool = True,
+        prefetch_row_groups: int = _DEFAULT_PREFETCH_ROW_GROUPS,
+        prefetch_bytes: int = _DEFAULT_PREFETCH_BYTES,
+        shuffle_buffer_size: int = _DEFAULT_SHUFFLE_BUFFER_SIZE,
+        columns: Optional[List[str]] = None,
+        seed: Optional[int] = None,
+        num_shards: int = 1,
+        shard_index: int = 0,
+        row_group_counts: Optional[Dict[str, int]] = None,
     ) -> None:
         self._file_paths = file_paths
         self._fs = filesystem
         self._batch_size = batch_size
-        self._dataset_batch_size = max(_DEFAULT_DATASET_BATCH_SIZE, self._batch_size)
         self._shuffle = shuffle
         self._drop_last_batch = drop_last_batch
+        self._prefetch_row_groups = prefetch_row_groups
+        self._prefetch_bytes = prefetch_bytes
+        self._shuffle_buffer_size = max(shuffle_buffer_size, 2 * batch_size)
+        self._columns = columns
+        self._seed = seed
+        self._num_shards = num_shards
+        self._shard_index = shard_index
+        self._row_group_counts = row_group_counts
 
     def __iter__(self) -> Iterator[Dict[str, npt.NDArray[Any]]]:
         """Iterate through PyArrow Dataset to generate batches whose length equals to expected batch size.
@@ -78,21 +135,158 @@ class ParquetParser:
             A dict mapping column names to the corresponding data fetch from that column.
         """
         self._rb_buffer = _RecordBatchesBuffer()
+        shuffle_buffer = _RecordBatchesBuffer()
         files = list(self._file_paths)
         if self._shuffle:
-            np.random.shuffle(files)
-        pa_dataset: ds.Dataset = ds.dataset(files, format="parquet", filesystem=self._fs)
+            # The order of files is the same for every shard, and the other random orders are specific to a shard.
+            _random_state(self._seed).shuffle(files)
+        self._random = _random_state(self._seed, self._shard_index)
+        self._shard_row_groups = False
+        self._row_group_starts: Optional[List[int]] = None
+        if self._num_shards > 1:
+            if len(files) >= self._num_shards:
+                files = files[self._shard_index :: self._num_shards]
+            else:
+                self._shard_row_groups = True
+                if self._row_group_counts is not None and all(f in self._row_group_counts for f in files):
+                    files, self._row_group_starts = self._plan_row_group_shard(files, self._row_group_counts)
+        pa_dataset: ds.Dataset = ds.dataset(files, format="parquet", filesystem=self._dataset_filesystem())
 
-        for rb in pa_dataset.to_batches(batch_size=self._dataset_batch_size):
+        for rb in self._iter_record_batches(pa_dataset):
             if self._shuffle:
-                rb = rb.take(np.random.permutation(rb.num_rows))
+                shuffle_buffer.append(rb)
+                if shuffle_buffer.num_rows < self._shuffle_buffer_size:
+                    continue
+                rb = _shuffle_buffer(shuffle_buffer, self._shuffle_buffer_size // 2, self._random)
             self._rb_buffer.append(rb)
             while self._rb_buffer.num_rows >= self._batch_size:
                 yield self._get_batches_from_buffer()
 
+        if shuffle_buffer.num_rows:
+            self._rb_buffer.append(_shuffle_buffer(shuffle_buffer, 0, self._random))
+            while self._rb_buffer.num_rows >= self._batch_size:
+                yield self._get_batches_from_buffer()
+
         if self._rb_buffer.num_rows and not self._drop_last_batch:
             yield self._get_batches_from_buffer()
 
+    def _dataset_filesystem(self) -> Union[fsspec.AbstractFileSystem, pa_fs.FileSystem]:
+        """The file system of the dataset, which opens stage files with the columns to read, if they are projected."""
+        if self._columns is not None and isinstance(self._fs, (sfcfs.SFFileSystem, stage_fs.SFStageFileSystem)):
+            return pa_fs.PyFileSystem(_ProjectedFSSpecHandler(self._fs, self._columns))
+        return self._fs
+
+    def _iter_record_batches(self, pa_dataset: ds.Dataset) -> Iterator[pa.RecordBatch]:
+        """Iterate through the record batches of the row groups, with the next row groups read in background threads.
+
+        The record batches are the chunks of the decoded row groups, so that the memory of the parser is proportional
+        to the number of prefetched row groups rather than to the file size. They are not split into `batch_size`
+        rows here: batches are zero-copy slices of them, and only a batch that spans two record batches is copied.
+
+        Args:
+            pa_dataset: The dataset of the files of the shard.
+
+        Yields:
+            The record batches of the row groups, in the order of the row groups.
+        """
+        if self._prefetch_row_groups < 1:
+            for row_group in self._iter_row_groups(pa_dataset, None):
+                yield from row_group.to_batches(schema=pa_dataset.schema, columns=self._columns)
+            return
+
+        # One more thread reads the footers of the next files, so that row groups are not queued behind them.
+        executor = futures.ThreadPoolExecutor(max_workers=self._prefetch_row_groups + 1)
+        row_groups = self._iter_row_groups(pa_dataset, executor)
+        pending: Deque["futures.Future[pa.Table]"] = collections.deque()
+        try:
+            while True:
+                # The decoded size is known once a row group is read, so the ceiling bounds the row groups waiting to
+                # be consumed, and the row groups being read are bounded by the depth.
+                while len(pending) < self._prefetch_row_groups + 1:
+                    if pending and _decoded_bytes(pending) >= self._prefetch_bytes:
+                        break
+                    row_group = next(row_groups, None)
+                    if row_group is None:
+                        break
+                    pending.append(executor.submit(row_group.to_table, schema=pa_dataset.schema, columns=self._columns))
+                if not pending:
+                    return
+                table = pending.popleft().result()
+                yield from table.to_batches()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_row_groups(
+        self, pa_dataset: ds.Dataset, executor: Optional[futures.ThreadPoolExecutor]
+    ) -> Iterator[ds.Fragment]:
+        """Iterate through the row groups of the shard, in random order in each file if shuffle is set."""
+        num_row_groups = 0
+        for file_index, file_row_groups in enumerate(self._iter_file_row_groups(pa_dataset, executor)):
+            row_groups = list(file_row_groups)
+            if self._shard_row_groups:
+                start = self._row_group_starts[file_index] if self._row_group_starts is not None else num_row_groups
+                row_groups = [
+                    row_group
+                    for index, row_group in enumerate(row_groups, start=start)
+                    if index % self._num_shards == self._shard_index
+                ]
+                num_row_groups += len(file_row_groups)
+            if self._shuffle:
+                self._random.shuffle(row_groups)
+            yield from row_groups
+
+    def _plan_row_group_shard(self, files: List[str], row_group_counts: Dict[str, int]) -> Tuple[List[str], List[int]]:
+        """Select the files that hold some row groups of the shard, with the global index of their first row group."""
+        shard_files = []
+        starts = []
+        start = 0
+        for file in files:
+            count = row_group_counts[file]
+            # The row groups [start, start + count) of the file hold an index of the shard modulo the number of shards.
+            if count >= self._num_shards or (self._shard_index - start) % self._num_shards < count:
+                shard_files.append(file)
+                starts.append(start)
+            start += count
+        return shard_files, starts
+
+    def _iter_file_row_groups(
+        self, pa_dataset: ds.Dataset, executor: Optional[futures.ThreadPoolExecutor]
+    ) -> Iterator[List[ds.Fragment]]:
+        """Iterate through the lists of row groups of the files.
+
+        The row groups of a file are known from its footer, so the footers of the next files are read in background
+        threads of the executor, if any.
+
+        Args:
+            pa_dataset: The dataset of the files of the shard.
+            executor: The executor of the background threads. The footers are read on the caller's thread if None.
+
+        Yields:
+            The row groups of each file, in the order of the files.
+        """
+        files: Iterator[ds.Fragment] = iter(pa_dataset.get_fragments())
+        if executor is None:
+            for file in files:
+                yield file.split_by_row_group()
+            return
+
+        pending: Deque["futures.Future[List[ds.Fragment]]"] = collections.deque()
+        try:
+            while True:
+                while len(pending) < self._prefetch_row_groups + 1:
+                    file = next(files, None)
+                    if file is None:
+                        break
+                    pending.append(executor.submit(file.split_by_row_group))
+                if not pending:
+                    return
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
     def _get_batches_from_buffer(self) -> Dict[str, npt.NDArray[Any]]:
         """Generate new batches from the existing record batch buffer."""
         cnt_rbs_num_rows = 0
@@ -118,6 +312,35 @@ class ParquetParser:
         return _record_batch_to_arrays(res)
 
 
+def _decoded_bytes(pending: Deque["futures.Future[pa.Table]"]) -> int:
+    """Total decoded bytes of the row groups that have been read."""
+    return sum(future.result().nbytes for future in pending if future.done() and not future.exception())
+
+
+def _random_state(seed: Optional[int], *keys: int) -> Union[types.ModuleType, np.random.RandomState]:
+    """The random state of the seed and keys, or the global numpy random state if there is no seed."""
+    if seed is None:
+        return np.random
+    return np.random.RandomState([seed, *keys])
+
+
+def _shuffle_buffer(
+    shuffle_buffer: _RecordBatchesBuffer,
+    num_rows_to_keep: int,
+    random: Union[types.ModuleType, np.random.RandomState],
+) -> pa.RecordBatch:
+    """Shuffle the rows of the buffer, keep the given number of them in it and return the others."""
+    record_batches = []
+    while shuffle_buffer.num_rows:
+        record_batches.append(shuffle_buffer.popleft())
+    rb = _merge_record_batches(record_batches)
+    rb = rb.take(random.permutation(rb.num_rows))
+    cut_off = rb.num_rows - num_rows_to_keep
+    if num_rows_to_keep:
+        shuffle_buffer.append(rb.slice(offset=cut_off))
+    return rb.slice(length=cut_off)
+
+
 def _merge_record_batches(record_batches: List[pa.RecordBatch]) -> pa.RecordBatch:
     """Merge a list of arrow RecordBatches into one. Similar to MergeTables."""
     if not record_batches:
@@ -134,7 +357,11 @@ def _record_batch_to_arrays(rb: pa.RecordBatch) -> Dict[str, npt.NDArray[Any]]:
     """Transform the record batch to a (string, numpy array) dict."""
     batch_dict = {}
     for column, column_schema in zip(rb, rb.schema):
-        # zero_copy_only=False because of nans. Ideally nans should have been imputed in feature engineering.
-        array = column.to_numpy(zero_copy_only=False)
+        if column.null_count == 0 and (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+            # Null-free fixed-width columns are read-only views of the Arrow buffers.
+            array = column.to_numpy(zero_copy_only=True)
+        else:
+            # zero_copy_only=False because of nans. Ideally nans should have been imputed in feature engineering.
+            array = column.to_numpy(zero_copy_only=False)
         batch_dict[column_schema.name] = array
     return batch_dict
@@ -1,8 +1,53 @@
+import tempfile
+import threading
+import time
+from typing import Any
+from unittest import mock
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from absl.testing import absltest
 from fsspec.implementations import local
 
-from snowflake.ml.fileset import parquet_parser, parquet_test_util
+from snowflake.ml.fileset import parquet_parser, parquet_test_util, sfcfs
+
+_FILE_LATENCY_SECS = 0.2
+
+
+class _CountingFileSystem(local.LocalFileSystem):  # type: ignore[misc]
+    """A local file system that counts the file openings."""
+
+    cachable = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.num_open = 0
+
+    def _open(self, *args: Any, **kwargs: Any) -> Any:
+        self.num_open += 1
+        return super()._open(*args, **kwargs)
+
+
+class _SlowFileSystem(local.LocalFileSystem):  # type: ignore[misc]
+    """A local file system that injects latency into every file opening, and tracks the concurrent openings."""
+
+    cachable = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.num_opening = 0
+        self.max_num_opening = 0
+
+    def _open(self, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self.num_opening += 1
+            self.max_num_opening = max(self.max_num_opening, self.num_opening)
+        time.sleep(_FILE_LATENCY_SECS)
+        with self._lock:
+            self.num_opening -= 1
+        return super()._open(*args, **kwargs)
 
 
 class ParquetParserTest(absltest.TestCase):
@@ -49,13 +94,13 @@ class ParquetParserTest(absltest.TestCase):
     def test_parquet_parser_shuffle(self) -> None:
         """Test if the parquet parser could generate random ordered result with shuffle=True."""
         expected_res = [
-            {"col1": np.array([6]), "col2": np.array([16]), "col3": np.array(["mnmn"], dtype="object")},
+            {"col1": np.array([1]), "col2": np.array([11]), "col3": np.array(["ab"], dtype="object")},
+            {"col1": np.array([4]), "col2": np.array([14]), "col3": np.array(["mn"], dtype="object")},
+            {"col1": np.array([0]), "col2": np.array([10]), "col3": np.array(["a"], dtype="object")},
             {"col1": np.array([5]), "col2": np.array([np.NaN]), "col3": np.array(["mnm"], dtype="object")},
+            {"col1": np.array([6]), "col2": np.array([16]), "col3": np.array(["mnmn"], dtype="object")},
             {"col1": np.array([3]), "col2": np.array([13]), "col3": np.array(["m"], dtype="object")},
-            {"col1": np.array([4]), "col2": np.array([14]), "col3": np.array(["mn"], dtype="object")},
-            {"col1": np.array([1]), "col2": np.array([11]), "col3": np.array(["ab"], dtype="object")},
             {"col1": np.array([2]), "col2": np.array([12]), "col3": np.array(["abc"], dtype="object")},
-            {"col1": np.array([0]), "col2": np.array([10]), "col3": np.array(["a"], dtype="object")},
         ]
         np.random.seed(2)
         files = [self._file0.name, self._file1.name, self._file2.name]
@@ -67,6 +112,147 @@ class ParquetParserTest(absltest.TestCase):
             count += 1
         self.assertEqual(count, len(expected_res))
 
+    def test_parquet_parser_shuffle_buffer(self) -> None:
+        """Test if the shuffle buffer yields every row once, before the whole files are read."""
+        files = []
+        for i in range(3):
+            f = tempfile.NamedTemporaryFile()
+            pq.write_table(pa.table({"col1": np.arange(i * 100, (i + 1) * 100)}), f.name, row_group_size=10)
+            files.append(f)
+        fs = _CountingFileSystem()
+        pq_parser = parquet_parser.ParquetParser(
+            [f.name for f in files], fs, batch_size=5, shuffle=True, prefetch_row_groups=0, shuffle_buffer_size=20
+        )
+
+        batches = iter(pq_parser)
+        res = [next(batches)["col1"]]
+        # The first batch is yielded once the buffer is filled with 2 of the 30 row groups.
+        self.assertLess(fs.num_open, 10)
+        res.extend(batch["col1"] for batch in batches)
+
+        self.assertLen(res, 60)
+        np.testing.assert_array_equal(np.sort(np.concatenate(res)), np.arange(300))
+
+    def test_parquet_parser_streams_row_groups(self) -> None:
+        """Test if the memory held by the parser is proportional to row groups rather than to files."""
+        num_rows, row_group_size = 400000, 20000
+        table = pa.table({f"col{i}": np.arange(num_rows) for i in range(4)})
+        row_group_bytes = table.nbytes * row_group_size // num_rows
+        f = tempfile.NamedTemporaryFile()
+        pq.write_table(table, f.name, row_group_size=row_group_size)
+
+        for prefetch_row_groups in [0, 2]:
+            pq_parser = parquet_parser.ParquetParser(
+                [f.name],
+                local.LocalFileSystem(),
+                batch_size=1000,
+                shuffle=False,
+                prefetch_row_groups=prefetch_row_groups,
+                columns=["col0", "col2"],
+            )
+            base_bytes = pa.total_allocated_bytes()
+            peak_bytes = 0
+            count = 0
+            for batch in pq_parser:
+                peak_bytes = max(peak_bytes, pa.total_allocated_bytes() - base_bytes)
+                # The batches are not kept, as they may share the memory of the record batches they are sliced from.
+                expected_batch = np.arange(count * 1000, (count + 1) * 1000)
+                self.assertEqual(list(batch.keys()), ["col0", "col2"])
+                np.testing.assert_array_equal(batch["col0"], expected_batch)
+                np.testing.assert_array_equal(batch["col2"], expected_batch)
+                count += 1
+
+            self.assertEqual(count, 400)
+            self.assertLess(peak_bytes, (prefetch_row_groups + 2) * row_group_bytes)
+
+    def test_parquet_parser_zero_copy_batches(self) -> None:
+        """Test if batches are views of the decoded row groups, and copied only across row groups."""
+        num_rows, row_group_size, batch_size = 10000, 1000, 300
+        f = tempfile.NamedTemporaryFile()
+        pq.write_table(pa.table({"col1": np.arange(num_rows), "col2": np.arange(num_rows) / 2}), f.name, row_group_size)
+
+        for prefetch_row_groups in [0, 2]:
+            pq_parser = parquet_parser.ParquetParser(
+                [f.name], local.LocalFileSystem(), batch_size, shuffle=False, prefetch_row_groups=prefetch_row_groups
+            )
+            with mock.patch.object(
+                parquet_parser, "_merge_record_batches", wraps=parquet_parser._merge_record_batches
+            ) as mock_merge:
+                res = list(pq_parser)
+
+            self.assertLen(res, num_rows // batch_size)
+            for batch in res:
+                self.assertFalse(batch["col1"].flags.owndata)
+                self.assertFalse(batch["col2"].flags.owndata)
+            np.testing.assert_array_equal(np.concatenate([batch["col1"] for batch in res]), np.arange(9900))
+            # Only the batches spanning two row groups are merged.
+            num_merged = sum(len(call.args[0]) > 1 for call in mock_merge.call_args_list)
+            self.assertLessEqual(num_merged, num_rows // row_group_size - 1)
+
+    def test_parquet_parser_shards(self) -> None:
+        """Test if the shards of files or row groups cover every row exactly once."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        # With 2 shards the files are split, and with 5 shards the row groups are.
+        for num_shards in [2, 5]:
+            for shuffle in [False, True]:
+                res = []
+                for shard_index in range(num_shards):
+                    pq_parser = parquet_parser.ParquetParser(
+                        files,
+                        local.LocalFileSystem(),
+                        batch_size=1,
+                        shuffle=shuffle,
+                        drop_last_batch=False,
+                        seed=0,
+                        num_shards=num_shards,
+                        shard_index=shard_index,
+                    )
+                    res.extend(int(batch["col1"][0]) for batch in pq_parser)
+                self.assertEqual(sorted(res), list(range(7)))
+
+    def test_parquet_parser_shards_row_group_counts(self) -> None:
+        """Test if the shards of row groups only open the files that hold their row groups, if the counts are known."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        row_group_counts = {file: pq.read_metadata(file).num_row_groups for file in files}
+        fs = _CountingFileSystem()
+        for shuffle in [False, True]:
+            num_open = {}
+            for counts in [None, row_group_counts]:
+                res = []
+                num_open_before = fs.num_open
+                for shard_index in range(5):
+                    pq_parser = parquet_parser.ParquetParser(
+                        files,
+                        fs,
+                        batch_size=1,
+                        shuffle=shuffle,
+                        drop_last_batch=False,
+                        seed=0,
+                        num_shards=5,
+                        shard_index=shard_index,
+                        row_group_counts=counts,
+                    )
+                    res.extend(int(batch["col1"][0]) for batch in pq_parser)
+                self.assertEqual(sorted(res), list(range(7)))
+                num_open[counts is None] = fs.num_open - num_open_before
+            # Every file has one row group, so that it is opened by a single shard rather than by every shard.
+            self.assertLess(num_open[False], num_open[True])
+
+    def test_parquet_parser_opens_stage_files_with_columns(self) -> None:
+        """Test if the parquet parser opens stage files with the projected columns, so that only they are fetched."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        fs = mock.MagicMock(spec=sfcfs.SFFileSystem, wraps=local.LocalFileSystem())
+        pq_parser = parquet_parser.ParquetParser(
+            files, fs, batch_size=7, shuffle=False, drop_last_batch=False, columns=["col1"]
+        )
+        res = list(pq_parser)
+        self.assertLen(res, 1)
+        np.testing.assert_array_equal(res[0]["col1"], np.arange(7))
+        self.assertNotIn("col2", res[0])
+        self.assertTrue(fs.open.called)
+        for call in fs.open.call_args_list:
+            self.assertEqual(call.kwargs["columns"], ["col1"])
+
     def test_parquet_parser_not_drop_last_batch(self) -> None:
         """Test if the last batch of data could be generated when drop_last_batch is set to be False."""
         expected_res = [
@@ -87,6 +273,46 @@ class ParquetParserTest(absltest.TestCase):
             count += 1
         self.assertEqual(count, len(expected_res))
 
+    def test_parquet_parser_prefetch_settings(self) -> None:
+        """Test if the parquet parser yields the same batches with any prefetch settings."""
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        expected_res = list(parquet_parser.ParquetParser(files, local.LocalFileSystem(), 2, False, False, 0))
+        for prefetch_row_groups, prefetch_bytes in [(1, 1), (2, 1), (3, 2**20)]:
+            pq_parser = parquet_parser.ParquetParser(
+                files,
+                local.LocalFileSystem(),
+                batch_size=2,
+                shuffle=False,
+                drop_last_batch=False,
+                prefetch_row_groups=prefetch_row_groups,
+                prefetch_bytes=prefetch_bytes,
+            )
+            res = list(pq_parser)
+            self.assertEqual(len(res), len(expected_res))
+            for batch, expected_batch in zip(res, expected_res):
+                np.testing.assert_equal(batch, expected_batch)
+
+    def test_parquet_parser_prefetch_overlaps_consumption(self) -> None:
+        """Test if the next files are read while the batches of the current file are consumed."""
+        files = [self._file0.name, self._file1.name, self._file2.name] * 3
+        fs = _SlowFileSystem()
+        pq_parser = parquet_parser.ParquetParser(files, fs, batch_size=1, shuffle=False, prefetch_row_groups=2)
+
+        intervals = []
+        last_time = time.perf_counter()
+        for _ in pq_parser:
+            # Simulate a training step on the batch.
+            time.sleep(_FILE_LATENCY_SECS / 2)
+            now = time.perf_counter()
+            intervals.append(now - last_time)
+            last_time = now
+
+        self.assertLen(intervals, 21)
+        # Except for the first batch, no batch waits for a file to be read, including at file boundaries.
+        self.assertLess(max(intervals[1:]), _FILE_LATENCY_SECS)
+        # 2 row groups, and the footer of a next file, are read at once.
+        self.assertLessEqual(fs.max_num_opening, 3)
+
 
 if __name__ == "__main__":
     absltest.main()
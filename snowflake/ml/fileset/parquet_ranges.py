@@ -0,0 +1,214 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from fsspec import caching
+
+from snowflake.ml._internal.utils import import_utils
+
+# Ranges that are closer than this are fetched by one request, as reading the gap costs less than a round trip.
+_MAX_GAP_BYTES = 1 * 2**20
+
+# The ceiling of the size of coalesced ranges, so that large reads are still split into concurrent requests. A single
+# range which is larger is not split.
+_MAX_BLOCK_BYTES = 32 * 2**20
+
+# The size of the tail of a file which is fetched to read its footer, as much as parquet readers read at first.
+_FOOTER_SAMPLE_BYTES = 64 * 2**10
+
+# The size of the footer length and the magic bytes at the end of a parquet file.
+_FOOTER_SUFFIX_BYTES = 8
+
+_PARQUET_MAGIC = b"PAR1"
+
+
+@dataclass(frozen=True)
+class ParquetLayout:
+    """The byte ranges of the column chunks of a parquet file, as described by its footer.
+
+    Args:
+        footer_start: The offset of the footer in the file.
+        columns: The paths of the columns in the schema, e.g. "a" or "a.b" for a nested field.
+        row_groups: The start and end offsets of the chunk of each column, for each row group.
+    """
+
+    footer_start: int
+    columns: List[str]
+    row_groups: List[List[Tuple[int, int]]]
+
+    def row_group_ranges(self, offset: int, columns: Optional[List[str]] = None) -> List[Tuple[int, int]]:
+        """Get the ranges of the column chunks of the row group that holds the offset.
+
+        Args:
+            offset: An offset in the file.
+            columns: The names of the top level columns whose chunks are returned. All columns by default.
+
+        Returns:
+            The ranges of the column chunks, or an empty list if the offset is not in a row group.
+        """
+        for chunks in self.row_groups:
+            if chunks and min(s for s, _ in chunks) <= offset < max(e for _, e in chunks):
+                return [
+                    chunk
+                    for path, chunk in zip(self.columns, chunks)
+                    if columns is None or any(path == c or path.startswith(c + ".") for c in columns)
+                ]
+        return []
+
+
+def coalesce_ranges(
+    ranges: List[Tuple[int, int]], max_gap: int = _MAX_GAP_BYTES, max_block: int = _MAX_BLOCK_BYTES
+) -> List[Tuple[int, int]]:
+    """Merge the byte ranges that overlap, or that are closer than `max_gap` up to `max_block` bytes.
+
+    Args:
+        ranges: A list of start and end offsets.
+        max_gap: The largest gap between two ranges that are merged.
+        max_block: The ceiling of the size of merged ranges. Overlapping ranges are merged regardless.
+
+    Returns:
+        The merged ranges, in the order of their offsets. Every given range is held by one of them.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged:
+            last_start, last_end = merged[-1]
+            if start <= last_end or (start - last_end <= max_gap and max(end, last_end) - last_start <= max_block):
+                merged[-1] = (last_start, max(last_end, end))
+                continue
+        merged.append((start, end))
+    return merged
+
+
+def parse_layout(footer: bytes, footer_start: int) -> Optional[ParquetLayout]:
+    """Parse the layout of a parquet file from its footer.
+
+    Args:
+        footer: The bytes of the file from `footer_start` to its end.
+        footer_start: The offset of the footer in the file.
+
+    Returns:
+        The layout of the file, or None if pyarrow is not installed or the footer cannot be parsed.
+    """
+    pa, pyarrow_available = import_utils.import_or_get_dummy("pyarrow")
+    pq, _ = import_utils.import_or_get_dummy("pyarrow.parquet")
+    if not pyarrow_available:
+        return None
+    try:
+        # The metadata is read from the end of the buffer, and its offsets are those in the whole file.
+        metadata = pq.read_metadata(pa.BufferReader(footer))
+    except Exception:
+        return None
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        chunks = []
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            start = column.data_page_offset
+            if column.has_dictionary_page and 0 < column.dictionary_page_offset < start:
+                start = column.dictionary_page_offset
+            chunks.append((start, start + column.total_compressed_size))
+        row_groups.append(chunks)
+    columns = [metadata.schema.column(j).path for j in range(metadata.num_columns)]
+    return ParquetLayout(footer_start, columns, row_groups)
+
+
+class ParquetRangeCache(caching.BaseCache):
+    """A read cache of a parquet file, which fetches a row group by concurrent requests of coalesced ranges.
+
+    The first read fetches the tail of the file to parse the footer, unless the layout and the tail of the file are
+    known from an earlier read. A read which misses the cache then fetches the chunks of all the given columns of the
+    row group that holds it, merging nearby chunks, so that a row group costs a few concurrent requests instead of one
+    request per column chunk. Only the chunks of the last fetched row group are kept besides the footer.
+
+    Args:
+        blocksize: The size of the reads ahead of a file whose footer cannot be parsed.
+        fetcher: A function that fetches the bytes of a range of the file.
+        size: The size of the file in bytes.
+        fetch_ranges: A function that fetches the bytes of several ranges of the file concurrently.
+        layout: The layout of the file, if it is known from an earlier read of its footer.
+        footer: The tail of the file that holds the footer, as its offset and bytes, if it is known from an earlier
+            read. It is used only along with the layout.
+        columns: The names of the columns that are going to be read. All columns by default.
+        on_layout: A function that is called with the layout and the tail of the file once its footer is read.
+    """
+
+    name = "parquet_ranges"
+
+    def __init__(
+        self,
+        blocksize: int,
+        fetcher: Callable[[int, int], bytes],
+        size: int,
+        fetch_ranges: Callable[[List[Tuple[int, int]]], List[bytes]],
+        layout: Optional[ParquetLayout] = None,
+        footer: Optional[Tuple[int, bytes]] = None,
+        columns: Optional[List[str]] = None,
+        on_layout: Optional[Callable[[ParquetLayout, Tuple[int, bytes]], None]] = None,
+    ) -> None:
+        super().__init__(blocksize, fetcher, size)
+        self._fetch_ranges = fetch_ranges
+        self.layout = layout
+        self._columns = columns
+        self._on_layout = on_layout
+        self._footer = footer if layout is not None else None
+        self._parts: List[Tuple[int, bytes]] = []
+
+    def _fetch(self, start: Optional[int], stop: Optional[int]) -> bytes:
+        start = start or 0
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return b""
+        data = self._read_parts(start, stop)
+        if data is None:
+            self._fetch_parts(start, stop)
+            data = self._read_parts(start, stop)
+        # The fetched ranges hold the read unless the server ignored them.
+        return data if data is not None else self.fetcher(start, stop)
+
+    def _read_parts(self, start: int, stop: int) -> Optional[bytes]:
+        """Read a range from the fetched part that holds it, if any."""
+        parts = self._parts + ([self._footer] if self._footer else [])
+        for offset, data in parts:
+            if offset <= start and stop <= offset + len(data):
+                return data[start - offset : stop - offset]
+        return None
+
+    def _fetch_parts(self, start: int, stop: int) -> None:
+        """Fetch the parts that are read with the given range: the footer, or the row group that holds it."""
+        if self.layout is None:
+            if self._footer is None:
+                self._fetch_footer()
+                if self._read_parts(start, stop) is not None:
+                    return
+        elif stop > self.layout.footer_start:
+            # Parquet readers read the footer with a tail of the file, which is fetched alone.
+            tail_start = min(start, self.layout.footer_start)
+            self._footer = (tail_start, self.fetcher(tail_start, self.size))
+            if self._on_layout is not None:
+                self._on_layout(self.layout, self._footer)
+            return
+
+        if self.layout is None:
+            # The file is read ahead by a block, as by default, if its footer cannot be parsed.
+            ranges = [(start, min(self.size, max(stop, start + self.blocksize)))]
+        else:
+            ranges = [(start, stop)] + self.layout.row_group_ranges(start, self._columns)
+        blocks = coalesce_ranges(ranges)
+        self._parts = [(s, data) for (s, e), data in zip(blocks, self._fetch_ranges(blocks)) if len(data) == e - s]
+
+    def _fetch_footer(self) -> None:
+        """Fetch the tail of the file and parse the layout from its footer."""
+        tail_start = max(0, self.size - _FOOTER_SAMPLE_BYTES)
+        tail = self.fetcher(tail_start, self.size)
+        if len(tail) >= _FOOTER_SUFFIX_BYTES and tail[-len(_PARQUET_MAGIC) :] == _PARQUET_MAGIC:
+            footer_start = self.size - _FOOTER_SUFFIX_BYTES - int.from_bytes(tail[-8:-4], "little")
+            if 0 <= footer_start < tail_start:
+                tail = self.fetcher(footer_start, tail_start) + tail
+                tail_start = footer_start
+            if footer_start >= 0:
+                self.layout = parse_layout(tail[footer_start - tail_start :], footer_start)
+        self._footer = (tail_start, tail)
+        if self.layout is not None and self._on_layout is not None:
+            self._on_layout(self.layout, self._footer)
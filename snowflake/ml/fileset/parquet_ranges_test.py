@@ -0,0 +1,141 @@
+import io
+from typing import Any, List, Optional, Tuple
+
+import fsspec
+import pyarrow as pa
+import pyarrow.parquet as pq
+from absl.testing import absltest
+from fsspec.implementations import memory
+
+from snowflake.ml.fileset import parquet_ranges
+
+
+class _BytesFile(fsspec.spec.AbstractBufferedFile):  # type: ignore[misc]
+    """A fsspec file of in-memory bytes, read through a parquet range cache that records the fetched ranges."""
+
+    def __init__(self, data: bytes, **kwargs: Any) -> None:
+        super().__init__(memory.MemoryFileSystem(), "file.parquet", mode="rb", size=len(data), cache_type="none")
+        self.data = data
+        self.fetched: List[Tuple[int, int]] = []
+        self.fetched_batches: List[List[Tuple[int, int]]] = []
+        self.cache = parquet_ranges.ParquetRangeCache(
+            self.blocksize, self._fetch_range, self.size, fetch_ranges=self._fetch_ranges, **kwargs
+        )
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        self.fetched.append((start, end))
+        return self.data[start:end]
+
+    def _fetch_ranges(self, ranges: List[Tuple[int, int]]) -> List[bytes]:
+        self.fetched_batches.append(ranges)
+        return [self.data[start:end] for start, end in ranges]
+
+
+class ParquetRangesTest(absltest.TestCase):
+    """Testing the ranged reads of parquet files."""
+
+    def setUp(self) -> None:
+        # Columns of incompressible values, so that the chunks of the unread column are wide gaps.
+        self.table = pa.table(
+            {
+                name: pa.array([bytes([i % 256]) * 10000 for i in range(400)], pa.binary())
+                for name in ["col1", "col2", "col3"]
+            }
+        )
+        buffer = io.BytesIO()
+        pq.write_table(self.table, buffer, row_group_size=200, compression="none", use_dictionary=False)
+        self.data = buffer.getvalue()
+
+    def _read(self, f: _BytesFile, columns: Optional[List[str]] = None) -> pa.Table:
+        parquet_file = pq.ParquetFile(f)
+        return pa.concat_tables(
+            parquet_file.read_row_group(i, columns=columns) for i in range(parquet_file.num_row_groups)
+        )
+
+    def test_coalesce_ranges(self) -> None:
+        """Test if the ranges that overlap, or are close up to a block size, are merged."""
+        self.assertListEqual(
+            parquet_ranges.coalesce_ranges([(30, 40), (0, 10), (5, 12), (15, 20)], max_gap=3, max_block=100),
+            [(0, 20), (30, 40)],
+        )
+        self.assertListEqual(
+            parquet_ranges.coalesce_ranges([(0, 10), (12, 20), (22, 30)], max_gap=3, max_block=25),
+            [(0, 20), (22, 30)],
+        )
+        self.assertListEqual(
+            parquet_ranges.coalesce_ranges([(0, 50), (40, 60)], max_gap=0, max_block=10),
+            [(0, 60)],
+        )
+
+    def test_parse_layout(self) -> None:
+        """Test if the layout is parsed from the footer alone."""
+        footer_start = len(self.data) - 8 - int.from_bytes(self.data[-8:-4], "little")
+        layout = parquet_ranges.parse_layout(self.data[footer_start:], footer_start)
+        assert layout is not None
+        self.assertEqual(layout.footer_start, footer_start)
+        self.assertListEqual(layout.columns, ["col1", "col2", "col3"])
+        metadata = pq.read_metadata(pa.BufferReader(self.data))
+        self.assertLen(layout.row_groups, metadata.num_row_groups)
+        for i, chunks in enumerate(layout.row_groups):
+            for j, (start, end) in enumerate(chunks):
+                column = metadata.row_group(i).column(j)
+                self.assertEqual(start, column.data_page_offset)
+                self.assertEqual(end - start, column.total_compressed_size)
+
+        col3 = layout.row_groups[1][2]
+        self.assertListEqual(layout.row_group_ranges(col3[0], ["col3"]), [col3])
+        self.assertListEqual(layout.row_group_ranges(col3[0]), layout.row_groups[1])
+        self.assertListEqual(layout.row_group_ranges(footer_start), [])
+
+        self.assertIsNone(parquet_ranges.parse_layout(b"not a parquet footer", 0))
+
+    def test_read_row_groups(self) -> None:
+        """Test if a row group is fetched by one batch of ranges of the read columns, after one read of the footer."""
+        for columns in [None, ["col1", "col3"]]:
+            with self.subTest(columns=columns):
+                f = _BytesFile(self.data, columns=columns)
+                self.assertTrue(self._read(f, columns).equals(self.table.select(columns or self.table.column_names)))
+                # The footer is fetched once, and then each row group is fetched once.
+                self.assertLen(f.fetched, 1)
+                self.assertLen(f.fetched_batches, 2)
+                # The adjacent chunks are merged, and the chunks around a gap are fetched by concurrent requests.
+                for ranges in f.fetched_batches:
+                    self.assertLen(ranges, 1 if columns is None else 2)
+                fetched_bytes = sum(end - start for ranges in f.fetched_batches for start, end in ranges)
+                self.assertLess(fetched_bytes, len(self.data) * (1 if columns is None else 0.7))
+
+    def test_read_known_layout(self) -> None:
+        """Test if the footer is not fetched again if the layout of the file is known from an earlier read."""
+        layouts: List[Tuple[parquet_ranges.ParquetLayout, Tuple[int, bytes]]] = []
+        f = _BytesFile(self.data, on_layout=lambda layout, footer: layouts.append((layout, footer)))
+        pq.read_metadata(f)
+        self.assertLen(layouts, 1)
+        layout, footer = layouts[0]
+        self.assertEqual(footer[1], self.data[footer[0] :])
+
+        f = _BytesFile(self.data, layout=layout, columns=["col2"])
+        table = pq.ParquetFile(f, metadata=pq.read_metadata(pa.BufferReader(self.data))).read_row_group(1, ["col2"])
+        self.assertTrue(table.equals(self.table.select(["col2"]).slice(200, 200)))
+        self.assertListEqual(f.fetched, [])
+        self.assertListEqual(f.fetched_batches, [[layout.row_groups[1][1]]])
+
+        # The footer is read from the known tail of the file, without any request.
+        f = _BytesFile(self.data, layout=layout, footer=footer, columns=["col2"])
+        table = pq.ParquetFile(f).read_row_group(0, ["col2"])
+        self.assertTrue(table.equals(self.table.select(["col2"]).slice(0, 200)))
+        self.assertListEqual(f.fetched, [])
+        self.assertListEqual(f.fetched_batches, [[layout.row_groups[0][1]]])
+
+    def test_read_not_parquet(self) -> None:
+        """Test if a file which is not parquet is read as is."""
+        data = bytes(range(256)) * 1000
+        f = _BytesFile(data)
+        self.assertEqual(f.read(100), data[:100])
+        f.seek(len(data) - 10)
+        self.assertEqual(f.read(), data[-10:])
+        f.seek(1000)
+        self.assertEqual(f.read(5000), data[1000:6000])
+
+
+if __name__ == "__main__":
+    absltest.main()
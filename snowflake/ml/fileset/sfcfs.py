@@ -70,6 +70,8 @@ class SFFileSystem(fsspec.AbstractFileSystem):
                 - skip_instance_cache: Int. Controls reuse of instances.
                 - cache_type, cache_options, block_size: Configure file buffering.
                 See more information of these options in https://filesystem-spec.readthedocs.io/en/latest/features.html
+                - local_cache_dir, local_cache_size: Configure the local disk cache of stage files. See
+                `SFStageFileSystem`.
 
         Raises:
             ValueError: An error occurred when not exactly one of sf_connection and snowpark_session is given.
@@ -138,6 +140,24 @@ class SFFileSystem(fsspec.AbstractFileSystem):
         stage_path_list = cast(List[Dict[str, Any]], stage_path_list)
         return self._decorate_ls_res(stage_fs, stage_path_list, detail)
 
+    def add_file_info(self, files: List[Dict[str, Any]]) -> None:
+        """Add the details of stage files that are known without listing them, e.g. from a manifest.
+
+        Args:
+            files: A list of dict of file properties, as returned by `ls` with `detail` set. Each dict contains at
+                least "name" and "size", and optionally "md5". The names are in the format of
+                "@{database}.{schema}.{stage}/{path}".
+        """
+        stage_files: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = collections.defaultdict(list)
+        for file in files:
+            file_path = _parse_sfc_file_path(file["name"])
+            stage_files[(file_path.database, file_path.schema, file_path.stage)].append(
+                dict(file, name=file_path.filepath)
+            )
+        for k, v in stage_files.items():
+            stage_fs = self._get_stage_fs(_SFFilePath(k[0], k[1], k[2], "*"))
+            stage_fs.add_file_info(v)
+
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
         conn_attr_name="_conn",
@@ -146,8 +166,8 @@ class SFFileSystem(fsspec.AbstractFileSystem):
     def optimize_read(self, files: Optional[List[str]] = None) -> None:
         """Prefetch and cache the presigned urls for all the given files to speed up the file opening.
 
-        All the files introduced here will have their urls cached. Further open() on any of cached urls will lead to a
-        batch refreshment of the cached urls in the same stage if that url is inactive.
+        All the files introduced here will have their urls cached. Further open() on any file will refresh the cached
+        urls in the same stage that are about to expire in background, in batches of bounded size.
 
         Args:
             files: A list of file paths that needs their presigned url cached.
@@ -198,6 +198,28 @@ class SFFileSystemTest(absltest.TestCase):
             instance1.optimize_read.assert_any_call(["nytrain/a", "nytrain/b"])
             instance2.optimize_read.assert_any_call(["nytrain/c"])
 
+    def test_add_file_info(self) -> None:
+        """Test if add_file_info() can pass the file details on to the correct stage filesystems."""
+        with absltest.mock.patch(
+            "snowflake.ml.fileset.stage_fs.SFStageFileSystem", autospec=True
+        ) as MockSFStageFileSystem:
+            instance1 = absltest.mock.MagicMock()
+            instance2 = absltest.mock.MagicMock()
+            MockSFStageFileSystem.side_effect = [instance1, instance2]
+            sffs = sfcfs.SFFileSystem(self.mock_connection)
+
+            sffs.add_file_info(
+                [
+                    {"name": "@testdb.testschema.foo/nytrain/a", "size": 1, "md5": "a"},
+                    {"name": "@testdb.testschema.bar/nytrain/c", "size": 3, "md5": "c"},
+                    {"name": "@testdb.testschema.foo/nytrain/b", "size": 2, "md5": "b"},
+                ]
+            )
+            instance1.add_file_info.assert_called_once_with(
+                [{"name": "nytrain/a", "size": 1, "md5": "a"}, {"name": "nytrain/b", "size": 2, "md5": "b"}]
+            )
+            instance2.add_file_info.assert_called_once_with([{"name": "nytrain/c", "size": 3, "md5": "c"}])
+
     def test_open(self) -> None:
         """Test if 'open' is able to parse the input and call the underlying file system to open files."""
         with absltest.mock.patch(
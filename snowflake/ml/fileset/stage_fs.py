@@ -1,8 +1,13 @@
+import collections
 import inspect
+import itertools
 import logging
+import math
+import shutil
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 import fsspec
 from fsspec.implementations import http as httpfs
@@ -16,18 +21,46 @@ from snowflake.ml._internal.exceptions import (
     fileset_error_messages,
     fileset_errors,
 )
+from snowflake.ml.fileset import local_cache, parquet_ranges
 from snowflake.snowpark import exceptions as snowpark_exceptions
 
 # The default length of how long a presigned url stays active in seconds.
 # Presigned url here is used to fetch file objects from Snowflake when SFStageFileSystem.open() is called.
 _PRESIGNED_URL_LIFETIME_SEC = 14400
 
-# The threshold of when the presigned url should get refreshed before its expiration.
+# The threshold of when the presigned url should get refreshed in background before its expiration.
 _PRESIGNED_URL_HEADROOM_SEC = 3600
 
+# The threshold of when the presigned url must be refreshed before a file is opened with it.
+_PRESIGNED_URL_MIN_LIFETIME_SEC = 1800
+
+# The max number of presigned urls that are fetched by one query.
+_PRESIGNED_URL_BATCH_SIZE = 1000
+
+# The delay before the background refresh of presigned urls is retried after a failure.
+_PRESIGNED_URL_REFRESH_RETRY_SEC = 60
+
+# The default ceiling of the total size of the stage files cached on local disk.
+_DEFAULT_LOCAL_CACHE_SIZE = 10 * 2**30
+
+# The size of the chunks in which a stage file is copied into the local cache.
+_LOCAL_CACHE_COPY_BUFFER_SIZE = 8 * 2**20
+
+# The number of parquet files whose layouts and footers are kept after their footers are read, so that reopening a file
+# to read another row group does not fetch its footer again.
+_PARQUET_LAYOUT_CACHE_SIZE = 1000
+
+# The ceiling of the total size of the kept footers, which are usually the 64KB tails of the files.
+_PARQUET_FOOTER_CACHE_BYTES = 64 * 2**20
+
+# The suffix of the parquet files that are read through their footers.
+_PARQUET_FILE_SUFFIX = ".parquet"
 
 _PROJECT = "FileSet"
 
+# The layout of a parquet file, and the offset and the bytes of the tail of the file that holds its footer.
+_ParquetLayoutAndFooter = Tuple[parquet_ranges.ParquetLayout, Tuple[int, bytes]]
+
 
 @dataclass(frozen=True)
 class _PresignedUrl:
@@ -83,6 +116,8 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
         stage: str,
         snowpark_session: Optional[snowpark.Session] = None,
         sf_connection: Optional[connection.SnowflakeConnection] = None,
+        local_cache_dir: Optional[str] = None,
+        local_cache_size: int = _DEFAULT_LOCAL_CACHE_SIZE,
         **kwargs: Any,
     ) -> None:
         """Initiate the file system with stage information and a snowflake connection.
@@ -93,6 +128,11 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
             stage: The name of the target stage.
             snowpark_session: A Snowpark session object. Mutually exclusive to `sf_connection`.
             sf_connection: A Snowflake python connection object. Mutually exclusive to `snowpark_session`.
+            local_cache_dir: Optional. A local directory where the files listed by `ls` are cached when they are
+                opened, keyed by their stage path and MD5, so that they are downloaded once across epochs and
+                processes. It can be shared by concurrent processes. The cache is disabled if not set.
+            local_cache_size: The ceiling of the total size in bytes of the files in `local_cache_dir`. The least
+                recently used files are evicted when it is exceeded.
             **kwargs : Optional. Other parameters that can be passed on to fsspec. Currently supports:
                 - skip_instance_cache: Int. Controls reuse of instances.
                 - cache_type, cache_options, block_size: Configure file buffering.
@@ -115,9 +155,22 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
         self._schema = schema
         self._stage = stage
         self._url_cache: Dict[str, _PresignedUrl] = {}
+        # Guards the url cache and the refresh state, which are shared with the background refresh thread.
+        self._url_lock = threading.Lock()
+        self._url_refresh_at = math.inf
+        self._url_refresh_thread: Optional[threading.Thread] = None
+        self._local_cache = local_cache.LocalFileCache(local_cache_dir, local_cache_size) if local_cache_dir else None
+        # The details of the files that have been listed or added, in the order of listing.
+        self._file_info: Dict[str, Dict[str, Any]] = {}
+        # The layouts and the footers of the recently opened parquet files, shared by the threads that open them.
+        self._parquet_layouts: "collections.OrderedDict[str, _ParquetLayoutAndFooter]" = collections.OrderedDict()
+        self._parquet_footer_bytes = 0
+        self._parquet_layout_lock = threading.Lock()
 
         httpfs_kwargs = _get_httpfs_kwargs(**kwargs)
         self._fs = httpfs.HTTPFileSystem(**httpfs_kwargs)
+        # Parquet files are read through their footers unless the buffering of files is configured.
+        self._read_parquet_ranges = "cache_type" not in httpfs_kwargs
 
         super().__init__(**kwargs)
 
@@ -173,11 +226,25 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
                     original_exception=fileset_errors.FileSetError(str(e)),
                 )
         files = self._parse_list_result(objects, path)
+        self.add_file_info([f for f in files if f["type"] == "file"])
         if detail:
             return files
         else:
             return [f["name"] for f in files]
 
+    def add_file_info(self, files: List[Dict[str, Any]]) -> None:
+        """Add the details of stage files that are known without listing them, e.g. from a manifest.
+
+        The files are opened as if they were listed by `ls`: their sizes spare a request to probe them, and their MD5
+        keys them in the local cache.
+
+        Args:
+            files: A list of dict of file properties, as returned by `ls` with `detail` set. Each dict contains at
+                least "name" and "size", and optionally "md5".
+        """
+        for f in files:
+            self._file_info[f["name"].lstrip("/")] = f
+
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
     )
@@ -185,38 +252,41 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
     def optimize_read(self, files: Optional[List[str]] = None) -> None:
         """Prefetch and cache the presigned urls for all the given files to speed up the read performance.
 
-        All the files introduced here will have their urls cached. Further open() on any of cached urls will lead to a
-        batch refreshment of all the cached urls if that url is inactive.
+        All the files introduced here will have their urls cached. Further open() on any file will refresh the cached
+        urls that are about to expire in background, in batches of bounded size.
 
         Args:
             files: A list of file paths. If not given, all the files that have urls cached will refresh their url cache.
         """
         if not files:
-            files = list(self._url_cache.keys())
-        url_lifetime = _PRESIGNED_URL_LIFETIME_SEC
-        start_time = time.time()
+            with self._url_lock:
+                files = list(self._url_cache.keys())
         logging.info(f"Start batch fetching presigned urls for {self.stage_name}.")
-        presigned_urls = self._fetch_presigned_urls(files, url_lifetime)
-        expire_at = start_time + url_lifetime
-
-        for presigned_url in presigned_urls:
-            file_path, url = presigned_url
-            self._url_cache[file_path] = _PresignedUrl(url, expire_at)
-            logging.debug(f"Retrieved presigned url for {file_path}.")
+        for i in range(0, len(files), _PRESIGNED_URL_BATCH_SIZE):
+            self._fetch_and_cache_presigned_urls(files[i : i + _PRESIGNED_URL_BATCH_SIZE])
         logging.info(f"Finished batch fetching presigned urls for {self.stage_name}.")
 
     @telemetry.send_api_usage_telemetry(
         project=_PROJECT,
     )
     @snowpark._internal.utils.private_preview(version="0.2.0")
-    def _open(self, path: str, mode: str = "rb", **kwargs: Any) -> fsspec.spec.AbstractBufferedFile:
+    def _open(
+        self, path: str, mode: str = "rb", columns: Optional[List[str]] = None, **kwargs: Any
+    ) -> fsspec.spec.AbstractBufferedFile:
         """Override fsspec `_open` method. Open a file for reading.
 
-        The opened file will be readable for 4 hours. After that, you need to reopen the file.
+        The opened file will be readable for at least 30 minutes. After that, you need to reopen the file. If the local
+        cache is enabled, a file listed by `ls` is opened from the cache, and downloaded into it first if it is not
+        cached.
+
+        A parquet file is read through its footer: a read of a row group fetches the chunks of its columns by a few
+        concurrent requests, merging nearby chunks, instead of fetching them one after another.
 
         Args:
             path: Path of file in Snowflake stage.
             mode: One of 'r', 'rb'. These have the same meaning as they do for the built-in `open` function.
+            columns: Optional. The names of the columns that are going to be read from a parquet file, so that only
+                their chunks are fetched with a row group. All columns are fetched by default.
             **kwargs: Extra options that supported by fsspec. See more in
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.open
 
@@ -225,27 +295,179 @@ class SFStageFileSystem(fsspec.AbstractFileSystem):
 
         Raises:
             SnowflakeMLException: An error occurred when the given path points to a file that cannot be found.
+
+        # noqa: DAR402
         """
         path = path.lstrip("/")
-        cached_presigned_url = self._url_cache.get(path, None)
-        if not cached_presigned_url:
-            res = self._fetch_presigned_urls([path])
-            url = res[0][1]
-            expire_at = time.time() + _PRESIGNED_URL_LIFETIME_SEC
-            cached_presigned_url = _PresignedUrl(url, expire_at)
-            self._url_cache[path] = cached_presigned_url
-            logging.debug(f"Retrieved presigned url for {path}.")
-        elif cached_presigned_url.is_expiring():
-            self.optimize_read()
-            cached_presigned_url = self._url_cache[path]
-        url = cached_presigned_url.url
+        md5 = self._file_info.get(path, {}).get("md5", None)
+        if self._local_cache and md5 and mode == "rb":
+            key = local_cache.LocalFileCache.key(self.stage_name, path, md5)
+            return self._local_cache.open(key, lambda f: self._download(path, f, **kwargs))
+        return self._open_remote(path, mode=mode, columns=columns, **kwargs)
+
+    def _download(self, path: str, f: IO[bytes], **kwargs: Any) -> None:
+        """Download a stage file into a binary file object."""
+        # The file is streamed by one request, as it is read from start to end.
+        with self._open_remote(path, mode="rb", **dict(kwargs, block_size=0)) as remote_file:
+            shutil.copyfileobj(remote_file, f, _LOCAL_CACHE_COPY_BUFFER_SIZE)
+
+    def _open_remote(
+        self, path: str, mode: str = "rb", columns: Optional[List[str]] = None, **kwargs: Any
+    ) -> fsspec.spec.AbstractBufferedFile:
+        """Open a stage file through its presigned url.
+
+        Args:
+            path: Path of file in Snowflake stage.
+            mode: One of 'r', 'rb'.
+            columns: The names of the columns that are going to be read from a parquet file.
+            **kwargs: Extra options that supported by fsspec.
+
+        Returns:
+            A fsspec file-like object.
+
+        Raises:
+            SnowflakeMLException: An error occurred when the given path points to a file that cannot be found.
+        """
+        url = self._get_presigned_url(path)
+        size = self._file_info.get(path, {}).get("size", None)
+        if size and "size" not in kwargs:
+            # A known size spares the request that probes the size of the file.
+            kwargs["size"] = size
+        read_ranges = (
+            self._read_parquet_ranges
+            and mode == "rb"
+            and path.endswith(_PARQUET_FILE_SUFFIX)
+            and kwargs.get("cache_type", None) is None
+        )
+        if read_ranges:
+            # The cache of the file is replaced once it is opened.
+            kwargs["cache_type"] = "none"
         try:
-            return self._fs._open(url, mode=mode, **kwargs)
+            f = self._fs._open(url, mode=mode, **kwargs)
         except FileNotFoundError:
             raise snowml_exceptions.SnowflakeMLException(
                 error_code=error_codes.SNOWML_NOT_FOUND,
                 original_exception=fileset_errors.StageFileNotFoundError(f"Stage file {path} doesn't exist."),
             )
+        if read_ranges and isinstance(f, httpfs.HTTPFile):
+            with self._parquet_layout_lock:
+                layout, footer = self._parquet_layouts.get(path, (None, None))
+            f.cache = parquet_ranges.ParquetRangeCache(
+                f.blocksize,
+                f._fetch_range,
+                f.size,
+                fetch_ranges=lambda ranges: self._fetch_ranges(url, ranges),
+                layout=layout,
+                footer=footer,
+                columns=columns,
+                on_layout=lambda layout, footer: self._cache_parquet_layout(path, layout, footer),
+            )
+        return f
+
+    def _fetch_ranges(self, url: str, ranges: List[Tuple[int, int]]) -> List[bytes]:
+        """Fetch byte ranges of a presigned url by concurrent requests."""
+        results = self._fs.cat_ranges([url] * len(ranges), [s for s, _ in ranges], [e for _, e in ranges])
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return cast(List[bytes], results)
+
+    def _cache_parquet_layout(self, path: str, layout: parquet_ranges.ParquetLayout, footer: Tuple[int, bytes]) -> None:
+        """Keep the layout and the footer of a parquet file, evicting the earliest kept ones if they are too many."""
+        with self._parquet_layout_lock:
+            if path in self._parquet_layouts:
+                self._parquet_footer_bytes -= len(self._parquet_layouts.pop(path)[1][1])
+            self._parquet_layouts[path] = (layout, footer)
+            self._parquet_footer_bytes += len(footer[1])
+            while (
+                len(self._parquet_layouts) > _PARQUET_LAYOUT_CACHE_SIZE
+                or self._parquet_footer_bytes > _PARQUET_FOOTER_CACHE_BYTES
+            ):
+                self._parquet_footer_bytes -= len(self._parquet_layouts.popitem(last=False)[1][1][1])
+
+    def _get_presigned_url(self, path: str) -> str:
+        """Get the presigned url of a file to open it.
+
+        The url is fetched synchronously only if it is not cached or it is about to expire. In that case, the same query
+        also fetches the urls of other listed files that are not cached yet, and of other cached urls that are
+        expiring, up to a bounded batch size. Otherwise, the cached urls that are entering their expiry headroom are
+        refreshed in background, so that opening a file never waits for a refresh of the whole url cache.
+
+        Args:
+            path: Path of file in Snowflake stage.
+
+        Returns:
+            The presigned url of the file.
+        """
+        with self._url_lock:
+            cached_presigned_url = self._url_cache.get(path, None)
+            if cached_presigned_url and not cached_presigned_url.is_expiring(_PRESIGNED_URL_MIN_LIFETIME_SEC):
+                if time.time() > self._url_refresh_at:
+                    self._start_presigned_url_refresh()
+                return cached_presigned_url.url
+            uncached_files = (f for f in self._file_info if f not in self._url_cache)
+            expiring_files = (f for f, u in self._url_cache.items() if u.is_expiring())
+            other_files = (f for f in itertools.chain(uncached_files, expiring_files) if f != path)
+            files = [path] + list(itertools.islice(other_files, _PRESIGNED_URL_BATCH_SIZE - 1))
+
+        self._fetch_and_cache_presigned_urls(files)
+        with self._url_lock:
+            return self._url_cache[path].url
+
+    def _fetch_and_cache_presigned_urls(self, files: List[str]) -> None:
+        """Fetch the presigned urls of the given files by one query and cache them."""
+        start_time = time.time()
+        presigned_urls = self._fetch_presigned_urls(files, _PRESIGNED_URL_LIFETIME_SEC)
+        expire_at = start_time + _PRESIGNED_URL_LIFETIME_SEC
+        with self._url_lock:
+            for file_path, url in presigned_urls:
+                self._url_cache[file_path] = _PresignedUrl(url, expire_at)
+                logging.debug(f"Retrieved presigned url for {file_path}.")
+            self._url_refresh_at = min(self._url_refresh_at, expire_at - _PRESIGNED_URL_HEADROOM_SEC)
+
+    def _start_presigned_url_refresh(self) -> None:
+        """Start refreshing the expiring presigned urls in a background thread, if it is not running.
+
+        It must be called while holding `_url_lock`.
+        """
+        if self._url_refresh_thread and self._url_refresh_thread.is_alive():
+            return
+        self._url_refresh_thread = threading.Thread(target=self._refresh_presigned_urls, daemon=True)
+        self._url_refresh_thread.start()
+
+    def _refresh_presigned_urls(self) -> None:
+        """Refresh the expiring presigned urls in batches, starting from the earliest expiring ones."""
+        logging.info(f"Start refreshing presigned urls for {self.stage_name} in background.")
+        # The files that the refresh has fetched, so that the files which are gone from the stage are not retried.
+        refreshed_files: Set[str] = set()
+        try:
+            while True:
+                with self._url_lock:
+                    expiring_urls = sorted(
+                        (presigned_url.expire_at, path)
+                        for path, presigned_url in self._url_cache.items()
+                        if path not in refreshed_files and presigned_url.is_expiring()
+                    )
+                    if not expiring_urls:
+                        self._url_refresh_at = min(
+                            (
+                                u.expire_at - _PRESIGNED_URL_HEADROOM_SEC
+                                for u in self._url_cache.values()
+                                if not u.is_expiring()
+                            ),
+                            default=math.inf,
+                        )
+                        break
+                files = [path for _, path in expiring_urls[:_PRESIGNED_URL_BATCH_SIZE]]
+                self._fetch_and_cache_presigned_urls(files)
+                refreshed_files.update(files)
+        except Exception as e:
+            # The urls are still refreshed synchronously when they are opened if they are about to expire.
+            logging.warning(f"Failed to refresh presigned urls for {self.stage_name} in background: {e}")
+            with self._url_lock:
+                self._url_refresh_at = time.time() + _PRESIGNED_URL_REFRESH_RETRY_SEC
+            return
+        logging.info(f"Finished refreshing presigned urls for {self.stage_name} in background.")
 
     def _parse_list_result(
         self, list_result: List[Tuple[str, int, str, str]], search_path: str
@@ -1,7 +1,13 @@
+import io
 import os
-from typing import Dict, List, cast
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, cast
 
 import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from absl.testing import absltest
 from moto import server
@@ -9,7 +15,7 @@ from moto import server
 from snowflake import snowpark
 from snowflake.connector import connection
 from snowflake.ml.fileset import stage_fs
-from snowflake.ml.test_utils import mock_data_frame, mock_session
+from snowflake.ml.test_utils import mock_data_frame, mock_session, range_request_server
 
 
 class SFStageFileSystemTest(absltest.TestCase):
@@ -82,7 +88,9 @@ class SFStageFileSystemTest(absltest.TestCase):
         res = []
         for file in self.file_list:
             if file.startswith(prefix):
-                res.append(snowpark.Row(name=f"{self.stage}/{file}", size=10, md5="xx", last_modified="00"))
+                res.append(
+                    snowpark.Row(name=f"{self.stage}/{file}", size=len(self.content), md5="xx", last_modified="00")
+                )
         return mock_data_frame.MockDataFrame(collect_result=res)
 
     def _add_mock_test_case(self, prefix: str) -> None:
@@ -229,6 +237,158 @@ class SFStageFileSystemTest(absltest.TestCase):
             self.assertEqual(fp.read(), self.content)
             self.mock_time.return_value = 1
 
+    def test_open_added_file_info(self) -> None:
+        """Test if open() uses the added sizes of files instead of probing them."""
+        with absltest.mock.patch.object(
+            stage_fs.SFStageFileSystem, "_fetch_presigned_urls", new=self._mock_presigned_url_fetcher
+        ):
+            stagefs = self._create_new_stagefs()
+            stagefs.add_file_info(
+                [{"name": file, "size": len(self.content), "type": "file", "md5": "xx"} for file in self.file_list]
+            )
+            with absltest.mock.patch.object(stagefs._fs, "info") as mock_info:
+                for file in self.file_list:
+                    with stagefs.open(file) as fp:
+                        self.assertEqual(fp.read(), self.content)
+                mock_info.assert_not_called()
+
+    def test_open_background_refresh(self) -> None:
+        """Test if open() refreshes expiring presigned urls in background, in batches of bounded size."""
+        num_files = 10000
+        files = [f"data/file_{i}" for i in range(num_files)]
+        self.session.add_mock_sql(
+            query=f"LIST @{self.db}.{self.schema}.{self.stage}/data",
+            result=mock_data_frame.MockDataFrame(
+                collect_result=[
+                    snowpark.Row(name=f"{self.stage}/{file}", size=10, md5="xx", last_modified="00") for file in files
+                ]
+            ),
+        )
+        fetched_batches: Dict[str, List[int]] = {"foreground": [], "background": []}
+        background_fetch_started = threading.Event()
+        background_fetch_allowed = threading.Event()
+
+        def fetch_presigned_urls(files: List[str], lifetime: int = 0) -> List[Tuple[str, str]]:
+            if threading.current_thread() is threading.main_thread():
+                fetched_batches["foreground"].append(len(files))
+            else:
+                fetched_batches["background"].append(len(files))
+                background_fetch_started.set()
+                background_fetch_allowed.wait()
+            return [(file, f"https://test/{file}?t={time.time()}") for file in files]
+
+        stagefs = stage_fs.SFStageFileSystem(
+            db=self.db,
+            schema=self.schema,
+            stage=self.stage,
+            snowpark_session=cast(snowpark.Session, self.session),
+            skip_instance_cache=True,
+        )
+        with absltest.mock.patch.object(
+            stagefs, "_fetch_presigned_urls", side_effect=fetch_presigned_urls
+        ), absltest.mock.patch.object(stagefs._fs, "_open") as mock_open:
+            self.assertEqual(len(stagefs.ls("data")), num_files)
+
+            # Opening the listed files fetches their urls in batches.
+            for file in files:
+                stagefs.open(file)
+            self.assertListEqual(fetched_batches["foreground"], [stage_fs._PRESIGNED_URL_BATCH_SIZE] * 10)
+            self.assertEqual(mock_open.call_args.args[0], f"https://test/{files[-1]}?t=1")
+
+            # The urls enter their expiry headroom. Opening files does not wait for the refresh of the urls.
+            self.mock_time.return_value += (
+                stage_fs._PRESIGNED_URL_LIFETIME_SEC - stage_fs._PRESIGNED_URL_HEADROOM_SEC + 1
+            )
+            for file in files:
+                stagefs.open(file)
+            self.assertTrue(background_fetch_started.wait(timeout=10))
+            self.assertEqual(len(fetched_batches["foreground"]), 10)
+            self.assertEqual(len(fetched_batches["background"]), 1)
+            background_fetch_allowed.set()
+            stagefs._url_refresh_thread.join(timeout=10)
+            self.assertListEqual(fetched_batches["background"], [stage_fs._PRESIGNED_URL_BATCH_SIZE] * 10)
+            for presigned_url in stagefs._url_cache.values():
+                self.assertEqual(presigned_url.expire_at, self.mock_time.return_value + 14400)
+
+            # The urls expire while the background refresh is stalled. Opening a file whose url is about to expire
+            # fetches a bounded batch of urls.
+            self.mock_time.return_value += stage_fs._PRESIGNED_URL_LIFETIME_SEC
+            fetched_batches["foreground"].clear()
+            fetched_batches["background"].clear()
+            background_fetch_allowed.clear()
+            for file in files:
+                stagefs.open(file)
+            self.assertListEqual(fetched_batches["foreground"], [stage_fs._PRESIGNED_URL_BATCH_SIZE] * 10)
+            background_fetch_allowed.set()
+            stagefs._url_refresh_thread.join(timeout=10)
+            self.assertListEqual(fetched_batches["background"], [stage_fs._PRESIGNED_URL_BATCH_SIZE])
+        self.mock_time.return_value = 1
+
+    def test_open_local_cache(self) -> None:
+        """Test if open() reads the listed files from the local cache after they are downloaded once."""
+        with absltest.mock.patch.object(
+            stage_fs.SFStageFileSystem, "_fetch_presigned_urls", new=self._mock_presigned_url_fetcher
+        ), tempfile.TemporaryDirectory() as cache_dir:
+            stagefs = stage_fs.SFStageFileSystem(
+                db=self.db,
+                schema=self.schema,
+                stage=self.stage,
+                snowpark_session=cast(snowpark.Session, self.session),
+                local_cache_dir=cache_dir,
+            )
+            self._add_mock_test_case("")
+            self._add_mock_test_case(self.subdir)
+            self.assertListEqual(self.file_list, stagefs.find(""))
+
+            with absltest.mock.patch.object(stagefs, "_open_remote", wraps=stagefs._open_remote) as mock_open_remote:
+                for _ in range(2):
+                    for file in self.file_list:
+                        with stagefs.open(file) as fp:
+                            self.assertEqual(fp.read(), self.content)
+                self.assertEqual(mock_open_remote.call_count, len(self.file_list))
+            self.assertEqual(len(os.listdir(cache_dir)), len(self.file_list))
+
+    def test_open_parquet_ranges(self) -> None:
+        """Test if a projected read of a parquet file fetches the read chunks of a row group concurrently."""
+        # Incompressible columns of 2MB chunks, so that the chunks of the unread column are not fetched.
+        table = pa.table({name: pa.array([os.urandom(10000) for _ in range(400)]) for name in ["a", "b", "c"]})
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, row_group_size=200, compression="none", use_dictionary=False)
+        http_server = range_request_server.RangeRequestServer(buffer.getvalue())
+        threading.Thread(target=http_server.serve_forever, daemon=True).start()
+        self.addCleanup(http_server.server_close)
+        self.addCleanup(http_server.shutdown)
+
+        def mock_presigned_url_fetcher(files: List[str], lifetime: int = 0) -> List[Tuple[str, str]]:
+            return [(file, http_server.url) for file in files]
+
+        stagefs = stage_fs.SFStageFileSystem(
+            db=self.db,
+            schema=self.schema,
+            stage=self.stage,
+            snowpark_session=cast(snowpark.Session, self.session),
+            skip_instance_cache=True,
+        )
+        stagefs.add_file_info([{"name": "data.parquet", "size": len(http_server.content), "type": "file"}])
+        fetched: Dict[Optional[str], List[Tuple[int, int]]] = {}
+        max_num_pending: Dict[Optional[str], int] = {}
+        with absltest.mock.patch.object(stagefs, "_fetch_presigned_urls", new=mock_presigned_url_fetcher):
+            # The default buffering of files is the baseline.
+            for cache_type in [None, "bytes"]:
+                http_server.reset()
+                with stagefs.open("data.parquet", cache_type=cache_type, columns=["a", "c"]) as f:
+                    self.assertTrue(pq.ParquetFile(f).read(columns=["a", "c"]).equals(table.select(["a", "c"])))
+                fetched[cache_type] = http_server.ranges
+                max_num_pending[cache_type] = http_server.max_num_pending
+
+        # One request reads the footer, and then the 2 read chunks of each row group are fetched at once.
+        self.assertLen(fetched[None], 5)
+        self.assertEqual(max_num_pending[None], 2)
+        self.assertEqual(max_num_pending["bytes"], 1)
+        fetched_bytes = {k: sum(end - start for start, end in ranges) for k, ranges in fetched.items()}
+        self.assertLess(fetched_bytes[None], len(http_server.content) * 0.7)
+        self.assertLess(fetched_bytes[None], fetched_bytes["bytes"])
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, List, Union
 
 import fsspec
 import numpy.typing as npt
@@ -12,6 +12,20 @@ from snowflake.ml._internal.exceptions import (
 )
 from snowflake.ml.fileset import parquet_parser
 
+# The number of files that are read concurrently. The parallelism of their reads is autotuned by tf.data.
+_INTERLEAVE_CYCLE_LENGTH = 4
+
+# The minimum row count of the batches crossing from Python to tf.data, which rebatches them in C++, so that
+# the per-element overhead of the Python generators is amortized over many rows.
+_GENERATOR_BATCH_SIZE = 65536
+
+# With shuffle, the interleaved rows are cut into slices of this fraction of a batch, which are shuffled in a buffer
+# before they are rebatched, so that each batch mixes the rows of several files.
+_SHUFFLE_SLICES_PER_BATCH = 8
+
+# The number of rows in the shuffle buffer of the slices, which holds a generator batch of each interleaved file.
+_SHUFFLE_BUFFER_ROWS = _INTERLEAVE_CYCLE_LENGTH * _GENERATOR_BATCH_SIZE
+
 
 def read_and_parse_parquet(
     files: List[str],
@@ -22,6 +36,12 @@ def read_and_parse_parquet(
 ) -> tf.data.Dataset:
     """Creates a tf.data.Dataset that reads given parquet files into batched Tensors.
 
+    The files are read through a parallel interleave with autotuned parallelism, so that several files are read and
+    parsed concurrently, and the batches of the files are rebatched to `batch_size` rows. Without shuffle, the batches
+    of concurrently read files alternate in a deterministic order. With shuffle, the interleaved rows are cut into
+    slices of a fraction of `batch_size` rows, which are shuffled in a buffer that holds rows of every concurrently
+    read file before they are rebatched, so that each batch mixes rows of several files.
+
     Args:
         files: A list of input parquet file URIs to read and parse. The parquet files should
             have the same schema.
@@ -29,8 +49,9 @@ def read_and_parse_parquet(
         batch_size: Specifies the size of each batch that will be yield. It is preferred to
             set it to your training batch size, and avoid using dataset.{batch(),rebatch()} later.
         shuffle: Whether the data in the file will be shuffled. If set to be true, it will first randomly shuffle
-            the order of files, and then shuflle the order of rows in each file. It is preferred
-            to shuffle the data this way than dataset.unbatch().shuffle().rebatch().
+            the order of files, and then shuffle the rows of each file, and shuffle slices of the rows of several
+            files.
+            It is preferred to shuffle the data this way than dataset.unbatch().shuffle().rebatch().
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
             get dropped if its size is smaller than the given batch_size.
 
@@ -59,10 +80,41 @@ def read_and_parse_parquet(
             original_exception=ValueError("At least one file is needed to create a TF dataset."),
         )
 
-    def generator() -> Generator[Dict[str, npt.NDArray[Any]], None, None]:
-        yield from parquet_parser.ParquetParser(list(files), filesystem, batch_size, shuffle, drop_last_batch)
+    output_signature = _derive_signature(files[0], filesystem)
+
+    def generator(file: Union[bytes, str]) -> Generator[Dict[str, npt.NDArray[Any]], None, None]:
+        if isinstance(file, bytes):
+            file = file.decode()
+        # The last batch of each file is kept, and merged with the batches of other files by the rebatch below.
+        yield from parquet_parser.ParquetParser(
+            [file], filesystem, max(batch_size, _GENERATOR_BATCH_SIZE), shuffle, drop_last_batch=False
+        )
+
+    def read_file(file: tf.Tensor) -> tf.data.Dataset:
+        return tf.data.Dataset.from_generator(generator, args=(file,), output_signature=output_signature)
+
+    files_dataset = tf.data.Dataset.from_tensor_slices(list(files))
+    if shuffle:
+        files_dataset = files_dataset.shuffle(len(files), reshuffle_each_iteration=True)
+    dataset = files_dataset.interleave(
+        read_file,
+        cycle_length=min(len(files), _INTERLEAVE_CYCLE_LENGTH),
+        num_parallel_calls=tf.data.AUTOTUNE,
+        deterministic=not shuffle,
+    )
+    if shuffle:
+        slice_size = max(batch_size // _SHUFFLE_SLICES_PER_BATCH, 1)
+        dataset = _rebatch(dataset, slice_size, drop_remainder=False)
+        dataset = dataset.shuffle(max(_SHUFFLE_BUFFER_ROWS // slice_size, 1), reshuffle_each_iteration=True)
+    dataset = _rebatch(dataset, batch_size, drop_remainder=drop_last_batch)
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
 
-    return tf.data.Dataset.from_generator(generator, output_signature=_derive_signature(files[0], filesystem))
+def _rebatch(dataset: tf.data.Dataset, batch_size: int, drop_remainder: bool) -> tf.data.Dataset:
+    # Dataset.rebatch is only available since tensorflow 2.12.
+    if hasattr(dataset, "rebatch"):
+        return dataset.rebatch(batch_size, drop_remainder=drop_remainder)
+    return dataset.unbatch().batch(batch_size, drop_remainder=drop_remainder)
 
 
 def _arrow_type_to_tensor_spec(field: pa.Field) -> tf.TensorSpec:
@@ -78,10 +130,10 @@ def _arrow_type_to_tensor_spec(field: pa.Field) -> tf.TensorSpec:
 
 
 def _derive_signature(file: str, filesystem: fsspec.AbstractFileSystem) -> Dict[str, tf.TensorSpec]:
-    """Derives the signature of the TF dataset from one parquet file."""
-    # TODO(zpeng): pq.read_schema does not support `filesystem` until pyarrow>=10.
-    # switch to pq.read_schema when we depend on that.
-    schema = pq.read_table(file, filesystem=filesystem).schema
+    """Derives the signature of the TF dataset from the footer of one parquet file."""
+    # pq.read_schema does not support `filesystem` until pyarrow>=10, so the file is opened here.
+    with filesystem.open(file, "rb") as f:
+        schema = pq.read_schema(f)
     # Signature:
     # The dataset yields dicts. Keys are column names; values are 1-D tensors (
     # the first dimension is batch dimension).
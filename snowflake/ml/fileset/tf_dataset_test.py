@@ -1,4 +1,10 @@
+import tempfile
+from unittest import mock
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import tensorflow as tf
 from absl.testing import absltest
 from fsspec.implementations import local
 
@@ -36,6 +42,43 @@ class TfDataSetTest(absltest.TestCase):
             count += 1
         self.assertEqual(count, len(expected_res))
 
+    def testReadAndParseParquetShuffle(self) -> None:
+        files = [self._file0.name, self._file1.name, self._file2.name]
+        dp = tf_dataset.read_and_parse_parquet(
+            files, local.LocalFileSystem(), batch_size=2, shuffle=True, drop_last_batch=False
+        )
+        res = [batch["col1"].numpy() for batch in dp]
+        self.assertEqual([len(batch) for batch in res], [2, 2, 2, 1])
+        np.testing.assert_array_equal(np.sort(np.concatenate(res)), np.arange(7))
+
+    def testReadAndParseParquetShuffleMixesFiles(self) -> None:
+        files = []
+        for file_index in range(4):
+            f = tempfile.NamedTemporaryFile(suffix=".parquet")
+            self.addCleanup(f.close)
+            pq.write_table(pa.table({"file": [file_index] * 1000}), f.name, row_group_size=100)
+            files.append(f.name)
+        dp = tf_dataset.read_and_parse_parquet(
+            files, local.LocalFileSystem(), batch_size=64, shuffle=True, drop_last_batch=False
+        )
+        res = [batch["file"].numpy() for batch in dp]
+        np.testing.assert_array_equal(np.sort(np.concatenate(res)), np.repeat(np.arange(4), 1000))
+        # The batches mix rows of several files, instead of each one being cut from a batch of a single file.
+        num_mixed_batches = sum(len(np.unique(batch)) > 1 for batch in res)
+        self.assertGreater(num_mixed_batches, len(res) * 0.9)
+
+    def testDeriveSignature(self) -> None:
+        with mock.patch.object(pq, "read_table", side_effect=AssertionError("The whole table should not be read.")):
+            signature = tf_dataset._derive_signature(self._file2.name, local.LocalFileSystem())
+        self.assertEqual(
+            signature,
+            {
+                "col1": tf.TensorSpec(shape=(None,), dtype=tf.int64),
+                "col2": tf.TensorSpec(shape=(None,), dtype=tf.float64),
+                "col3": tf.TensorSpec(shape=(None,), dtype=tf.string),
+            },
+        )
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -1,24 +1,36 @@
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 
 import fsspec
 import numpy.typing as npt
+import torch
 from torchdata.datapipes.iter import IterDataPipe
 
+from snowflake.ml._internal.exceptions import (
+    error_codes,
+    exceptions as snowml_exceptions,
+)
 from snowflake.ml.fileset import parquet_parser
 
 
 class ReadAndParseParquet(IterDataPipe):
     """Read and parse the parquet files yield batched numpy array in dict.
 
+    The files, or their row groups if there are fewer files than shards, are split among the workers of a DataLoader
+    and the ranks of a torch.distributed process group, so that every row is read by exactly one of them.
+
     Args:
         input_datapipe: A datapipe of input parquet file URIs to read and parse.
             Note that the datapipe must be finite.
         filesystem: A fsspec/pyarrow file system that is used to open given file URIs.
         batch_size: Specifies the size of each batch that will be yield
         shuffle: Whether the data in the file will be shuffled. If set to be true, it will first randomly shuffle
-            the order of files, and then shuflle the order of rows in each file.
+            the order of files, and then shuffle the rows of consecutive row groups in a buffer.
         drop_last_batch: Whether the last batch of data should be dropped. If set to be true, then the last batch will
-            get dropped if its size is smaller than the given batch_size.
+            get dropped if its size is smaller than the given batch_size. It applies to the last batch of each shard.
+        seed: The seed of the shuffle, to which the epoch set by `set_epoch` is added. If not set, the workers of a
+            DataLoader share a seed that changes every epoch. It must be set to shuffle data across distributed ranks.
+        row_group_counts: Optional. The number of row groups of each file, so that a worker only opens the files that
+            hold some of its row groups when there are fewer files than workers.
 
     Returns:
         A PyTorch iterable datapipe that yields batched numpy array in dict. The keys will be the column names in
@@ -44,14 +56,57 @@ class ReadAndParseParquet(IterDataPipe):
         batch_size: int,
         shuffle: bool,
         drop_last_batch: bool,
+        seed: Optional[int] = None,
+        row_group_counts: Optional[Dict[str, int]] = None,
     ) -> None:
         self._input_datapipe = input_datapipe
         self._fs = filesystem
         self._batch_size = batch_size
         self._shuffle = shuffle
         self._drop_last_batch = drop_last_batch
+        self._seed = seed
+        self._row_group_counts = row_group_counts
+        self._epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Sets the epoch, so that the data is shuffled differently in every epoch.
+
+        Args:
+            epoch: Epoch number.
+        """
+        self._epoch = epoch
 
     def __iter__(self) -> Iterator[Dict[str, npt.NDArray[Any]]]:
-        yield from parquet_parser.ParquetParser(
-            list(self._input_datapipe), self._fs, self._batch_size, self._shuffle, self._drop_last_batch
-        )
+        num_shards, shard_index = 1, 0
+        if torch.distributed.is_available() and torch.distributed.is_initialized():
+            num_shards = torch.distributed.get_world_size()
+            shard_index = torch.distributed.get_rank()
+            if self._shuffle and self._seed is None:
+                raise snowml_exceptions.SnowflakeMLException(
+                    error_code=error_codes.INVALID_ARGUMENT,
+                    original_exception=ValueError("A seed is required to shuffle data across distributed ranks."),
+                )
+
+        seed = None if self._seed is None else self._seed + self._epoch
+        worker_info = torch.utils.data.get_worker_info()
+        if worker_info is not None:
+            num_shards *= worker_info.num_workers
+            shard_index = shard_index * worker_info.num_workers + worker_info.id
+            if seed is None:
+                # The base seed of the workers is shared by the workers of a DataLoader, and changes every epoch.
+                seed = worker_info.seed - worker_info.id
+
+        for batch in parquet_parser.ParquetParser(
+            list(self._input_datapipe),
+            self._fs,
+            self._batch_size,
+            self._shuffle,
+            self._drop_last_batch,
+            seed=None if seed is None else seed % 2**32,
+            num_shards=num_shards,
+            shard_index=shard_index,
+            row_group_counts=self._row_group_counts,
+        ):
+            # The parser yields read-only views of Arrow buffers, which torch cannot turn into tensors without warning
+            # that they are not writable.
+            yield {col: array if array.flags.writeable else array.copy() for col, array in batch.items()}
@@ -1,3 +1,4 @@
+import warnings
 from typing import Dict, Iterable
 
 import numpy as np
@@ -43,6 +44,41 @@ class TorchDataPipeTest(absltest.TestCase):
                 if col != "col3":
                     self.assertIsInstance(tensor, torch.Tensor)
 
+    def testDataPipeCollatesWithoutWarnings(self) -> None:
+        files = IterableWrapper([self._file0.name, self._file1.name, self._file2.name])
+        dp = torch_datapipe.ReadAndParseParquet(files, local.LocalFileSystem(), 2, shuffle=False, drop_last_batch=True)
+        # The null-free integer column is read as a view of the Arrow buffers by the parquet parser.
+        self.assertTrue(all(batch["col1"].flags.writeable for batch in dp))
+        dl: Iterable[Dict[str, torch.Tensor]] = DataLoader(dp, batch_size=None, num_workers=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            res = [tensor_batch["col1"].tolist() for tensor_batch in dl]
+        self.assertEqual(res, [[0, 1], [2, 3], [4, 5]])
+
+    def testDataPipeWithWorkers(self) -> None:
+        files = IterableWrapper([self._file0.name, self._file1.name, self._file2.name])
+        # With 2 workers the files are split among the workers, and with 4 workers their row groups are.
+        for num_workers in [2, 4]:
+            for shuffle in [False, True]:
+                dp = torch_datapipe.ReadAndParseParquet(
+                    files, local.LocalFileSystem(), 1, shuffle=shuffle, drop_last_batch=False
+                )
+                dl: Iterable[Dict[str, torch.Tensor]] = DataLoader(dp, batch_size=None, num_workers=num_workers)
+                res = sorted(int(tensor_batch["col1"][0]) for tensor_batch in dl)
+                self.assertEqual(res, list(range(7)))
+
+    def testDataPipeSeed(self) -> None:
+        files = IterableWrapper([self._file0.name, self._file1.name, self._file2.name])
+        dp = torch_datapipe.ReadAndParseParquet(
+            files, local.LocalFileSystem(), 1, shuffle=True, drop_last_batch=False, seed=42
+        )
+        epoch0 = [int(batch["col1"][0]) for batch in dp]
+        self.assertEqual([int(batch["col1"][0]) for batch in dp], epoch0)
+        dp.set_epoch(1)
+        epoch1 = [int(batch["col1"][0]) for batch in dp]
+        self.assertNotEqual(epoch1, epoch0)
+        self.assertEqual(sorted(epoch1), list(range(7)))
+
 
 if __name__ == "__main__":
     absltest.main()
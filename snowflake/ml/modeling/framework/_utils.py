@@ -3,9 +3,10 @@
 import inspect
 import warnings
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import sklearn
 from packaging import version
 
@@ -45,6 +46,19 @@ BASIC_STATE_TO_FUNC_DICT = {
 # used to convert state strings to utility and SQL functions
 STATE_TO_FUNC_DICT = {**NUMERIC_STATE_TO_FUNC_DICT, **BASIC_STATE_TO_FUNC_DICT}
 
+# numeric states to the corresponding pandas aggregations, which skip nulls like their SQL counterparts
+NUMERIC_STATE_TO_PANDAS_FUNC_DICT: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "count": lambda df: df.count(),
+    "max": lambda df: df.max(),
+    "mean": lambda df: df.mean(),
+    "median": lambda df: df.median(),
+    "min": lambda df: df.min(),
+    "stddev": lambda df: df.std(),
+    "stddev_pop": lambda df: df.std(ddof=0),
+    "variance": lambda df: df.var(),
+    "var_pop": lambda df: df.var(ddof=0),
+}
+
 
 class NumericStatistics(str, Enum):
     COUNT = "count"
@@ -219,6 +233,37 @@ def get_filtered_valid_sklearn_args(
     return sklearn_args
 
 
+def merge_moments(
+    n_a: int, mean_a: float, var_a: float, n_b: int, mean_b: float, var_b: float
+) -> Tuple[int, float, float]:
+    """
+    Merge the count, mean and population variance of two disjoint partitions of a feature.
+
+    Uses the numerically stable parallel algorithm of Chan et al. Partitions without samples are ignored.
+
+    Args:
+        n_a: Number of samples in the first partition.
+        mean_a: Mean of the first partition.
+        var_a: Population variance of the first partition.
+        n_b: Number of samples in the second partition.
+        mean_b: Mean of the second partition.
+        var_b: Population variance of the second partition.
+
+    Returns:
+        The number of samples, mean and population variance of the union of both partitions.
+    """
+    if n_b == 0:
+        return n_a, mean_a, var_a
+    if n_a == 0:
+        return n_b, mean_b, var_b
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = var_a * n_a + var_b * n_b + delta**2 * n_a * n_b / n
+    return n, mean, m2 / n
+
+
 def str_to_bool(value: str) -> Union[bool, None]:
     if value is None:
         return None
@@ -445,8 +445,9 @@ class BaseEstimator(Base):
             df=dataset,
             cols=cols,
             map_func=_compute_on_partition,
-            partition_size=40,
+            partition_size=parallelize.get_partition_size(n_cols=len(cols), n_exprs_per_col=len(states)),
             statement_params=telemetry.get_statement_params(PROJECT, SUBPROJECT, self.__class__.__name__),
+            concurrent=True,
         )
 
         computed_dict: Dict[str, Dict[str, Union[int, float, str]]] = {}
@@ -460,6 +461,31 @@ class BaseEstimator(Base):
 
         return computed_dict
 
+    def _compute_pandas(
+        self, dataset: pd.DataFrame, cols: List[str], states: List[str]
+    ) -> Dict[str, Dict[str, Optional[Union[int, float]]]]:
+        """
+        Compute required numeric states of the columns of a pandas dataframe.
+
+        This is the pandas counterpart of `_compute`, limited to the numeric states. Null values are skipped.
+
+        Args:
+            dataset: Input dataset.
+            cols: Columns to compute.
+            states: Numeric states to compute, e.g. "min" or "var_pop".
+
+        Returns:
+            A dict of {column_name: {state: value}} of each column. Values are None for columns without non-null values.
+        """
+        computed_dict: Dict[str, Dict[str, Optional[Union[int, float]]]] = {col_name: {} for col_name in cols}
+        for state in states:
+            res = _utils.NUMERIC_STATE_TO_PANDAS_FUNC_DICT[state](dataset[cols])
+            for col_name in cols:
+                # convert numpy scalars to native python values, as returned by `_compute`
+                val = np.asarray(res[col_name]).item()
+                computed_dict[col_name][state] = None if pd.isna(val) else val
+        return computed_dict
+
 
 class BaseTransformer(BaseEstimator):
     def __init__(
@@ -473,6 +499,7 @@ class BaseTransformer(BaseEstimator):
         """Base class for all transformers."""
         super().__init__(file_names=file_names, custom_states=custom_states, sample_weight_col=sample_weight_col)
         self._sklearn_object = None
+        self._fitted_arrays: Optional[Dict[str, npt.NDArray[np.float64]]] = None
         self._is_fitted = False
         self._drop_input_cols = drop_input_cols
 
@@ -524,9 +551,78 @@ class BaseTransformer(BaseEstimator):
         )
 
     def _reset(self) -> None:
-        self._sklearn_object = None
+        self._clear_cached_fitted_state()
         self._is_fitted = False
 
+    def _clear_cached_fitted_state(self) -> None:
+        """Clear the objects derived from the fitted state. Must be called whenever the fitted state is updated."""
+        self._sklearn_object = None
+        self._fitted_arrays = None
+
+    def _create_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        """
+        Create the fitted state as contiguous float64 arrays aligned to `self.input_cols`, used by
+        `_transform_numpy`.
+
+        Raises:
+            NotImplementedError: If the transformer has no array-backed fitted state.
+        """
+        raise NotImplementedError()
+
+    def _get_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        """
+        Get the cached array-backed fitted state, creating it on first use after a fit.
+
+        Returns:
+            A dict of {attribute_name: array}, where each array is aligned to `self.input_cols`.
+        """
+        # Transformers unpickled from earlier versions do not have the attribute.
+        if getattr(self, "_fitted_arrays", None) is None:
+            self._fitted_arrays = self._create_fitted_arrays()
+        assert self._fitted_arrays is not None
+        return self._fitted_arrays
+
+    def _transform_numpy(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Transform the 2D float64 array of the input columns in place with the array-backed fitted state.
+
+        Args:
+            X: Array of shape (n_samples, len(self.input_cols)), overwritten with the transformed values.
+
+        Raises:
+            NotImplementedError: If the transformer has no NumPy transform.
+        """
+        raise NotImplementedError()
+
+    def _transform_pandas_numpy(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transform the input pandas dataset with `_transform_numpy`, bypassing the sklearn object.
+
+        Only the input columns are copied into a float64 array, which is transformed in place; the other columns of
+        the dataset are shared with the output dataset and never copied.
+
+        Args:
+            dataset: Input dataset to transform.
+
+        Returns:
+            Transformed dataset.
+        """
+        self._enforce_fit()
+        transformed_data = self._transform_numpy(
+            dataset[self.input_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        )
+        output_dataset = pd.DataFrame(transformed_data, columns=self.output_cols, index=dataset.index)
+
+        # Output columns that already exist in the dataset are replaced in place, and new ones are appended.
+        output_col_set = set(self.output_cols)
+        replaced_cols = [col for col in dataset.columns if col in output_col_set]
+        passthrough_dataset = dataset.drop(columns=replaced_cols) if replaced_cols else dataset
+        transformed_dataset = pd.concat([passthrough_dataset, output_dataset], axis=1, copy=False)
+        if replaced_cols:
+            new_cols = [col for col in self.output_cols if col not in set(dataset.columns)]
+            transformed_dataset = transformed_dataset[list(dataset.columns) + new_cols]
+        return transformed_dataset
+
     def _convert_attribute_dict_to_ndarray(
         self,
         attribute: Optional[Mapping[str, Union[int, float, str, Iterable[Union[int, float, str]]]]],
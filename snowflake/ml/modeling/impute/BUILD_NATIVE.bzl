@@ -20,6 +20,7 @@ def get_build_rules_for_native_impl():
             ":init",
             "//snowflake/ml/_internal:telemetry",
             "//snowflake/ml/_internal/exceptions:exceptions",
+            "//snowflake/ml/_internal/utils:parallelize",
             "//snowflake/ml/modeling/framework",
         ],
     )
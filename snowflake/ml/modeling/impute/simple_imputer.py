@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import copy
-from typing import Any, Dict, Iterable, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -10,6 +10,7 @@ from sklearn import impute
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
 from snowflake.ml._internal.exceptions import error_codes, exceptions
+from snowflake.ml._internal.utils import parallelize
 from snowflake.ml.modeling.framework import _utils, base
 from snowflake.snowpark import functions as F, types as T
 from snowflake.snowpark._internal import utils as snowpark_utils
@@ -113,6 +114,9 @@ class SimpleImputer(base.BaseTransformer):
         statistics_: dict {input_col: stats_value}
             Dict containing the imputation fill value for each feature. Computing statistics can result in `np.nan`
             values. During `transform`, features corresponding to `np.nan` statistics will be discarded.
+        n_samples_seen_: dict {input_col: int}
+            Number of non-missing samples seen for each feature. Only set with the "mean" strategy, and used to
+            merge batches in `partial_fit`.
         n_features_in_: int
             Number of features seen during `fit`.
         feature_names_in_: ndarray of shape (n_features_in,)
@@ -165,6 +169,8 @@ class SimpleImputer(base.BaseTransformer):
             del self.n_features_in_
             del self.feature_names_in_
             del self._sklearn_fit_dtype
+        if hasattr(self, "n_samples_seen_"):
+            del self.n_samples_seen_
 
     def _get_dataset_input_col_datatypes(self, dataset: snowpark.DataFrame) -> Dict[str, T.DataType]:
         """
@@ -232,7 +238,6 @@ class SimpleImputer(base.BaseTransformer):
         input_col_datatypes = self._get_dataset_input_col_datatypes(dataset)
 
         self.statistics_: Dict[str, Any] = {}
-        statement_params = telemetry.get_statement_params(base.PROJECT, _SUBPROJECT, self.__class__.__name__)
 
         if self.strategy == "constant":
             if self.fill_value is None:
@@ -246,14 +251,16 @@ class SimpleImputer(base.BaseTransformer):
                         self.fill_value = "missing_data"
                         break
 
+            # The non-null values of all input columns are counted in a single pass.
+            _computed_states = self._compute(dataset, self.input_cols, states=[_utils.NumericStatistics.COUNT])
             for input_col in self.input_cols:
                 # Check whether input column is empty if necessary.
                 if (
                     # TODO(hayu): [SNOW-752265] Support SimpleImputer keep_empty_features.
                     #  Add back when `keep_empty_features` is supported.
                     # not self.keep_empty_features
-                    # and dataset.filter(F.col(input_col).is_not_null()).count(statement_params=statement_params) == 0
-                    dataset.filter(F.col(input_col).is_not_null()).count(statement_params=statement_params)
+                    # and _computed_states[input_col][_utils.NumericStatistics.COUNT] == 0
+                    _computed_states[input_col][_utils.NumericStatistics.COUNT]
                     == 0
                 ):
                     self.statistics_[input_col] = np.nan
@@ -262,22 +269,30 @@ class SimpleImputer(base.BaseTransformer):
         else:
             state = STRATEGY_TO_STATE_DICT[self.strategy]
             assert state is not None
-            dataset_copy = copy.copy(dataset)
-            if not pd.isna(self.missing_values):
-                # Replace `self.missing_values` with null to avoid including it when computing states.
-                dataset_copy = dataset_copy.na.replace(self.missing_values, None)
-            _computed_states = self._compute(dataset_copy, self.input_cols, states=[state])
+            states = [state]
+            if self.strategy == "mean":
+                # The count is computed in the same query, and allows the mean to be updated by `partial_fit`.
+                states.append(_utils.NumericStatistics.COUNT)
+                self.n_samples_seen_: Dict[str, int] = {}
+            _computed_states = self._compute(self._replace_missing_values(dataset), self.input_cols, states=states)
             for input_col in self.input_cols:
                 statistic = _computed_states[input_col][state]
                 self.statistics_[input_col] = np.nan if statistic is None else statistic
                 if self.strategy == "mean":
                     self.statistics_[input_col] = float(self.statistics_[input_col])
-                elif self.strategy == "most_frequent":
-                    # Check if there is only one occurrence of the value. If so, the statistic should be the minimum
-                    # value in the dataset.
-                    if dataset.filter(F.col(input_col) == statistic).count(statement_params=statement_params) == 1:
-                        statistic_min = self._compute(dataset, [input_col], states=[_utils.NumericStatistics.MIN])
-                        self.statistics_[input_col] = statistic_min[input_col][_utils.NumericStatistics.MIN]
+                    self.n_samples_seen_[input_col] = int(_computed_states[input_col][_utils.NumericStatistics.COUNT])
+
+            if self.strategy == "most_frequent":
+                # Check if there is only one occurrence of the mode. If so, the statistic should be the minimum
+                # value in the dataset. Occurrences and minimums of all input columns are computed in a single pass.
+                modes = {
+                    input_col: _computed_states[input_col][state]
+                    for input_col in self.input_cols
+                    if _computed_states[input_col][state] is not None
+                }
+                for input_col, (mode_count, col_min) in self._compute_mode_counts_and_mins(dataset, modes).items():
+                    if mode_count == 1:
+                        self.statistics_[input_col] = col_min
 
         self.n_features_in_ = len(self.input_cols)
         self.feature_names_in_ = self.input_cols
@@ -292,6 +307,112 @@ class SimpleImputer(base.BaseTransformer):
         self._is_fitted = True
         return self
 
+    def _compute_mode_counts_and_mins(
+        self, dataset: snowpark.DataFrame, modes: Dict[str, Any]
+    ) -> Dict[str, Tuple[int, Any]]:
+        """
+        Count the occurrences of the mode, and compute the minimum of each column in a single pass.
+
+        Args:
+            dataset: Input dataset.
+            modes: A dict of {column_name: mode} of each column to compute.
+
+        Returns:
+            A dict of {column_name: (mode_count, min)} of each column.
+        """
+        cols = list(modes.keys())
+        if len(cols) == 0:
+            return {}
+
+        def _compute_on_partition(df: snowpark.DataFrame, cols_subset: List[str]) -> snowpark.DataFrame:
+            exprs = []
+            for col_name in cols_subset:
+                exprs.append(F.sum(F.iff(F.col(col_name) == F.lit(modes[col_name]), 1, 0)))
+                exprs.append(F.min(F.col(col_name)))
+            res: snowpark.DataFrame = df.select(exprs)
+            return res
+
+        results = parallelize.map_dataframe_by_column(
+            df=dataset,
+            cols=cols,
+            map_func=_compute_on_partition,
+            partition_size=parallelize.get_partition_size(n_cols=len(cols), n_exprs_per_col=2),
+            statement_params=telemetry.get_statement_params(base.PROJECT, _SUBPROJECT, self.__class__.__name__),
+            concurrent=True,
+        )
+        return {col_name: (results[0][2 * idx], results[0][2 * idx + 1]) for idx, col_name in enumerate(cols)}
+
+    @telemetry.send_api_usage_telemetry(project=base.PROJECT, subproject=_SUBPROJECT)
+    def partial_fit(self, dataset: snowpark.DataFrame) -> "SimpleImputer":
+        """
+        Update the values to impute with a new batch of the dataset. Only supported with the "mean" strategy.
+
+        Only the count and the mean of the new batch are computed and merged into the fitted state, so the cost of
+        an update is proportional to the size of the batch. Calling `partial_fit` on an unfitted imputer is
+        equivalent to calling `fit`.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            Fitted simple imputer.
+
+        Raises:
+            SnowflakeMLException: If the strategy is not "mean".
+        """
+        if self.strategy != "mean":
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.NOT_IMPLEMENTED,
+                original_exception=NotImplementedError(
+                    f"partial_fit is only supported with the 'mean' strategy, but got strategy {self.strategy}."
+                ),
+            )
+        if not self._is_fitted:
+            return self.fit(dataset)
+
+        super()._check_input_cols()
+        input_col_datatypes = self._get_dataset_input_col_datatypes(dataset)
+
+        states = [_utils.NumericStatistics.COUNT, _utils.NumericStatistics.MEAN]
+        _computed_states = self._compute(self._replace_missing_values(dataset), self.input_cols, states=states)
+        for input_col in self.input_cols:
+            batch_count = int(_computed_states[input_col][_utils.NumericStatistics.COUNT])
+            if batch_count == 0:
+                continue
+            batch_mean = float(_computed_states[input_col][_utils.NumericStatistics.MEAN])
+            n_samples_seen, mean, _ = _utils.merge_moments(
+                self.n_samples_seen_[input_col], self.statistics_[input_col], 0.0, batch_count, batch_mean, 0.0
+            )
+            self.n_samples_seen_[input_col] = n_samples_seen
+            self.statistics_[input_col] = mean
+
+        self._sklearn_fit_dtype = max(  # type:ignore[type-var]
+            self._sklearn_fit_dtype,
+            *(
+                SNOWFLAKE_DATATYPE_TO_NUMPY_DTYPE_MAP[type(input_col_datatypes[input_col])]
+                for input_col in self.input_cols
+            ),
+        )
+
+        # The cached sklearn object holds the previous statistics.
+        self._clear_cached_fitted_state()
+        return self
+
+    def _replace_missing_values(self, dataset: snowpark.DataFrame) -> snowpark.DataFrame:
+        """
+        Replace `self.missing_values` with null to avoid including it when computing states.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            Dataset where the missing values are null.
+        """
+        dataset_copy = copy.copy(dataset)
+        if not pd.isna(self.missing_values):
+            dataset_copy = dataset_copy.na.replace(self.missing_values, None)
+        return dataset_copy
+
     @telemetry.send_api_usage_telemetry(project=base.PROJECT, subproject=_SUBPROJECT)
     @telemetry.add_stmt_params_to_df(project=base.PROJECT, subproject=_SUBPROJECT)
     def transform(self, dataset: Union[snowpark.DataFrame, pd.DataFrame]) -> Union[snowpark.DataFrame, pd.DataFrame]:
@@ -1,24 +1,14 @@
-import json
-import warnings
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-import cloudpickle
 import numpy as np
 import numpy.typing as npt
-import sklearn
-from packaging import version
-from sklearn import exceptions, metrics
+import pandas as pd
+from sklearn import metrics
 
-import snowflake.snowpark._internal.utils as snowpark_utils
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
 from snowflake.ml.modeling.metrics import metrics_utils
 from snowflake.snowpark import functions as F, types as T
-from snowflake.snowpark._internal.utils import (
-    TempObjectType,
-    generate_random_alphanumeric,
-    random_name_for_temp_object,
-)
 
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
@@ -58,24 +48,39 @@ def accuracy_score(
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
 
-    if isinstance(y_true_col_names, str) or (len(y_true_col_names) == 1):
-        y_true, y_pred = (
-            (y_true_col_names, y_pred_col_names)
-            if isinstance(y_true_col_names, str)
-            else (y_true_col_names[0], y_pred_col_names[0])
-        )
-        score_column = F.iff(df[y_true] == df[y_pred], 1, 0)
-    # multilabel
-    else:
-        expr = " and ".join([f"({y_true_col_names[i]} = {y_pred_col_names[i]})" for i in range(len(y_true_col_names))])
-        score_column = F.iff(expr, 1, 0)
-    return _weighted_sum(
+    y_true, y_pred, counts = metrics_utils.confusion_counts(
         df=df,
-        sample_score_column=score_column,
-        sample_weight_column=df[sample_weight_col_name] if sample_weight_col_name else None,
-        normalize=normalize,
+        y_true_col_names=metrics_utils.flatten_cols([y_true_col_names]),
+        y_pred_col_names=metrics_utils.flatten_cols([y_pred_col_names]),
+        sample_weight_col_name=sample_weight_col_name,
         statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
     )
+    return _accuracy_score_from_counts(y_true=y_true, y_pred=y_pred, counts=counts, normalize=normalize)
+
+
+def _accuracy_score_from_counts(
+    *,
+    y_true: npt.NDArray[Any],
+    y_pred: npt.NDArray[Any],
+    counts: npt.NDArray[np.float_],
+    normalize: bool,
+) -> float:
+    """Accuracy classification score of the confusion counts returned by `metrics_utils.confusion_counts`.
+
+    Args:
+        y_true: Distinct actual values.
+        y_pred: Distinct predicted values.
+        counts: Number of samples, or sum of sample weights, of each combination.
+        normalize: If ``False``, return the number of correctly classified samples.
+            Otherwise, return the fraction of correctly classified samples.
+
+    Returns:
+        The fraction or the number of correctly classified samples.
+    """
+    # Null labels never match, consistently with the SQL equality.
+    correct = np.all(y_true == y_pred, axis=1) & ~np.any(pd.isnull(y_true), axis=1)
+    score = float(np.sum(counts[correct]))
+    return score / float(np.sum(counts)) if normalize else score
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -125,73 +130,70 @@ def confusion_matrix(
         ValueError: No label specified in the given ``labels`` is in the y true column.
         ValueError: ``normalize`` is not one of {'true', 'pred', 'all', None}.
     """
-    assert df._session is not None
-    session = df._session
+    if normalize not in ["true", "pred", "all", None]:
+        raise ValueError("normalize must be one of {'true', 'pred', 'all', None}")
 
-    # Get a label df with columns: [LABEL, INDEX].
-    if labels is None:
-        label_df = metrics_utils.unique_labels(df=df, columns=[df[y_true_col_name], df[y_pred_col_name]])
-    else:
-        _labels = np.array(labels)
-        label_data = np.vstack((_labels, np.arange(_labels.size))).T.tolist()
-        label_df = session.create_dataframe(label_data, schema=[metrics_utils.LABEL, metrics_utils.INDEX])
+    y_true, y_pred, counts = metrics_utils.confusion_counts(
+        df=df,
+        y_true_col_names=[y_true_col_name],
+        y_pred_col_names=[y_pred_col_name],
+        sample_weight_col_name=sample_weight_col_name,
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
+    )
+    return _confusion_matrix_from_counts(
+        y_true=y_true[:, 0], y_pred=y_pred[:, 0], counts=counts, labels=labels, normalize=normalize
+    )
+
+
+def _confusion_matrix_from_counts(
+    *,
+    y_true: npt.NDArray[Any],
+    y_pred: npt.NDArray[Any],
+    counts: npt.NDArray[np.float_],
+    labels: Optional[npt.ArrayLike] = None,
+    normalize: Optional[str] = None,
+) -> npt.NDArray[np.float_]:
+    """Confusion matrix of the confusion counts returned by `metrics_utils.confusion_counts`.
+
+    Args:
+        y_true: Distinct actual values.
+        y_pred: Distinct predicted values.
+        counts: Number of samples, or sum of sample weights, of each combination.
+        labels: List of labels to index the matrix. If ``None`` is given, those that appear at least once in
+            ``y_true`` or ``y_pred`` are used in sorted order.
+        normalize: {'true', 'pred', 'all'}, default=None
 
-    n_labels = label_df.count()
+    Returns:
+        Confusion matrix of shape (n_classes, n_classes).
+
+    Raises:
+        ValueError: The given ``labels`` is empty.
+        ValueError: No label specified in the given ``labels`` is in the y true column.
+    """
+    # Samples with a null label are not matched to any label.
+    not_null = ~(pd.isnull(y_true) | pd.isnull(y_pred))
+    y_true, y_pred, counts = y_true[not_null], y_pred[not_null], counts[not_null]
+
+    _labels = np.unique(np.concatenate([y_true, y_pred])) if labels is None else np.asarray(labels)
+    n_labels = _labels.size
     if labels is not None:
         if n_labels == 0:
             raise ValueError("'labels' should contains at least one label.")
-        elif df[[y_true_col_name]].filter(~F.is_null(df[y_true_col_name])).count() == 0:
+        elif y_true.size == 0:
             return np.zeros((n_labels, n_labels), dtype=int)
-        elif df[[y_true_col_name]].join(label_df, df[y_true_col_name] == label_df[metrics_utils.LABEL]).count() == 0:
+        elif not np.any(np.isin(y_true, _labels)):
             raise ValueError("At least one label specified must be in the y true column")
 
-    rand = generate_random_alphanumeric()
-    if sample_weight_col_name is None:
-        sample_weight_col_name = f'"_SAMPLE_WEIGHT_{rand}"'
-        df = df.with_column(sample_weight_col_name, F.lit(1))
-
-    if normalize not in ["true", "pred", "all", None]:
-        raise ValueError("normalize must be one of {'true', 'pred', 'all', None}")
-
-    # Get indices of true and pred data.
-    label_col = f'"_LABEL_{rand}"'
-    y_true_index_col = f'"_Y_TRUE_INDEX_{rand}"'
-    y_pred_index_col = f'"_Y_PRED_INDEX_{rand}"'
-    label_df = label_df.with_column_renamed(metrics_utils.LABEL, label_col)
-    ind_df = (
-        df.join(
-            label_df.with_column_renamed(metrics_utils.INDEX, y_true_index_col),
-            df[y_true_col_name] == label_df[label_col],
-        )
-        .drop(label_col)
-        .join(
-            label_df.with_column_renamed(metrics_utils.INDEX, y_pred_index_col),
-            df[y_pred_col_name] == label_df[label_col],
-        )
-        .drop(label_col)
-    )
+    label_to_index = {label: index for index, label in enumerate(_labels.tolist())}
+    y_true_index = np.array([label_to_index.get(label, -1) for label in y_true.tolist()], dtype=np.int64)
+    y_pred_index = np.array([label_to_index.get(label, -1) for label in y_pred.tolist()], dtype=np.int64)
+    known = (y_true_index >= 0) & (y_pred_index >= 0)
 
-    # Register UDTFs.
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    confusion_matrix_computer = _register_confusion_matrix_computer(session=session, statement_params=statement_params)
-    confusion_matrix_computer_udtf = F.table_function(confusion_matrix_computer)
-    accumulator = metrics_utils.register_accumulator_udtf(session=session, statement_params=statement_params)
-    accumulator_udtf = F.table_function(accumulator)
-
-    # Compute the confusion matrix.
-    temp_df1 = ind_df.select(
-        F.array_construct(sample_weight_col_name, y_true_index_col, y_pred_index_col).alias("ARR_COL")
-    )
-    temp_df2 = temp_df1.select(confusion_matrix_computer_udtf(F.col("ARR_COL"), F.lit(n_labels))).with_column_renamed(
-        "RESULT", "RES"
-    )
-    res_df = temp_df2.select(accumulator_udtf(F.col("RES")).over(partition_by="PART"), F.col("PART"))
-    results = res_df.collect(statement_params=statement_params)
-
-    cm = np.zeros((n_labels, n_labels))
-    for i in range(len(results)):
-        row = int(results[i][1].strip("row_"))
-        cm[row, :] = cloudpickle.loads(results[i][0])
+    cm = np.bincount(
+        y_true_index[known] * n_labels + y_pred_index[known],
+        weights=counts[known],
+        minlength=n_labels * n_labels,
+    ).reshape(n_labels, n_labels)
 
     with np.errstate(all="ignore"):
         if normalize == "true":
@@ -205,89 +207,6 @@ def confusion_matrix(
     return cm
 
 
-def _register_confusion_matrix_computer(*, session: snowpark.Session, statement_params: Dict[str, Any]) -> str:
-    """Registers confusion matrix computation UDTF in Snowflake and returns the name of the UDTF.
-
-    Args:
-        session: Snowpark session.
-        statement_params: Dictionary used for tagging queries for tracking purposes.
-
-    Returns:
-        Name of the UDTF.
-    """
-
-    class ConfusionMatrixComputer:
-        BATCH_SIZE = 1000
-
-        def __init__(self) -> None:
-            self._initialized = False
-            self._confusion_matrix = np.zeros((1, 1))
-            # 2d array containing a batch of input rows. A batch contains self.BATCH_SIZE rows.
-            # [sample_weight, y_true, y_pred]
-            self._batched_rows = np.zeros((self.BATCH_SIZE, 1))
-            # Number of columns in the dataset.
-            self._n_cols = -1
-            # Running count of number of rows added to self._batched_rows.
-            self._cur_count = 0
-            # Number of labels.
-            self._n_label = 0
-
-        def process(self, input_row: List[float], n_label: int) -> None:
-            """Computes confusion matrix.
-
-            Args:
-                input_row: List of floats: [sample_weight, y_true, y_pred].
-                n_label: Number of labels.
-            """
-            # 1. Initialize variables.
-            if not self._initialized:
-                self._n_cols = len(input_row)
-                self._batched_rows = np.zeros((self.BATCH_SIZE, self._n_cols))
-                self._n_label = n_label
-                self._confusion_matrix = np.zeros((self._n_label, self._n_label))
-            self._initialized = True
-
-            self._batched_rows[self._cur_count, :] = input_row
-            self._cur_count += 1
-
-            # 2. Compute incremental sum and dot_prod for the batch.
-            if self._cur_count >= self.BATCH_SIZE:
-                self.update_confusion_matrix()
-                self._cur_count = 0
-
-        def end_partition(self) -> Iterable[Tuple[bytes, str]]:
-            # 3. Compute sum and dot_prod for the remaining rows in the batch.
-            if self._cur_count > 0:
-                self.update_confusion_matrix()
-            for i in range(self._n_label):
-                yield cloudpickle.dumps(self._confusion_matrix[i, :]), "row_" + str(i)
-
-        def update_confusion_matrix(self) -> None:
-            np.add.at(
-                self._confusion_matrix,
-                (self._batched_rows[:, 1].astype(int), self._batched_rows[:, 2].astype(int)),
-                self._batched_rows[:, 0],
-            )
-
-    confusion_matrix_computer = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.TABLE_FUNCTION)
-    session.udtf.register(
-        ConfusionMatrixComputer,
-        output_schema=T.StructType(
-            [
-                T.StructField("result", T.BinaryType()),
-                T.StructField("part", T.StringType()),
-            ]
-        ),
-        input_types=[T.ArrayType(), T.IntegerType()],
-        packages=["numpy", "cloudpickle"],
-        name=confusion_matrix_computer,
-        is_permanent=False,
-        replace=True,
-        statement_params=statement_params,
-    )
-    return confusion_matrix_computer
-
-
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
 def f1_score(
     *,
@@ -517,11 +436,38 @@ def log_loss(
     y_true = y_true_col_names if isinstance(y_true_col_names, list) else [y_true_col_names]
     y_pred = y_pred_col_names if isinstance(y_pred_col_names, list) else [y_pred_col_names]
 
-    # Since we are processing samples individually, we need to explicitly specify the output labels
-    # in the case that there is one output label.
-    if len(y_true) == 1 and not labels:
-        labels = json.loads(df.select(F.array_unique_agg(y_true[0])).collect(statement_params=statement_params)[0][0])
+    if len(y_true) == 1:
+        # A single column of labels is aggregated by label with SQL expressions, in one scan of the data.
+        weight = F.col(sample_weight_col_name) if sample_weight_col_name else F.lit(1)
+        losses = _log_loss_columns(
+            y_pred_col_names=y_pred, eps=float(np.finfo(np.float64).eps) if eps == "auto" else float(eps)
+        )
+        condition = F.col(y_true[0]).is_not_null()
+        for col in y_pred:
+            condition = condition & F.col(col).is_not_null()
+        statistics = (
+            df.filter(condition)
+            .select(
+                F.col(y_true[0]).alias("Y_TRUE"),
+                weight.alias("_WEIGHT"),
+                *[(weight * loss).alias(f"_LOSS_{i}") for i, loss in enumerate(losses)],
+            )
+            .group_by("Y_TRUE")
+            .agg(
+                F.sum("_WEIGHT").alias("WEIGHT"),
+                *[F.sum(f"_LOSS_{i}").alias(f"LOSS_{i}") for i in range(len(losses))],
+            )
+            .to_pandas(statement_params=statement_params)
+        )
+        return _log_loss_from_statistics(
+            y_true=statistics["Y_TRUE"].to_numpy(),
+            losses=statistics[[f"LOSS_{i}" for i in range(len(losses))]].to_numpy(dtype=np.float64),
+            weights=statistics["WEIGHT"].to_numpy(dtype=np.float64),
+            labels=labels,
+            normalize=normalize,
+        )
 
+    # Multilabel data has no fixed layout of the labels, so the samples are processed individually.
     normalize_sum = None
     if normalize:
         if sample_weight_col_name:
@@ -570,7 +516,7 @@ def _register_log_loss_computer(
     eps: Union[float, str] = "auto",
     labels: Optional[npt.ArrayLike] = None,
 ) -> str:
-    """Registers log loss computation UDTF in Snowflake and returns the name of the UDTF.
+    """Registers log loss computation UDTF in Snowflake, once per session, and returns the name of the UDTF.
 
     Args:
         session: Snowpark session.
@@ -611,21 +557,96 @@ def _register_log_loss_computer(
             )
             yield (float(res),)
 
-    log_loss_computer = random_name_for_temp_object(TempObjectType.TABLE_FUNCTION)
-    session.udtf.register(
-        LogLossComputer,
+    # The handler is bound to `eps` and `labels`, which are thus part of its identity.
+    labels_key = None if labels is None else tuple(np.asarray(labels).tolist())
+    return metrics_utils.register_cached_udtf(
+        session=session,
+        handler=LogLossComputer,
+        handler_key=(_register_log_loss_computer, eps, labels_key),
         output_schema=T.StructType(
             [
                 T.StructField("log_loss", T.FloatType()),
             ]
         ),
         packages=["scikit-learn"],
-        name=log_loss_computer,
-        is_permanent=False,
-        replace=True,
         statement_params=statement_params,
     )
-    return log_loss_computer
+
+
+def _log_loss_columns(*, y_pred_col_names: List[str], eps: float) -> List[snowpark.Column]:
+    """Builds the log loss of every sample for each class, as computed by sklearn.
+
+    The probabilities are clipped to `[eps, 1 - eps]` and renormalized to sum to one. A single column holds the
+    probability of the positive class, and gives the losses of the negative and positive classes.
+
+    Args:
+        y_pred_col_names: Column names representing predicted probabilities, one per class in sorted order of class.
+        eps: Clipping bound of the probabilities.
+
+    Returns:
+        The loss of each class, i.e. the negative log of its probability.
+    """
+    clipped = [
+        F.least(F.greatest(F.col(col).cast(T.DoubleType()), F.lit(eps)), F.lit(1 - eps)) for col in y_pred_col_names
+    ]
+    if len(clipped) == 1:
+        return [-F.call_builtin("ln", F.lit(1) - clipped[0]), -F.call_builtin("ln", clipped[0])]
+    total = clipped[0]
+    for col in clipped[1:]:
+        total = total + col
+    return [F.call_builtin("ln", total) - F.call_builtin("ln", col) for col in clipped]
+
+
+def _log_loss_from_statistics(
+    *,
+    y_true: npt.NDArray[Any],
+    losses: npt.NDArray[np.float_],
+    weights: npt.NDArray[np.float_],
+    labels: Optional[npt.ArrayLike] = None,
+    normalize: bool = True,
+) -> float:
+    """Log loss of the losses of each class summed by y true value, with the columns built by `_log_loss_columns`.
+
+    Args:
+        y_true: Distinct actual values.
+        losses: Array of shape (len(y_true), n_classes). Sum of the (weighted) losses of each class over the samples
+            of each actual value.
+        weights: Number of samples, or sum of sample weights, of each actual value.
+        labels: If not provided, labels will be inferred from y_true.
+        normalize: If true, return the mean loss per sample.
+            Otherwise, return the sum of the per-sample losses.
+
+    Returns:
+        Log loss, aka logistic loss or cross-entropy loss.
+
+    Raises:
+        ValueError: Less than two labels are given, or found in y true.
+        ValueError: The number of labels is different from the number of predicted classes.
+    """
+    classes = np.unique(y_true) if labels is None else np.unique(labels)
+    if len(classes) == 1:
+        if labels is None:
+            raise ValueError(
+                f"y_true contains only one label ({classes[0]}). Please provide the true labels explicitly through "
+                "the labels argument."
+            )
+        raise ValueError(f"The labels array needs to contain at least two labels for log_loss, got {classes}.")
+    if len(classes) != losses.shape[1]:
+        if labels is None:
+            raise ValueError(
+                f"y_true and y_pred contain different number of classes {len(classes)}, {losses.shape[1]}. Please "
+                f"provide the true labels explicitly through the labels argument. Classes found in y_true: {classes}"
+            )
+        raise ValueError(
+            f"The number of classes in labels is different from that in y_pred. Classes found in labels: {classes}"
+        )
+
+    # Samples whose actual value is not a label have no loss, as in sklearn.
+    class_index = {label: index for index, label in enumerate(classes.tolist())}
+    total_loss = float(
+        sum(losses[i, class_index[label]] for i, label in enumerate(y_true.tolist()) if label in class_index)
+    )
+    return total_loss / float(np.sum(weights)) if normalize else total_loss
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -730,64 +751,80 @@ def precision_recall_fscore_support(
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
 
-    session = df._session
-    assert session is not None
-    sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    y_true, y_pred, counts = metrics_utils.confusion_counts(
+        df=df,
+        y_true_col_names=metrics_utils.flatten_cols([y_true_col_names]),
+        y_pred_col_names=metrics_utils.flatten_cols([y_pred_col_names]),
+        sample_weight_col_name=sample_weight_col_name,
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
+    )
+    return _precision_recall_fscore_support_from_counts(
+        y_true=y_true,
+        y_pred=y_pred,
+        counts=counts,
+        beta=beta,
+        labels=labels,
+        pos_label=pos_label,
+        average=average,
+        warn_for=warn_for,
+        weighted=sample_weight_col_name is not None,
+        zero_division=zero_division,
     )
-    def precision_recall_fscore_support_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        with warnings.catch_warnings(record=True) as w:
-            p, r, f, s = metrics.precision_recall_fscore_support(
-                y_true,
-                y_pred,
-                beta=beta,
-                labels=labels,
-                pos_label=pos_label,
-                average=average,
-                warn_for=warn_for,
-                sample_weight=sample_weight,
-                zero_division=zero_division,
-            )
 
-            # handle zero_division warnings
-            warning = None
-            if len(w) > 0 and issubclass(w[-1].category, exceptions.UndefinedMetricWarning):
-                warning = w[-1]
 
-        return cloudpickle.dumps((p, r, f, s, warning))  # type: ignore[no-any-return]
+def _precision_recall_fscore_support_from_counts(
+    *,
+    y_true: npt.NDArray[Any],
+    y_pred: npt.NDArray[Any],
+    counts: npt.NDArray[np.float_],
+    beta: float = 1.0,
+    labels: Optional[npt.ArrayLike] = None,
+    pos_label: Union[str, int] = 1,
+    average: Optional[str] = None,
+    warn_for: Union[Tuple[str, ...], Set[str]] = ("precision", "recall", "f-score"),
+    weighted: bool = False,
+    zero_division: Union[str, int] = "warn",
+) -> Union[
+    Tuple[float, float, float, None],
+    Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]],
+]:
+    """Precision, recall, F-measure and support of the confusion counts returned by `metrics_utils.confusion_counts`.
+
+    Every distinct combination of labels is passed once to sklearn, with its count as the sample weight.
+
+    Args:
+        y_true: Distinct actual values.
+        y_pred: Distinct predicted values.
+        counts: Number of samples, or sum of sample weights, of each combination.
+        beta: The strength of recall versus precision in the F-score.
+        labels: The set of labels to include when ``average != 'binary'``.
+        pos_label: The class to report if ``average='binary'`` and the data is binary.
+        average: {'binary', 'micro', 'macro', 'samples', 'weighted'}, default=None
+        warn_for: This determines which warnings will be made in the case that this
+            function is being used to return only one of its metrics.
+        weighted: Whether the counts are sums of sample weights. If not, the support is returned as integers.
+        zero_division: "warn", 0 or 1, default="warn"
 
-    loaded_data = cloudpickle.loads(precision_recall_fscore_support_anon_sproc(session))
-    res: Union[
-        Tuple[float, float, float, None],
-        Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]],
-    ] = loaded_data[:4]
-    warning = loaded_data[-1]
-    if warning:
-        warnings.warn(warning.message, category=warning.category)
-    return res
+    Returns:
+        Tuple of precision, recall, F-beta score and support.
+    """
+    if y_true.shape[1] == 1:
+        y_true, y_pred = y_true[:, 0], y_pred[:, 0]
+
+    p, r, f, s = metrics.precision_recall_fscore_support(
+        y_true,
+        y_pred,
+        beta=beta,
+        labels=labels,
+        pos_label=pos_label,
+        average=average,
+        warn_for=warn_for,
+        sample_weight=counts,
+        zero_division=zero_division,
+    )
+    if s is not None and not weighted:
+        s = np.rint(s).astype(np.int_)
+    return p, r, f, s
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -953,38 +990,3 @@ def recall_score(
         zero_division=zero_division,
     )
     return r
-
-
-def _weighted_sum(
-    *,
-    df: snowpark.DataFrame,
-    sample_score_column: snowpark.Column,
-    sample_weight_column: Optional[snowpark.Column] = None,
-    normalize: bool = False,
-    statement_params: Dict[str, str],
-) -> float:
-    """Weighted sum of the sample score column.
-
-    Args:
-        df: Input dataframe.
-        sample_score_column: Sample score column.
-        sample_weight_column: Sample weight column.
-        normalize: If ``False``, return the weighted sum.
-            Otherwise, return the fraction of weighted sum.
-        statement_params: Dictionary used for tagging queries for tracking purposes.
-
-    Returns:
-        If ``normalize == True``, return the fraction of weighted sum (float),
-        else returns the weighted sum (int).
-    """
-    if normalize:
-        if sample_weight_column is not None:
-            res = F.sum(sample_score_column * sample_weight_column) / F.sum(sample_weight_column)
-        else:
-            res = F.avg(sample_score_column)
-    elif sample_weight_column is not None:
-        res = F.sum(sample_score_column * sample_weight_column)
-    else:
-        res = F.sum(sample_score_column)
-
-    return float(df.select(res).collect(statement_params=statement_params)[0][0])
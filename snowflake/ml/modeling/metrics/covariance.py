@@ -1,12 +1,11 @@
 from typing import Collection, Optional
 
-import cloudpickle
 import numpy as np
 import pandas as pd
 
 from snowflake.ml._internal import telemetry
 from snowflake.ml.modeling.metrics import metrics_utils
-from snowflake.snowpark import DataFrame, functions as F
+from snowflake.snowpark import DataFrame
 
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
@@ -45,50 +44,19 @@ def covariance(*, df: DataFrame, columns: Optional[Collection[str]] = None, ddof
     Returns:
         Covariance matrix in pandas.DataFrame format.
     """
-    assert df._session is not None
-    session = df._session
     statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
 
     input_df, columns = metrics_utils.validate_and_return_dataframe_and_columns(df=df, columns=columns)
     count = input_df.count(statement_params=statement_params)
 
-    # Register UDTFs.
-    sharded_dot_and_sum_computer = metrics_utils.register_sharded_dot_sum_computer(
-        session=session, statement_params=statement_params
-    )
-    sharded_dot_and_sum_computer_udtf = F.table_function(sharded_dot_and_sum_computer)
-    accumulator = metrics_utils.register_accumulator_udtf(session=session, statement_params=statement_params)
-    accumulator_udtf = F.table_function(accumulator)
-
-    # Compute the confusion matrix.
-    temp_df1 = input_df.select(F.array_construct(*input_df.columns).alias("ARR_COL"))
-    temp_df2 = temp_df1.select(
-        sharded_dot_and_sum_computer_udtf(F.col("ARR_COL"), F.lit(count), F.lit(ddof))
-    ).with_column_renamed("RESULT", "RES")
-    res_df = temp_df2.select(accumulator_udtf(F.col("RES")).over(partition_by="PART"), F.col("PART"))
-    results = res_df.collect(statement_params=statement_params)
+    dot_prod, sum_arr = metrics_utils.dot_and_sum(input_df=input_df, count=count, statement_params=statement_params)
 
     # The below computation can be moved to a third udtf. But there is not much benefit in terms of client side
     # resource consumption as the below computation is very fast (< 1 sec for 1000 cols). Memory is in the same order
     # as the resultant covariance matrix.
-    # Pushing this to a udtf requires creating a temp udtf which takes about 20 secs, so it doesn't make sense
-    # to have this in a udtf.
-    n_cols = len(columns)
-    sum_by_count = np.zeros(n_cols)
-    sum_by_countd = np.zeros(n_cols)
-    term1 = np.zeros((n_cols, n_cols))
-    # Get sum and dot prod from the results.
-    for i in range(len(results)):
-        x = results[i]
-        if x[1] == "sum_by_count":
-            sum_by_count = cloudpickle.loads(x[0])
-        elif x[1] == "sum_by_countd":
-            sum_by_countd = cloudpickle.loads(x[0])
-        else:
-            row = int(x[1].strip("row_"))
-            term1[row, :] = cloudpickle.loads(x[0])
-    if ddof == 0:
-        sum_by_countd = sum_by_count
+    term1 = dot_prod / (count - ddof)
+    sum_by_count = sum_arr / count
+    sum_by_countd = sum_arr / (count - ddof)
 
     term2 = np.matmul(sum_by_count[:, np.newaxis], sum_by_countd[:, np.newaxis].T)
     term3 = term2.T
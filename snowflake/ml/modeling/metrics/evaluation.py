@@ -0,0 +1,288 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from snowflake import snowpark
+from snowflake.ml._internal import telemetry
+from snowflake.ml.modeling.metrics import classification, metrics_utils, ranking
+from snowflake.snowpark import functions as F, types as T
+
+_PROJECT = "ModelDevelopment"
+_SUBPROJECT = "Metrics"
+
+_Y_TRUE = "Y_TRUE"
+_BIN = "BIN"
+_WEIGHT = "WEIGHT"
+_SUM_PROBA = "SUM_PROBA"
+_MIN_PROBA = "MIN_PROBA"
+_MAX_PROBA = "MAX_PROBA"
+_LOSS = "LOSS"
+
+# Metrics derived from the counts of distinct label pairs, which require the y pred column.
+_LABEL_METRICS = ("accuracy", "precision", "recall", "f1", "confusion_matrix")
+# Metrics derived from the predicted probabilities, which require the y proba column(s).
+_PROBA_METRICS = ("log_loss", "roc_auc", "calibration")
+
+
+@telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
+def evaluate(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_pred_col_name: Optional[str] = None,
+    y_proba_col_names: Optional[Union[str, List[str]]] = None,
+    sample_weight_col_name: Optional[str] = None,
+    metrics: Optional[Iterable[str]] = None,
+    labels: Optional[npt.ArrayLike] = None,
+    pos_label: Union[str, int] = 1,
+    average: Optional[str] = "binary",
+    n_bins: int = 5,
+) -> Dict[str, Any]:
+    """
+    Compute an evaluation report of a scored dataframe.
+
+    Every requested metric is derived from a minimal set of aggregate queries,
+    which run concurrently:
+    * the (weighted) counts of the distinct pairs of y true and y pred values,
+      for 'accuracy', 'precision', 'recall', 'f1' and 'confusion_matrix';
+    * the sums of weights, probabilities and log losses by y true value and
+      probability bin, for 'log_loss' and 'calibration';
+    * the area under the ROC curve, for 'roc_auc'.
+
+    The metrics are equal to the results of the corresponding functions of
+    this package. Without sample weights, 'calibration' is equal to
+    `sklearn.calibration.calibration_curve` with the 'uniform' strategy. With
+    sample weights, which `calibration_curve` does not support, the fraction
+    of positives and the mean predicted probability of each bin are weighted
+    by them, and the bins of zero total weight are left out.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing actual values.
+        y_pred_col_name: Column name representing predicted values.
+        y_proba_col_names: Column name(s) representing predicted probabilities.
+            A single column holds the probability of the positive class, i.e.
+            the greater label, of a binary target. Otherwise, there must be one
+            column per class, in sorted order of class.
+        sample_weight_col_name: Column name representing sample weights.
+        metrics: Names of the metrics to compute, among 'accuracy', 'precision',
+            'recall', 'f1', 'confusion_matrix', 'log_loss', 'roc_auc' and
+            'calibration'. By default, every metric supported by the given
+            columns is computed.
+        labels: The set of labels of 'precision', 'recall', 'f1',
+            'confusion_matrix' and 'log_loss'. See the corresponding functions.
+        pos_label: The class to report by 'precision', 'recall' and 'f1' if
+            ``average='binary'`` and the data is binary.
+        average: {'micro', 'macro', 'samples', 'weighted', 'binary'} or None, default='binary'
+            The averaging of 'precision', 'recall' and 'f1'.
+        n_bins: Number of equal-width bins of [0, 1] of 'calibration'.
+
+    Returns:
+        Dictionary mapping the name of each metric to its value. The value of
+        'calibration' is a tuple of the fraction of positives and the mean
+        predicted probability of each non-empty bin.
+
+    Raises:
+        ValueError: An unknown metric is given.
+        ValueError: A metric is requested without the columns it requires.
+        ValueError: 'roc_auc' or 'calibration' is requested for a target that is not binary.
+        ValueError: 'calibration' is requested for probabilities outside of [0, 1].
+    """
+    y_proba_cols = metrics_utils.flatten_cols([y_proba_col_names])
+    available_metrics = (_LABEL_METRICS if y_pred_col_name else ()) + (_PROBA_METRICS if y_proba_cols else ())
+    metric_names = list(available_metrics) if metrics is None else list(metrics)
+    unknown_metrics = [name for name in metric_names if name not in _LABEL_METRICS + _PROBA_METRICS]
+    if unknown_metrics:
+        raise ValueError(
+            f"Unknown metrics {unknown_metrics}. Supported metrics are {list(_LABEL_METRICS + _PROBA_METRICS)}."
+        )
+    unavailable_metrics = [name for name in metric_names if name not in available_metrics]
+    if unavailable_metrics:
+        raise ValueError(
+            f"Metrics {unavailable_metrics} require the column(s) of "
+            f"{'predicted values' if unavailable_metrics[0] in _LABEL_METRICS else 'predicted probabilities'}."
+        )
+    if len(y_proba_cols) > 1 and any(name in metric_names for name in ("roc_auc", "calibration")):
+        raise ValueError("'roc_auc' and 'calibration' are only supported for a single column of probabilities.")
+
+    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+
+    # Submit every query before waiting on any of them.
+    label_counts_job = None
+    if any(name in metric_names for name in _LABEL_METRICS):
+        assert y_pred_col_name is not None
+        label_counts_job = metrics_utils.confusion_counts_df(
+            df=df,
+            y_true_col_names=[y_true_col_name],
+            y_pred_col_names=[y_pred_col_name],
+            sample_weight_col_name=sample_weight_col_name,
+        ).to_pandas(statement_params=statement_params, block=False)
+    proba_statistics_job = None
+    if any(name in metric_names for name in _PROBA_METRICS):
+        proba_statistics_job = _proba_statistics_df(
+            df=df,
+            y_true_col_name=y_true_col_name,
+            y_proba_col_names=y_proba_cols,
+            sample_weight_col_name=sample_weight_col_name,
+            n_bins=n_bins,
+        ).to_pandas(statement_params=statement_params, block=False)
+    roc_auc_job = None
+    if "roc_auc" in metric_names:
+        # The positive class is the greater label, as in `roc_auc_score`.
+        curve_df = ranking._binary_clf_curve(
+            df=df,
+            y_true_col_name=y_true_col_name,
+            y_score_col_name=y_proba_cols[0],
+            pos_label=F.max(F.col(y_true_col_name)).over(),
+            sample_weight_col_name=sample_weight_col_name,
+            statement_params=statement_params,
+        )
+        roc_auc_job = ranking._roc_auc_statistics_df(curve_df=curve_df).collect(
+            statement_params=statement_params, block=False
+        )
+
+    res: Dict[str, Any] = {}
+    if label_counts_job is not None:
+        y_true, y_pred, counts = metrics_utils.split_confusion_counts(label_counts_job.result(), 1)
+        if "accuracy" in metric_names:
+            res["accuracy"] = classification._accuracy_score_from_counts(
+                y_true=y_true, y_pred=y_pred, counts=counts, normalize=True
+            )
+        if "confusion_matrix" in metric_names:
+            res["confusion_matrix"] = classification._confusion_matrix_from_counts(
+                y_true=y_true[:, 0], y_pred=y_pred[:, 0], counts=counts, labels=labels
+            )
+        fscore_metrics = [name for name in ("precision", "recall", "f1") if name in metric_names]
+        if fscore_metrics:
+            p, r, f, _ = classification._precision_recall_fscore_support_from_counts(
+                y_true=y_true,
+                y_pred=y_pred,
+                counts=counts,
+                labels=labels,
+                pos_label=pos_label,
+                average=average,
+                warn_for=tuple(name if name != "f1" else "f-score" for name in fscore_metrics),
+                weighted=sample_weight_col_name is not None,
+            )
+            for name, value in (("precision", p), ("recall", r), ("f1", f)):
+                if name in fscore_metrics:
+                    res[name] = value
+
+    if proba_statistics_job is not None:
+        statistics = proba_statistics_job.result()
+        if "log_loss" in metric_names:
+            by_label = statistics.groupby(_Y_TRUE, sort=True)[
+                [_WEIGHT, *[f"{_LOSS}_{i}" for i in range(max(len(y_proba_cols), 2))]]
+            ].sum()
+            res["log_loss"] = classification._log_loss_from_statistics(
+                y_true=by_label.index.to_numpy(),
+                losses=by_label.iloc[:, 1:].to_numpy(dtype=np.float64),
+                weights=by_label[_WEIGHT].to_numpy(dtype=np.float64),
+                labels=labels,
+            )
+        classes = np.sort(statistics[_Y_TRUE].unique())
+        if "roc_auc" in metric_names or "calibration" in metric_names:
+            if len(classes) != 2:
+                raise ValueError(
+                    f"'roc_auc' and 'calibration' are only supported for binary targets, got classes {classes}."
+                )
+        if "calibration" in metric_names:
+            res["calibration"] = _calibration_curve_from_statistics(statistics=statistics, pos_label=classes[1])
+
+    if roc_auc_job is not None:
+        res["roc_auc"] = ranking._roc_auc_from_statistics(roc_auc_job.result()[0])  # type: ignore[union-attr]
+
+    return {name: res[name] for name in metric_names}
+
+
+def _proba_statistics_df(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_proba_col_names: List[str],
+    sample_weight_col_name: Optional[str],
+    n_bins: int,
+) -> snowpark.DataFrame:
+    """Builds the aggregate query of the statistics of the predicted probabilities.
+
+    Samples with a null label or probability are ignored. The samples are grouped by actual value, and by bin of
+    probability for a single column of probabilities. The bins follow `sklearn.calibration.calibration_curve`: a
+    probability is in the bin of the number of edges of `np.linspace(0, 1, n_bins + 1)[1:-1]` below it. The bin is
+    taken from `floor(p * n_bins)` and moved by one where rounding puts it on the other side of an edge.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing actual values.
+        y_proba_col_names: Column names representing predicted probabilities.
+        sample_weight_col_name: Column name representing sample weights.
+        n_bins: Number of equal-width bins of [0, 1].
+
+    Returns:
+        Dataframe with columns [Y_TRUE, BIN, WEIGHT, SUM_PROBA, MIN_PROBA, MAX_PROBA, LOSS_0, ..., LOSS_k] where the
+        LOSS columns are the sum of the weighted log loss of each class.
+
+    Raises:
+        ValueError: ``n_bins`` is not a positive integer.
+    """
+    if n_bins < 1:
+        raise ValueError(f"n_bins must be a positive integer, but got {n_bins}.")
+
+    condition = F.col(y_true_col_name).is_not_null()
+    for col in y_proba_col_names:
+        condition = condition & F.col(col).is_not_null()
+    weight = F.col(sample_weight_col_name) if sample_weight_col_name else F.lit(1)
+    losses = classification._log_loss_columns(y_pred_col_names=y_proba_col_names, eps=float(np.finfo(np.float64).eps))
+
+    if len(y_proba_col_names) == 1:
+        proba = F.col(y_proba_col_names[0]).cast(T.DoubleType())
+        # The k-th edge of np.linspace is k * step, which is not always the double closest to k / n_bins.
+        step = F.lit(1.0 / n_bins)
+        bin_floor = F.greatest(F.least(F.floor(proba * F.lit(n_bins)), F.lit(n_bins - 1)), F.lit(0))
+        bin_key = bin_floor - F.iff(proba <= bin_floor * step, 1, 0) + F.iff(proba > (bin_floor + 1) * step, 1, 0)
+        bin_key = F.greatest(F.least(bin_key, F.lit(n_bins - 1)), F.lit(0))
+    else:
+        proba = F.lit(None).cast(T.DoubleType())
+        bin_key = F.lit(0)
+    sample_df = df.filter(condition).select(
+        F.col(y_true_col_name).alias(_Y_TRUE),
+        bin_key.alias(_BIN),
+        weight.alias("_WEIGHT"),
+        (weight * proba).alias("_WEIGHTED_PROBA"),
+        proba.alias("_PROBA"),
+        *[(weight * loss).alias(f"_{_LOSS}_{i}") for i, loss in enumerate(losses)],
+    )
+    return sample_df.group_by(_Y_TRUE, _BIN).agg(
+        F.sum("_WEIGHT").alias(_WEIGHT),
+        F.sum("_WEIGHTED_PROBA").alias(_SUM_PROBA),
+        F.min("_PROBA").alias(_MIN_PROBA),
+        F.max("_PROBA").alias(_MAX_PROBA),
+        *[F.sum(f"_{_LOSS}_{i}").alias(f"{_LOSS}_{i}") for i in range(len(losses))],
+    )
+
+
+def _calibration_curve_from_statistics(
+    *, statistics: pd.DataFrame, pos_label: Any
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Calibration curve of the statistics built by `_proba_statistics_df`.
+
+    Args:
+        statistics: Result of the query built by `_proba_statistics_df`.
+        pos_label: The label of the positive class.
+
+    Returns:
+        Tuple of the fraction of positives and the mean predicted probability of each non-empty bin.
+
+    Raises:
+        ValueError: The probabilities are not in [0, 1].
+    """
+    if statistics[_MIN_PROBA].min() < 0 or statistics[_MAX_PROBA].max() > 1:
+        raise ValueError("y_prob has values outside [0, 1].")
+
+    statistics = statistics.assign(**{_Y_TRUE: (statistics[_Y_TRUE] == pos_label) * statistics[_WEIGHT]})
+    bins = statistics.groupby(_BIN, sort=True)[[_Y_TRUE, _SUM_PROBA, _WEIGHT]].sum()
+    bins = bins[bins[_WEIGHT] != 0]
+    prob_true = (bins[_Y_TRUE] / bins[_WEIGHT]).to_numpy(dtype=np.float64)
+    prob_pred = (bins[_SUM_PROBA] / bins[_WEIGHT]).to_numpy(dtype=np.float64)
+    return prob_true, prob_pred
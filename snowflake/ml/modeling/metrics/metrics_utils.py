@@ -1,8 +1,22 @@
+import io
 import math
-from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple, Union
+import threading
+import weakref
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import cloudpickle
 import numpy as np
+import numpy.typing as npt
+import pandas as pd
 
 import snowflake.snowpark._internal.utils as snowpark_utils
 from snowflake import snowpark
@@ -10,10 +24,87 @@ from snowflake.snowpark import Session, functions as F, types as T
 
 LABEL = "LABEL"
 INDEX = "INDEX"
+COUNT = "COUNT"
+
+# Upper bound of the number of values in a shard of the sharded dot and sum computer. Shards are loaded in memory as
+# float64 arrays, which bounds the memory used by each partition to about 200MB. Shards are never smaller than the
+# partial dot product that they emit, so that the partial results are never larger than the input. Only tables of more
+# than about 7000 columns have larger shards.
+MAX_VALUES_PER_SHARD = 25_000_000
+# Number of columns in each block of the dot product computed by the sharded dot and sum computer. Blocks bound the
+# memory used by the partial results of the dot product of very wide tables.
+COLUMN_BLOCK_SIZE = 1000
+
+# Names of the temporary UDTFs registered in each session. Registering a temporary UDTF takes several seconds, so they
+# are registered once per session, schema, handler and package set, and reused by subsequent metric calls.
+_UDTF_REGISTRY: "weakref.WeakKeyDictionary[Session, Dict[Hashable, str]]" = weakref.WeakKeyDictionary()
+_UDTF_REGISTRY_LOCK = threading.Lock()
+
+
+def register_cached_udtf(
+    *,
+    session: Session,
+    handler: type,
+    handler_key: Hashable,
+    output_schema: Union[T.StructType, T.PandasDataFrameType],
+    packages: List[str],
+    statement_params: Dict[str, Any],
+    input_types: Optional[List[T.DataType]] = None,
+) -> str:
+    """Registers a temporary UDTF in Snowflake unless it has already been registered in the session.
+
+    Handlers are usually classes defined in the scope of a registration function, so they are identified by
+    `handler_key` instead of the class itself. The key must capture every value the handler depends on, e.g. the
+    registration function and any parameter bound in its scope.
+
+    Args:
+        session: Snowpark session.
+        handler: UDTF handler class.
+        handler_key: Hashable identity of the handler.
+        output_schema: Output schema of the UDTF.
+        packages: Packages required by the handler.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+        input_types: Input types of the UDTF.
+
+    Returns:
+        Name of the UDTF.
+    """
+    key = (handler_key, frozenset(packages), session.get_fully_qualified_current_schema())
+    with _UDTF_REGISTRY_LOCK:
+        session_udtfs = _UDTF_REGISTRY.setdefault(session, {})
+        if key in session_udtfs:
+            return session_udtfs[key]
+
+        udtf_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.TABLE_FUNCTION)
+        session.udtf.register(
+            handler,
+            output_schema=output_schema,
+            input_types=input_types,
+            packages=packages,
+            name=udtf_name,
+            is_permanent=False,
+            replace=True,
+            statement_params=statement_params,
+        )
+        session_udtfs[key] = udtf_name
+        return udtf_name
+
+
+def ndarray_from_bytes(data: bytes) -> npt.NDArray[Any]:
+    """Deserializes an array serialized in the NPY binary format, i.e. a dtype and shape header followed by the raw
+    buffer, as emitted by the UDTFs of this module.
+
+    Args:
+        data: Serialized array.
+
+    Returns:
+        Deserialized array.
+    """
+    return np.load(io.BytesIO(data), allow_pickle=False)  # type: ignore[no-any-return]
 
 
 def register_accumulator_udtf(*, session: Session, statement_params: Dict[str, Any]) -> str:
-    """Registers accumulator UDTF in Snowflake and returns the name of the UDTF.
+    """Registers accumulator UDTF in Snowflake, once per session, and returns the name of the UDTF.
 
     Args:
         session: Snowpark session.
@@ -24,49 +115,52 @@ def register_accumulator_udtf(*, session: Session, statement_params: Dict[str, A
     """
 
     class Accumulator:
-        """This class is registered as a UDTF. It accumulates all the rows passed to the UDTF."""
+        """This class is registered as a UDTF. It sums the arrays of all the rows of a partition.
 
-        def __init__(self) -> None:
-            self._accumulated_row = None
+        The rows are summed one at a time into a running sum, so that the memory of a partition is bounded by the size
+        of a single array regardless of the number of rows. Arrays are serialized in the NPY binary format, and the sum
+        is emitted as a single array in the same format.
+        """
 
-        def process(self, input_row: bytes) -> None:
-            """Accumulates rows.
+        def __init__(self) -> None:
+            self._accumulated_array: Optional[npt.NDArray[np.float_]] = None
 
-            Args:
-                input_row: numpy array serialized using cloudpickle.
-            """
-            row = cloudpickle.loads(input_row)
-            if self._accumulated_row is None:
-                self._accumulated_row = row
+        def process(self, data: bytes) -> None:
+            array = np.load(io.BytesIO(data), allow_pickle=False)
+            if self._accumulated_array is None:
+                self._accumulated_array = array
             else:
-                self._accumulated_row = self._accumulated_row + row
+                self._accumulated_array += array
 
         def end_partition(self) -> Iterable[Tuple[bytes]]:
-            yield (cloudpickle.dumps(self._accumulated_row),)
-
-    accumulator = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.TABLE_FUNCTION)
-    session.udtf.register(
-        Accumulator,
-        output_schema=T.StructType(
-            [
-                T.StructField("result", T.BinaryType()),
-            ]
-        ),
+            # The handlers of the UDTFs serialize arrays inline rather than through a helper of this module: they are
+            # pickled by value and run where only their registered packages are installed, so a reference to this
+            # module would fail to import there.
+            buffer = io.BytesIO()
+            np.save(buffer, self._accumulated_array, allow_pickle=False)
+            yield (buffer.getvalue(),)
+
+    return register_cached_udtf(
+        session=session,
+        handler=Accumulator,
+        handler_key=register_accumulator_udtf,
+        output_schema=T.StructType([T.StructField("RESULT", T.BinaryType())]),
         input_types=[T.BinaryType()],
-        packages=["numpy", "cloudpickle"],
-        name=accumulator,
-        is_permanent=False,
-        replace=True,
+        packages=["numpy"],
         statement_params=statement_params,
     )
-    return accumulator
 
 
-def register_sharded_dot_sum_computer(*, session: Session, statement_params: Dict[str, Any]) -> str:
-    """Registers dot and sum computation UDTF in Snowflake and returns the name of the UDTF.
+def register_sharded_dot_sum_computer(
+    *, session: Session, n_cols: int, block_size: int, statement_params: Dict[str, Any]
+) -> str:
+    """Registers dot and sum computation UDTF in Snowflake, once per session, number of columns and block size, and
+    returns the name of the UDTF.
 
     Args:
         session: Snowpark session.
+        n_cols: Number of input columns.
+        block_size: Number of columns in each block of the dot product.
         statement_params: Dictionary used for tagging queries for tracking purposes.
 
     Returns:
@@ -74,107 +168,121 @@ def register_sharded_dot_sum_computer(*, session: Session, statement_params: Dic
     """
 
     class ShardedDotAndSumComputer:
-        """This class is registered as a UDTF and computes the sum and dot product
+        """This class is registered as a vectorized UDTF and computes the sum and dot product
         of columns for each partition of rows. The computations across all the partitions happens
-        in parallel using the nodes in the warehouse. In order to avoid keeping the entire partition
-        in memory, we batch the rows (size is 1000) and maintain a running sum and dot prod in self._sum_by_count,
-        self._sum_by_countd and self._dot_prod respectively. We return these at the end of the partition.
+        in parallel using the nodes in the warehouse. Each partition is received as a float64 DataFrame.
+
+        The columns are split into blocks of `block_size` columns. Since the dot product matrix is symmetric, only
+        the blocks (i, j) with i <= j are computed, each one emitted as a separate row identified by
+        i * n_blocks + j, so that the output of a partition is never materialized as a whole. The column sums are
+        emitted in a row identified by -1. Arrays are serialized in the NPY binary format.
         """
 
-        def __init__(self) -> None:
-            self._variables_initialized = False
-            # 2d array containing pairwise dot product of all columns - sum(col1*col2/num_rows).
-            self._dot_prod = np.zeros((1, 1))
-            # number of rows
-            self._count = 0
-            # delta degree of freedom
-            self._ddof = 0
-            # Setting the batch size to 1000 based on experimentation. Can be fine tuned later.
-            self._batch_size = 1000
-            # 2d array containing a batch of input rows. A batch contains self._batch_size rows.
-            self._batched_rows = np.zeros((self._batch_size, 1))
-            # 1d array of length = # of cols. Contains sum(col/count) for each column.
-            self._sum_by_count = np.zeros(1)
-            # 1d array of length = # of cols. Contains sum(col/(count-ddof)) for each column.
-            self._sum_by_countd = np.zeros(1)
-            # Number of columns in the dataset.
-            self._n_cols = -1
-            # Running count of number of rows added to self._batched_rows.
-            self._cur_count = 0
-            # Square root of count - ddof
-            self._sqrt_count_d = -1.0
-
-        def process(self, input_row: List[float], count: int, ddof: int) -> None:
-            """Computes sum and dot product.
-
-            Args:
-                input_row: List of floats.
-                count: Number of rows in the table.
-                ddof: delta degree of freedom
-            """
-            # 1. initialization of variables
-            if not self._variables_initialized:
-                self._n_cols = len(input_row)
-                self._count = count
-                self._ddof = ddof
-                self._sqrt_count_d = math.sqrt(self._count - self._ddof)
-                self._sum_by_count = np.zeros(self._n_cols)
-                self._sum_by_countd = np.zeros(self._n_cols)
-                self._batched_rows = np.zeros((self._batch_size, self._n_cols))
-                self._dot_prod = np.zeros((self._n_cols, self._n_cols))
-            self._variables_initialized = True
-
-            self._batched_rows[self._cur_count, :] = input_row
-            self._cur_count += 1
-
-            # 2. Compute incremental sum and dot_prod for the batch.
-            if self._cur_count >= self._batch_size:
-                self.accumulate_batch_sum_and_dot_prod()
-                self._cur_count = 0
-
-        def end_partition(self) -> Iterable[Tuple[bytes, str]]:
-            # 3. Compute sum and dot_prod for the remaining rows in the batch.
-            if self._cur_count > 0:
-                self.accumulate_batch_sum_and_dot_prod()
-            for i in range(self._n_cols):
-                yield (cloudpickle.dumps(self._dot_prod[i, :]), "row_" + str(i))
-            yield (cloudpickle.dumps(self._sum_by_count), "sum_by_count")
-            if self._ddof != 0:
-                yield (cloudpickle.dumps(self._sum_by_countd), "sum_by_countd")
-
-        def accumulate_batch_sum_and_dot_prod(self) -> None:
-            rows_by_sqrt_countd = self._batched_rows / self._sqrt_count_d
-            self._dot_prod += np.einsum(
-                "nt, nm -> tm",
-                rows_by_sqrt_countd[0 : self._cur_count, :],
-                rows_by_sqrt_countd[0 : self._cur_count, :],
-                optimize="optimal",
-            )
-            rows_by_count = self._batched_rows / self._count
-            self._sum_by_count += np.sum(rows_by_count[0 : self._cur_count, :], axis=0)
-            if self._ddof != 0:
-                rows_by_count_d = self._batched_rows / (self._count - self._ddof)
-                self._sum_by_countd += np.sum(rows_by_count_d[0 : self._cur_count, :], axis=0)
-
-    sharded_dot_and_sum_computer = snowpark_utils.random_name_for_temp_object(
-        snowpark_utils.TempObjectType.TABLE_FUNCTION
-    )
-    session.udtf.register(
-        ShardedDotAndSumComputer,
-        output_schema=T.StructType(
-            [
-                T.StructField("result", T.BinaryType()),
-                T.StructField("part", T.StringType()),
-            ]
-        ),
-        input_types=[T.ArrayType(), T.IntegerType(), T.IntegerType()],
-        packages=["numpy", "cloudpickle"],
-        name=sharded_dot_and_sum_computer,
-        is_permanent=False,
-        replace=True,
+        def end_partition(self, df: pd.DataFrame) -> Iterable[pd.DataFrame]:
+            rows = df.to_numpy(dtype=np.float64)
+            n_blocks = math.ceil(rows.shape[1] / block_size)
+            blocks = [np.ascontiguousarray(rows[:, i * block_size : (i + 1) * block_size]) for i in range(n_blocks)]
+            for i in range(n_blocks):
+                for j in range(i, n_blocks):
+                    # X.T @ X on the same contiguous array is computed with the symmetric rank-k update of BLAS.
+                    dot_prod = blocks[i].T @ blocks[i] if i == j else blocks[i].T @ blocks[j]
+                    yield pd.DataFrame({"BLOCK": [i * n_blocks + j], "RESULT": [self._to_bytes(dot_prod)]})
+            yield pd.DataFrame({"BLOCK": [-1], "RESULT": [self._to_bytes(rows.sum(axis=0))]})
+
+        @staticmethod
+        def _to_bytes(arr: npt.NDArray[np.float_]) -> bytes:
+            buffer = io.BytesIO()
+            np.save(buffer, arr, allow_pickle=False)
+            return buffer.getvalue()
+
+    return register_cached_udtf(
+        session=session,
+        handler=ShardedDotAndSumComputer,
+        handler_key=(register_sharded_dot_sum_computer, n_cols, block_size),
+        output_schema=T.PandasDataFrameType([T.IntegerType(), T.BinaryType()], ["BLOCK", "RESULT"]),
+        input_types=[T.PandasDataFrameType([T.DoubleType()] * n_cols)],
+        packages=["numpy", "pandas"],
         statement_params=statement_params,
     )
-    return sharded_dot_and_sum_computer
+
+
+def dot_and_sum(
+    *, input_df: snowpark.DataFrame, count: int, statement_params: Dict[str, Any]
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Computes the pairwise dot product and the sum of all the columns of a dataframe.
+
+    The rows are randomly split into shards of at most `MAX_VALUES_PER_SHARD` values, which are processed in parallel
+    by the sharded dot and sum computer. It computes the upper triangular blocks of `COLUMN_BLOCK_SIZE` columns of the
+    dot product, which are summed over all the shards by the accumulator, in a separate partition for each block.
+    The full symmetric matrix is then reconstructed on the client.
+
+    Args:
+        input_df: Input dataframe with numeric columns.
+        count: Number of rows in the dataframe.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Tuple containing following items
+            dot_prod - array of shape (n_cols, n_cols)
+                Pairwise dot product of all columns.
+            sum_arr - array of shape (n_cols,)
+                Sum of each column.
+    """
+    session = input_df._session
+    assert session is not None
+    n_cols = len(input_df.columns)
+    block_size = COLUMN_BLOCK_SIZE
+    sharded_dot_and_sum_computer_udtf = F.table_function(
+        register_sharded_dot_sum_computer(
+            session=session, n_cols=n_cols, block_size=block_size, statement_params=statement_params
+        )
+    )
+    accumulator_udtf = F.table_function(register_accumulator_udtf(session=session, statement_params=statement_params))
+
+    n_shards = _num_dot_and_sum_shards(count=count, n_cols=n_cols, block_size=block_size)
+    shard_df = input_df.select(
+        sharded_dot_and_sum_computer_udtf(*[F.col(c).cast(T.DoubleType()) for c in input_df.columns]).over(
+            partition_by=F.uniform(0, n_shards - 1, F.random())
+        )
+    )
+    res_df = shard_df.select(accumulator_udtf(F.col("RESULT")).over(partition_by="BLOCK"), F.col("BLOCK"))
+    results = res_df.collect(statement_params=statement_params)
+
+    n_blocks = math.ceil(n_cols / block_size)
+    dot_prod = np.zeros((n_cols, n_cols))
+    sum_arr = np.zeros(n_cols)
+    for result, block in results:
+        if block == -1:
+            sum_arr = ndarray_from_bytes(result)
+            continue
+        i, j = divmod(block, n_blocks)
+        rows = slice(i * block_size, (i + 1) * block_size)
+        cols = slice(j * block_size, (j + 1) * block_size)
+        dot_prod[rows, cols] = ndarray_from_bytes(result)
+        dot_prod[cols, rows] = dot_prod[rows, cols].T
+    return dot_prod, sum_arr
+
+
+def _num_dot_and_sum_shards(*, count: int, n_cols: int, block_size: int) -> int:
+    """Number of shards of the rows processed by the sharded dot and sum computer.
+
+    Shards hold at most `MAX_VALUES_PER_SHARD` values, but at least as many values as the upper triangular blocks and
+    the sums that each of them emits, so that the partial results exchanged with the accumulator are never larger than
+    the input, even for wide tables of few rows.
+
+    Args:
+        count: Number of rows.
+        n_cols: Number of columns.
+        block_size: Number of columns in each block of the dot product.
+
+    Returns:
+        Number of shards, at least 1.
+    """
+    block_widths = [min(block_size, n_cols - start) for start in range(0, n_cols, block_size)]
+    n_output_values = n_cols + sum(w_i * w_j for i, w_i in enumerate(block_widths) for w_j in block_widths[i:])
+    min_rows_per_shard = math.ceil(n_output_values / n_cols)
+    max_rows_per_shard = max(MAX_VALUES_PER_SHARD // n_cols, min_rows_per_shard)
+    return max(min(math.ceil(count / max_rows_per_shard), count // min_rows_per_shard), 1)
 
 
 def validate_and_return_dataframe_and_columns(
@@ -270,3 +378,89 @@ def unique_labels(
     assert union_df is not None
     res: snowpark.DataFrame = union_df.with_column(INDEX, F.dense_rank().over(snowpark.Window.order_by(LABEL)) - 1)
     return res
+
+
+def confusion_counts(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_names: List[str],
+    y_pred_col_names: List[str],
+    sample_weight_col_name: Optional[str] = None,
+    statement_params: Optional[Dict[str, Any]] = None,
+) -> Tuple[npt.NDArray[Any], npt.NDArray[Any], npt.NDArray[Any]]:
+    """Computes the (weighted) count of every distinct combination of y true and y pred values.
+
+    The counts are computed in a single aggregate query grouped by the label columns, so that only one row per
+    observed combination is brought to the client. Since every classification metric based on the confusion of labels
+    is a weighted sum over samples, computing the metric on the returned rows, weighted by their counts, gives the same
+    result as computing it on the whole dataset.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_names: Column names representing actual values.
+        y_pred_col_names: Column names representing predicted values.
+        sample_weight_col_name: Column name representing sample weights.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Tuple containing following items
+            y_true - array of shape (n_combinations, len(y_true_col_names))
+                Distinct actual values.
+            y_pred - array of shape (n_combinations, len(y_pred_col_names))
+                Distinct predicted values aligned with `y_true`.
+            counts - array of shape (n_combinations,)
+                Number of samples, or sum of sample weights, of each combination.
+    """
+    counts_df = confusion_counts_df(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+    )
+    return split_confusion_counts(counts_df.to_pandas(statement_params=statement_params), len(y_true_col_names))
+
+
+def confusion_counts_df(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_names: List[str],
+    y_pred_col_names: List[str],
+    sample_weight_col_name: Optional[str] = None,
+) -> snowpark.DataFrame:
+    """Builds the aggregate query of `confusion_counts`, so that it can be run asynchronously.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_names: Column names representing actual values.
+        y_pred_col_names: Column names representing predicted values.
+        sample_weight_col_name: Column name representing sample weights.
+
+    Returns:
+        Dataframe with the y true columns, the y pred columns and the COUNT column.
+    """
+    y_true_cols = [F.col(col).alias(f'"_Y_TRUE_{i}"') for i, col in enumerate(y_true_col_names)]
+    y_pred_cols = [F.col(col).alias(f'"_Y_PRED_{i}"') for i, col in enumerate(y_pred_col_names)]
+    label_df = df.select(*y_true_cols, *y_pred_cols, *([sample_weight_col_name] if sample_weight_col_name else []))
+    label_cols = label_df.columns[: len(y_true_cols) + len(y_pred_cols)]
+    count = F.sum(F.col(sample_weight_col_name)) if sample_weight_col_name else F.count(F.lit(1))
+    return label_df.group_by(label_cols).agg(count.alias(COUNT))
+
+
+def split_confusion_counts(
+    counts_df: pd.DataFrame, n_true: int
+) -> Tuple[npt.NDArray[Any], npt.NDArray[Any], npt.NDArray[Any]]:
+    """Splits the result of the query built by `confusion_counts_df` into the arrays returned by `confusion_counts`.
+
+    Args:
+        counts_df: Result of the query built by `confusion_counts_df`.
+        n_true: Number of y true columns.
+
+    Returns:
+        Tuple of the distinct actual values, predicted values and their counts.
+    """
+    n_labels = len(counts_df.columns) - 1
+    return (
+        counts_df.iloc[:, :n_true].to_numpy(),
+        counts_df.iloc[:, n_true:n_labels].to_numpy(),
+        counts_df.iloc[:, n_labels].to_numpy(dtype=np.float64),
+    )
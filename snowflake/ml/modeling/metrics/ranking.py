@@ -1,11 +1,13 @@
-from typing import List, Optional, Tuple, Union
+import warnings
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cloudpickle
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import sklearn
 from packaging import version
-from sklearn import metrics
+from sklearn import exceptions, metrics
 
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
@@ -17,6 +19,13 @@ from snowflake.snowpark._internal import utils as snowpark_utils
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
 
+_BIN = "BIN"
+_THRESHOLD = "THRESHOLD"
+_POS = "POS"
+_NEG = "NEG"
+_TPS = "TPS"
+_FPS = "FPS"
+
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
 def precision_recall_curve(
@@ -26,6 +35,7 @@ def precision_recall_curve(
     probas_pred_col_name: str,
     pos_label: Optional[Union[str, int]] = None,
     sample_weight_col_name: Optional[str] = None,
+    n_bins: Optional[int] = None,
 ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
     """
     Compute precision-recall pairs for different probability thresholds.
@@ -61,6 +71,10 @@ def precision_recall_curve(
             When ``pos_label=None``, if y_true is in {-1, 1} or {0, 1},
             ``pos_label`` is set to 1, otherwise an error will be raised.
         sample_weight_col_name: Column name representing sample weights.
+        n_bins: If ``None``, the curve is computed exactly at every distinct score.
+            Otherwise, the scores are binned into ``n_bins`` equal-width buckets and
+            the curve is computed at the lowest score of each bucket, which bounds the
+            number of thresholds of very large datasets.
 
     Returns:
         Tuple containing following items
@@ -74,47 +88,31 @@ def precision_recall_curve(
                 Increasing thresholds on the decision function used to compute
                 precision and recall.
     """
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
     statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_name, probas_pred_col_name, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
+    curve_df = _binary_clf_curve(
+        df=df,
+        y_true_col_name=y_true_col_name,
+        y_score_col_name=probas_pred_col_name,
+        pos_label=pos_label,
+        sample_weight_col_name=sample_weight_col_name,
+        n_bins=n_bins,
         statement_params=statement_params,
-        anonymous=True,
     )
-    def precision_recall_curve_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_name]
-        probas_pred = df[probas_pred_col_name]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-        precision, recall, thresholds = metrics.precision_recall_curve(
-            y_true,
-            probas_pred,
-            pos_label=pos_label,
-            sample_weight=sample_weight,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, (precision, recall, thresholds))  # type: ignore[no-any-return]
+    fps, tps, thresholds = _collect_curve(curve_df=curve_df, statement_params=statement_params)
+
+    ps = tps + fps
+    precision = np.zeros_like(tps)
+    np.divide(tps, ps, out=precision, where=(ps != 0))
 
-    result_object = result.deserialize(session, precision_recall_curve_anon_sproc(session))
-    res: Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]] = result_object
-    return res
+    if tps[-1] == 0:
+        warnings.warn("No positive class found in y_true, recall is set to one for all thresholds.")
+        recall = np.ones_like(tps)
+    else:
+        recall = tps / tps[-1]
+
+    # reverse the outputs so recall is decreasing
+    sl = slice(None, None, -1)
+    return np.hstack((precision[sl], 1)), np.hstack((recall[sl], 0)), thresholds[sl]
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -128,6 +126,7 @@ def roc_auc_score(
     max_fpr: Optional[float] = None,
     multi_class: str = "raise",
     labels: Optional[npt.ArrayLike] = None,
+    n_bins: Optional[int] = None,
 ) -> Union[float, npt.NDArray[np.float_]]:
     """
     Compute Area Under the Receiver Operating Characteristic Curve (ROC AUC)
@@ -206,10 +205,67 @@ def roc_auc_score(
         labels: Only used for multiclass targets. List of labels that index the
             classes in ``y_score``. If ``None``, the numerical or lexicographical
             order of the labels in ``y_true`` is used.
+        n_bins: Only used for binary targets. If ``None``, the area is computed exactly
+            from every distinct score. Otherwise, the scores are binned into ``n_bins``
+            equal-width buckets and the area is computed from the ROC curve at the lowest
+            score of each bucket.
 
     Returns:
         Area Under the Curve score.
+
+    Raises:
+        ValueError: Only one class is present in the y true column of a binary target.
+        ValueError: ``max_fpr`` is not in range (0, 1].
     """
+    y_true_cols = metrics_utils.flatten_cols([y_true_col_names])
+    y_score_cols = metrics_utils.flatten_cols([y_score_col_names])
+    if len(y_true_cols) == 1 and len(y_score_cols) == 1:
+        statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
+        classes, score_range = _label_classes(
+            df=df,
+            y_true_col_name=y_true_cols[0],
+            y_score_col_name=y_score_cols[0],
+            sample_weight_col_name=sample_weight_col_name,
+            statement_params=statement_params,
+        )
+    else:
+        classes = None
+
+    # Binary targets are computed from the ROC curve, entirely in SQL unless a partial AUC is requested.
+    if classes is not None and len(classes) <= 2:
+        if len(classes) < 2:
+            raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+        curve_df = _binary_clf_curve(
+            df=df,
+            y_true_col_name=y_true_cols[0],
+            y_score_col_name=y_score_cols[0],
+            pos_label=classes[1],
+            sample_weight_col_name=sample_weight_col_name,
+            n_bins=n_bins,
+            label_classes=(classes, score_range),
+            statement_params=statement_params,
+        )
+        if max_fpr is None or max_fpr == 1:
+            return _roc_auc_from_curve(curve_df=curve_df, statement_params=statement_params)
+        if max_fpr <= 0 or max_fpr > 1:
+            raise ValueError(f"Expected max_fpr in range (0, 1], got: {max_fpr!r}")
+
+        fps, tps, _ = _collect_curve(curve_df=curve_df, statement_params=statement_params)
+        fpr = np.r_[0, fps] / fps[-1]
+        tpr = np.r_[0, tps] / tps[-1]
+        # Add a single point at max_fpr by linear interpolation
+        stop = np.searchsorted(fpr, max_fpr, "right")
+        x_interp = [fpr[stop - 1], fpr[stop]]
+        y_interp = [tpr[stop - 1], tpr[stop]]
+        tpr = np.append(tpr[:stop], np.interp(max_fpr, x_interp, y_interp))
+        fpr = np.append(fpr[:stop], max_fpr)
+        partial_auc = metrics.auc(fpr, tpr)
+
+        # McClish correction: standardize result to be 0.5 if non-discriminant and 1 if maximal
+        min_area = 0.5 * max_fpr**2
+        max_area = max_fpr
+        return float(0.5 * (1 + (partial_auc - min_area) / (max_area - min_area)))
+
     session = df._session
     assert session is not None
     sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
@@ -265,6 +321,7 @@ def roc_curve(
     pos_label: Optional[Union[str, int]] = None,
     sample_weight_col_name: Optional[str] = None,
     drop_intermediate: bool = True,
+    n_bins: Optional[int] = None,
 ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
     """
     Compute Receiver operating characteristic (ROC).
@@ -287,6 +344,10 @@ def roc_curve(
         drop_intermediate: Whether to drop some suboptimal thresholds which would
             not appear on a plotted ROC curve. This is useful in order to create
             lighter ROC curves.
+        n_bins: If ``None``, the curve is computed exactly at every distinct score.
+            Otherwise, the scores are binned into ``n_bins`` equal-width buckets and
+            the curve is computed at the lowest score of each bucket, which bounds the
+            number of thresholds of very large datasets.
 
     Returns:
         Tuple containing following items
@@ -299,49 +360,309 @@ def roc_curve(
             thresholds - ndarray of shape = (n_thresholds,)
                 Decreasing thresholds on the decision function used to compute
                 fpr and tpr. `thresholds[0]` represents no instances being predicted
-                and is arbitrarily set to `max(y_score) + 1`.
+                and is arbitrarily set to `np.inf`, or `max(y_score) + 1` with
+                scikit-learn < 1.3.
     """
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
     statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_name, y_score_col_name, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
+    curve_df = _binary_clf_curve(
+        df=df,
+        y_true_col_name=y_true_col_name,
+        y_score_col_name=y_score_col_name,
+        pos_label=pos_label,
+        sample_weight_col_name=sample_weight_col_name,
+        n_bins=n_bins,
         statement_params=statement_params,
-        anonymous=True,
     )
-    def roc_curve_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_name]
-        y_score = df[y_score_col_name]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-        fpr, tpr, thresholds = metrics.roc_curve(
-            y_true,
-            y_score,
-            pos_label=pos_label,
-            sample_weight=sample_weight,
-            drop_intermediate=drop_intermediate,
+    fps, tps, thresholds = _collect_curve(curve_df=curve_df, statement_params=statement_params)
+
+    # Drop thresholds corresponding to points in between and collinear with other points, which do not appear on
+    # a plotted ROC curve.
+    if drop_intermediate and len(fps) > 2:
+        optimal_idxs = np.where(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True])[0]
+        fps = fps[optimal_idxs]
+        tps = tps[optimal_idxs]
+        thresholds = thresholds[optimal_idxs]
+
+    # Add an extra threshold position to make sure that the curve starts at (0, 0)
+    tps = np.r_[0, tps]
+    fps = np.r_[0, fps]
+    if version.parse(sklearn.__version__) < version.parse("1.3"):
+        thresholds = np.r_[thresholds[0] + 1, thresholds]
+    else:
+        thresholds = np.r_[np.inf, thresholds]
+
+    if fps[-1] <= 0:
+        warnings.warn(
+            "No negative samples in y_true, false positive value should be meaningless",
+            exceptions.UndefinedMetricWarning,
         )
+        fpr = np.repeat(np.nan, fps.shape)
+    else:
+        fpr = fps / fps[-1]
 
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, (fpr, tpr, thresholds))  # type: ignore[no-any-return]
+    if tps[-1] <= 0:
+        warnings.warn(
+            "No positive samples in y_true, true positive value should be meaningless",
+            exceptions.UndefinedMetricWarning,
+        )
+        tpr = np.repeat(np.nan, tps.shape)
+    else:
+        tpr = tps / tps[-1]
+
+    return fpr, tpr, thresholds
+
+
+def _nonzero_samples(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_score_col_name: str,
+    sample_weight_col_name: Optional[str] = None,
+) -> snowpark.DataFrame:
+    """Filters out samples with a null label or score, and zero-weighted samples which do not impact the result."""
+    condition = F.col(y_true_col_name).is_not_null() & F.col(y_score_col_name).is_not_null()
+    if sample_weight_col_name:
+        condition = condition & (F.col(sample_weight_col_name) != 0)
+    return df.filter(condition)
+
+
+def _label_classes(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_score_col_name: str,
+    sample_weight_col_name: Optional[str] = None,
+    statement_params: Dict[str, Any],
+) -> Tuple[npt.NDArray[Any], Tuple[float, float]]:
+    """Collects the sorted distinct labels of a binary target, and the range of its scores.
+
+    Only up to three labels are collected, which is enough to tell binary targets apart. The score range is
+    only complete if at most two labels are returned.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing true labels.
+        y_score_col_name: Column name representing target scores.
+        sample_weight_col_name: Column name representing sample weights.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Tuple of the sorted labels and the (min, max) range of the scores.
+    """
+    df = _nonzero_samples(
+        df=df,
+        y_true_col_name=y_true_col_name,
+        y_score_col_name=y_score_col_name,
+        sample_weight_col_name=sample_weight_col_name,
+    )
+    classes_df = (
+        df.group_by(y_true_col_name)
+        .agg(F.min(y_score_col_name).alias("MIN"), F.max(y_score_col_name).alias("MAX"))
+        .limit(3)
+        .to_pandas(statement_params=statement_params)
+    )
+    classes = np.sort(classes_df.iloc[:, 0].to_numpy())
+    score_range = (float(classes_df["MIN"].min()), float(classes_df["MAX"].max())) if len(classes_df) else (0.0, 0.0)
+    return classes, score_range
+
+
+def _default_pos_label(classes: npt.NDArray[Any]) -> int:
+    """Infers the positive label of a binary target when it is not specified.
+
+    Args:
+        classes: Sorted distinct labels of the target.
+
+    Returns:
+        The label of the positive class, which is 1.
+
+    Raises:
+        ValueError: The target has more than two labels.
+        ValueError: The labels are not either {-1, 1} or {0, 1}.
+    """
+    if len(classes) > 2:
+        raise ValueError("multiclass format is not supported")
+    if classes.dtype.kind in "OUS" or not any(
+        np.array_equal(classes, expected) for expected in ([0, 1], [-1, 1], [0], [-1], [1])
+    ):
+        classes_repr = ", ".join(repr(c) for c in classes)
+        raise ValueError(
+            f"y_true takes value in {{{classes_repr}}} and pos_label is not specified: either make y_true take value "
+            "in {0, 1} or {-1, 1} or pass pos_label explicitly."
+        )
+    return 1
+
+
+def _binary_clf_curve(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_name: str,
+    y_score_col_name: str,
+    pos_label: Optional[Union[str, int, snowpark.Column]] = None,
+    sample_weight_col_name: Optional[str] = None,
+    n_bins: Optional[int] = None,
+    label_classes: Optional[Tuple[npt.NDArray[Any], Tuple[float, float]]] = None,
+    statement_params: Dict[str, Any],
+) -> snowpark.DataFrame:
+    """Builds the true and false positives per decreasing threshold of a binary target.
+
+    The samples are aggregated by distinct score, or by bucket of scores if ``n_bins`` is given, and the positives
+    and negatives are accumulated in decreasing order of threshold with window functions. The threshold of a bucket
+    is its lowest score, so that every returned point is exactly on the curve of the whole dataset.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_name: Column name representing true binary labels.
+        y_score_col_name: Column name representing target scores.
+        pos_label: The label of the positive class, or a column expression evaluating to it, in which case the
+            caller checks that the target is binary.
+        sample_weight_col_name: Column name representing sample weights.
+        n_bins: Number of equal-width buckets the scores are binned into, or ``None`` to use every distinct score.
+        label_classes: The labels and the range of the scores given by `_label_classes`, if already collected.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Dataframe with columns [THRESHOLD, TPS, FPS], one row per threshold.
+
+    Raises:
+        ValueError: ``n_bins`` is not a positive integer.
+        ValueError: The target has more than two labels.
+    """
+    if n_bins is not None and n_bins < 1:
+        raise ValueError(f"n_bins must be a positive integer, but got {n_bins}.")
+
+    # The labels are checked whether or not the positive label is given, as multiclass targets are not binarized.
+    if label_classes is None and not isinstance(pos_label, snowpark.Column):
+        label_classes = _label_classes(
+            df=df,
+            y_true_col_name=y_true_col_name,
+            y_score_col_name=y_score_col_name,
+            sample_weight_col_name=sample_weight_col_name,
+            statement_params=statement_params,
+        )
+    score_range: Optional[Tuple[float, float]] = None
+    if label_classes is not None:
+        classes, score_range = label_classes
+        if len(classes) > 2:
+            raise ValueError("multiclass format is not supported")
+        if pos_label is None:
+            pos_label = _default_pos_label(classes)
+    if isinstance(pos_label, np.generic):
+        pos_label = pos_label.item()
+
+    df = _nonzero_samples(
+        df=df,
+        y_true_col_name=y_true_col_name,
+        y_score_col_name=y_score_col_name,
+        sample_weight_col_name=sample_weight_col_name,
+    )
+    y_score = F.col(y_score_col_name)
+    if n_bins is None:
+        threshold_key = y_score
+    else:
+        if score_range is None:
+            score_range = tuple(
+                float(v)
+                for v in df.select(F.min(y_score), F.max(y_score)).collect(statement_params=statement_params)[0]
+            )
+        lo, hi = score_range
+        if hi > lo:
+            threshold_key = F.least(F.floor((y_score - F.lit(lo)) * F.lit(n_bins / (hi - lo))), F.lit(n_bins - 1))
+        else:
+            threshold_key = F.lit(0)
+
+    weight = F.col(sample_weight_col_name) if sample_weight_col_name else F.lit(1)
+    is_pos = F.col(y_true_col_name) == F.lit(pos_label)
+    thresholds_df = (
+        df.select(
+            threshold_key.alias(_BIN),
+            y_score.alias(_THRESHOLD),
+            F.iff(is_pos, weight, F.lit(0)).alias(_POS),
+            F.iff(is_pos, F.lit(0), weight).alias(_NEG),
+        )
+        .group_by(_BIN)
+        .agg(F.min(_THRESHOLD).alias(_THRESHOLD), F.sum(_POS).alias(_POS), F.sum(_NEG).alias(_NEG))
+    )
+
+    window = snowpark.Window.order_by(F.col(_THRESHOLD).desc()).rows_between(
+        snowpark.Window.UNBOUNDED_PRECEDING, snowpark.Window.CURRENT_ROW
+    )
+    return thresholds_df.select(
+        F.col(_THRESHOLD),
+        F.sum(_POS).over(window).alias(_TPS),
+        F.sum(_NEG).over(window).alias(_FPS),
+    )
+
+
+def _collect_curve(
+    *,
+    curve_df: snowpark.DataFrame,
+    statement_params: Dict[str, Any],
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[Any]]:
+    """Collects the false positives, true positives and thresholds of a curve built by `_binary_clf_curve`.
+
+    Args:
+        curve_df: Dataframe returned by `_binary_clf_curve`.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Tuple of the false positives, true positives and thresholds in decreasing order of threshold.
+    """
+    curve = curve_df.sort(F.col(_THRESHOLD).desc()).to_pandas(statement_params=statement_params)
+    return (
+        curve[_FPS].to_numpy(dtype=np.float64),
+        curve[_TPS].to_numpy(dtype=np.float64),
+        pd.to_numeric(curve[_THRESHOLD]).to_numpy(),
+    )
+
+
+def _roc_auc_from_curve(*, curve_df: snowpark.DataFrame, statement_params: Dict[str, Any]) -> float:
+    """Computes the area under a ROC curve built by `_binary_clf_curve` with the trapezoidal rule, in SQL.
+
+    Args:
+        curve_df: Dataframe returned by `_binary_clf_curve`.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
 
-    result_object = result.deserialize(session, roc_curve_anon_sproc(session))
-    res: Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_], npt.NDArray[np.float_]] = result_object
+    Returns:
+        Area Under the Curve score.
+    """
+    return _roc_auc_from_statistics(
+        _roc_auc_statistics_df(curve_df=curve_df).collect(statement_params=statement_params)[0]
+    )
+
+
+def _roc_auc_from_statistics(statistics: snowpark.Row) -> float:
+    """Area under the ROC curve of the statistics built by `_roc_auc_statistics_df`.
+
+    Args:
+        statistics: The row of the result of the query built by `_roc_auc_statistics_df`.
+
+    Returns:
+        Area Under the Curve score.
+    """
+    area, n_pos, n_neg = (float(v) for v in statistics)
+    return area / (2 * n_pos * n_neg)
+
+
+def _roc_auc_statistics_df(*, curve_df: snowpark.DataFrame) -> snowpark.DataFrame:
+    """Builds the aggregate query of the statistics of the area under a ROC curve built by `_binary_clf_curve`.
+
+    Args:
+        curve_df: Dataframe returned by `_binary_clf_curve`.
 
-    return res
+    Returns:
+        Dataframe with a single row containing twice the area under the curve of the true and false positives, the
+        number of positives and the number of negatives. The ROC AUC is the first one divided by the two others.
+    """
+    prev_tps, prev_fps = "PREV_TPS", "PREV_FPS"
+    window = snowpark.Window.order_by(F.col(_THRESHOLD).desc())
+    steps_df = curve_df.select(
+        F.col(_TPS),
+        F.col(_FPS),
+        F.lag(_TPS, 1, 0).over(window).alias(prev_tps),
+        F.lag(_FPS, 1, 0).over(window).alias(prev_fps),
+    )
+    return steps_df.select(
+        F.sum((F.col(_FPS) - F.col(prev_fps)) * (F.col(_TPS) + F.col(prev_tps))),
+        F.max(_TPS),
+        F.max(_FPS),
+    )
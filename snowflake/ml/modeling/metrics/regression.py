@@ -1,23 +1,45 @@
 import inspect
-from typing import List, Optional, Union
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import cloudpickle
 import numpy as np
 import numpy.typing as npt
-import sklearn
-from packaging import version
-from sklearn import metrics
+from sklearn import exceptions
 
-import snowflake.snowpark._internal.utils as snowpark_utils
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
-from snowflake.ml._internal.utils import result
 from snowflake.ml.modeling.metrics import metrics_utils
-from snowflake.snowpark import functions as F
+from snowflake.snowpark import functions as F, types as T
 
 _PROJECT = "ModelDevelopment"
 _SUBPROJECT = "Metrics"
 
+# Weighted means, per output, computed by `_regression_statistics`.
+_ABSOLUTE_ERROR = "ABSOLUTE_ERROR"
+_SQUARED_ERROR = "SQUARED_ERROR"
+_ABSOLUTE_PERCENTAGE_ERROR = "ABSOLUTE_PERCENTAGE_ERROR"
+_RESIDUAL_VARIANCE = "RESIDUAL_VARIANCE"
+_TRUE_VARIANCE = "TRUE_VARIANCE"
+_PINBALL_LOSS = "PINBALL_LOSS"
+_QUANTILE_PINBALL_LOSS = "QUANTILE_PINBALL_LOSS"
+_COUNT = "COUNT"
+_SUM_WEIGHT = "SUM_WEIGHT"
+_WEIGHT = "_WEIGHT"
+
+_MULTIOUTPUT_ERROR = ("raw_values", "uniform_average")
+_MULTIOUTPUT_SCORE = ("raw_values", "uniform_average", "variance_weighted")
+
+# Statistics and aggregation of each metric supported by `regression_metrics`.
+_REGRESSION_METRICS: Dict[str, Tuple[str, ...]] = {
+    "mean_absolute_error": (_ABSOLUTE_ERROR,),
+    "mean_squared_error": (_SQUARED_ERROR,),
+    "root_mean_squared_error": (_SQUARED_ERROR,),
+    "mean_absolute_percentage_error": (_ABSOLUTE_PERCENTAGE_ERROR,),
+    "explained_variance_score": (_RESIDUAL_VARIANCE, _TRUE_VARIANCE),
+    "r2_score": (_SQUARED_ERROR, _TRUE_VARIANCE),
+    "d2_absolute_error_score": (_PINBALL_LOSS, _QUANTILE_PINBALL_LOSS),
+}
+
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
 def d2_absolute_error_score(
@@ -56,50 +78,14 @@ def d2_absolute_error_score(
             The :math:`D^2` score with an absolute error deviance
             or ndarray of scores if 'multioutput' is 'raw_values'.
     """
-    metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_snowflake_result = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    return d2_pinball_score(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        alpha=0.5,
+        multioutput=multioutput,
     )
-    def d2_absolute_error_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.d2_absolute_error_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-        )
-        result_module = cloudpickle.loads(pickled_snowflake_result)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, d2_absolute_error_score_anon_sproc(session))
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -141,53 +127,25 @@ def d2_pinball_score(
         score: float or ndarray of floats
             The :math:`D^2` score with a pinball deviance
             or ndarray of scores if `multioutput='raw_values'`.
+
+    Raises:
+        ValueError: ``alpha`` is not in range [0, 1].
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    if not 0 <= alpha <= 1:
+        raise ValueError(f"alpha must be in range [0, 1], got: {alpha!r}")
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_ERROR)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[_PINBALL_LOSS, _QUANTILE_PINBALL_LOSS],
+        alpha=alpha,
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
     )
-    def d2_pinball_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.d2_pinball_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            alpha=alpha,
-            multioutput=multioutput,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, d2_pinball_score_anon_sproc(session))
-
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
+    return _d2_score(statistics=statistics, multioutput=multioutput)
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -247,50 +205,22 @@ def explained_variance_score(
             The explained variance or ndarray if 'multioutput' is 'raw_values'.
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_SCORE)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[_RESIDUAL_VARIANCE, _TRUE_VARIANCE],
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
+    )
+    return _explained_score(
+        numerator=statistics[_RESIDUAL_VARIANCE],
+        denominator=statistics[_TRUE_VARIANCE],
+        multioutput=multioutput,
+        force_finite=force_finite,
     )
-    def explained_variance_score_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        score = metrics.explained_variance_score(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-            force_finite=force_finite,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, score)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, explained_variance_score_anon_sproc(session))
-    score: Union[float, npt.NDArray[np.float_]] = result_object
-    return score
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -329,50 +259,17 @@ def mean_absolute_error(
             MAE output is non-negative floating point. The best value is 0.0.
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_ERROR)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[_ABSOLUTE_ERROR],
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
     )
-    def mean_absolute_error_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        loss = metrics.mean_absolute_error(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-        )
-
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, loss)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, mean_absolute_error_anon_sproc(session))
-    loss: Union[float, npt.NDArray[np.float_]] = result_object
-    return loss
+    return _average_outputs(statistics[_ABSOLUTE_ERROR], multioutput)
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -420,49 +317,17 @@ def mean_absolute_percentage_error(
             Note that we return a large value instead of `inf` when `y_true` is zero.
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_ERROR)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[_ABSOLUTE_PERCENTAGE_ERROR],
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
     )
-    def mean_absolute_percentage_error_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        loss = metrics.mean_absolute_percentage_error(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, loss)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, mean_absolute_percentage_error_anon_sproc(session))
-    loss: Union[float, npt.NDArray[np.float_]] = result_object
-    return loss
+    return _average_outputs(statistics[_ABSOLUTE_PERCENTAGE_ERROR], multioutput)
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -499,50 +364,18 @@ def mean_squared_error(
             array of floating point values, one for each individual target.
     """
     metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
-
-    session = df._session
-    assert session is not None
-    sproc_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.PROCEDURE)
-    sklearn_release = version.parse(sklearn.__version__).release
-    statement_params = telemetry.get_statement_params(_PROJECT, _SUBPROJECT)
-    cols = metrics_utils.flatten_cols([y_true_col_names, y_pred_col_names, sample_weight_col_name])
-    queries = df[cols].queries["queries"]
-    pickled_result_module = cloudpickle.dumps(result)
-
-    @F.sproc(  # type: ignore[misc]
-        is_permanent=False,
-        session=session,
-        name=sproc_name,
-        replace=True,
-        packages=[
-            "cloudpickle",
-            f"scikit-learn=={sklearn_release[0]}.{sklearn_release[1]}.*",
-            "snowflake-snowpark-python",
-        ],
-        statement_params=statement_params,
-        anonymous=True,
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_ERROR)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[_SQUARED_ERROR],
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
     )
-    def mean_squared_error_anon_sproc(session: snowpark.Session) -> bytes:
-        for query in queries[:-1]:
-            _ = session.sql(query).collect(statement_params=statement_params)
-        df = session.sql(queries[-1]).to_pandas(statement_params=statement_params)
-        y_true = df[y_true_col_names]
-        y_pred = df[y_pred_col_names]
-        sample_weight = df[sample_weight_col_name] if sample_weight_col_name else None
-
-        loss = metrics.mean_squared_error(
-            y_true,
-            y_pred,
-            sample_weight=sample_weight,
-            multioutput=multioutput,
-            squared=squared,
-        )
-        result_module = cloudpickle.loads(pickled_result_module)
-        return result_module.serialize(session, loss)  # type: ignore[no-any-return]
-
-    result_object = result.deserialize(session, mean_squared_error_anon_sproc(session))
-    loss: Union[float, npt.NDArray[np.float_]] = result_object
-    return loss
+    output_errors = statistics[_SQUARED_ERROR]
+    return _average_outputs(output_errors if squared else np.sqrt(output_errors), multioutput)
 
 
 @telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
@@ -579,3 +412,338 @@ def r2_score(*, df: snowpark.DataFrame, y_true_col_name: str, y_pred_col_name: s
         function_name=telemetry.get_statement_params_full_func_name(inspect.currentframe(), None),
     )
     return float(df_r_square.collect(statement_params=statement_params)[0][0])
+
+
+@telemetry.send_api_usage_telemetry(project=_PROJECT, subproject=_SUBPROJECT)
+def regression_metrics(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_names: Union[str, List[str]],
+    y_pred_col_names: Union[str, List[str]],
+    sample_weight_col_name: Optional[str] = None,
+    metrics: Optional[Iterable[str]] = None,
+    multioutput: Union[str, npt.ArrayLike] = "uniform_average",
+) -> Dict[str, Union[float, npt.NDArray[np.float_]]]:
+    """
+    Compute several regression metrics with a single scan of the dataframe.
+
+    The metrics are computed with their default parameters, and are equal to
+    the results of the corresponding functions of this module.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_names: Column name(s) representing actual values.
+        y_pred_col_names: Column name(s) representing predicted values.
+        sample_weight_col_name: Column name representing sample weights.
+        metrics: Names of the metrics to compute, among 'mean_absolute_error',
+            'mean_squared_error', 'root_mean_squared_error',
+            'mean_absolute_percentage_error', 'explained_variance_score',
+            'r2_score' and 'd2_absolute_error_score'. By default, all of them
+            are computed.
+        multioutput: {'raw_values', 'uniform_average'}  or array-like of shape \
+            (n_outputs,), default='uniform_average'
+            Defines aggregating of multiple output values.
+            Array-like value defines weights used to average errors.
+            'raw_values':
+                Returns a full set of errors in case of multioutput input.
+            'uniform_average':
+                Errors of all outputs are averaged with uniform weight.
+
+    Returns:
+        Dictionary mapping the name of each metric to its value.
+
+    Raises:
+        ValueError: An unknown metric is given.
+    """
+    metrics_utils.check_label_columns(y_true_col_names, y_pred_col_names)
+    metric_names = list(_REGRESSION_METRICS.keys()) if metrics is None else list(metrics)
+    unknown_metrics = [name for name in metric_names if name not in _REGRESSION_METRICS]
+    if unknown_metrics:
+        raise ValueError(
+            f"Unknown regression metrics {unknown_metrics}. Supported metrics are {list(_REGRESSION_METRICS.keys())}."
+        )
+    multioutput = _check_multioutput(multioutput, y_true_col_names, _MULTIOUTPUT_ERROR)
+
+    statistics = _regression_statistics(
+        df=df,
+        y_true_col_names=y_true_col_names,
+        y_pred_col_names=y_pred_col_names,
+        sample_weight_col_name=sample_weight_col_name,
+        statistics=[statistic for name in metric_names for statistic in _REGRESSION_METRICS[name]],
+        statement_params=telemetry.get_statement_params(_PROJECT, _SUBPROJECT),
+    )
+
+    res: Dict[str, Union[float, npt.NDArray[np.float_]]] = {}
+    for name in metric_names:
+        if name == "mean_absolute_error":
+            res[name] = _average_outputs(statistics[_ABSOLUTE_ERROR], multioutput)
+        elif name == "mean_squared_error":
+            res[name] = _average_outputs(statistics[_SQUARED_ERROR], multioutput)
+        elif name == "root_mean_squared_error":
+            res[name] = _average_outputs(np.sqrt(statistics[_SQUARED_ERROR]), multioutput)
+        elif name == "mean_absolute_percentage_error":
+            res[name] = _average_outputs(statistics[_ABSOLUTE_PERCENTAGE_ERROR], multioutput)
+        elif name == "explained_variance_score":
+            res[name] = _explained_score(
+                numerator=statistics[_RESIDUAL_VARIANCE],
+                denominator=statistics[_TRUE_VARIANCE],
+                multioutput=multioutput,
+            )
+        elif name == "r2_score":
+            res[name] = _explained_score(
+                numerator=statistics[_SQUARED_ERROR],
+                denominator=statistics[_TRUE_VARIANCE],
+                multioutput=multioutput,
+            )
+        elif name == "d2_absolute_error_score":
+            res[name] = _d2_score(statistics=statistics, multioutput=multioutput)
+    return res
+
+
+def _check_multioutput(
+    multioutput: Union[str, npt.ArrayLike],
+    y_true_col_names: Union[str, List[str]],
+    allowed: Tuple[str, ...],
+) -> Union[str, npt.NDArray[np.float_]]:
+    """Validates the aggregation of multiple outputs.
+
+    Args:
+        multioutput: A string in ``allowed`` or the weights of the outputs.
+        y_true_col_names: Column name(s) representing actual values.
+        allowed: Allowed string values.
+
+    Returns:
+        The validated string or array of weights.
+
+    Raises:
+        ValueError: ``multioutput`` is not one of the allowed strings.
+        ValueError: Custom weights are given for a single output, or their number does not match the outputs.
+    """
+    if isinstance(multioutput, str):
+        if multioutput not in allowed:
+            raise ValueError(
+                f"Allowed 'multioutput' string values are {allowed}. You provided multioutput={multioutput!r}"
+            )
+        return multioutput
+
+    weights = np.asarray(multioutput, dtype=np.float64)
+    n_outputs = len(metrics_utils.flatten_cols([y_true_col_names]))
+    if n_outputs == 1:
+        raise ValueError("Custom weights are useful only in multi-output cases.")
+    elif n_outputs != len(weights):
+        raise ValueError(f"There must be equally many custom weights ({len(weights)}) as outputs ({n_outputs}).")
+    return weights
+
+
+def _average_outputs(
+    output_scores: npt.NDArray[np.float_],
+    multioutput: Union[str, npt.NDArray[np.float_]],
+    variance: Optional[npt.NDArray[np.float_]] = None,
+) -> Union[float, npt.NDArray[np.float_]]:
+    """Aggregates the scores of multiple outputs as specified by a validated ``multioutput``.
+
+    Args:
+        output_scores: Score of each output.
+        multioutput: 'raw_values', 'uniform_average', 'variance_weighted' or the weights of the outputs.
+        variance: Variance of each output, used with 'variance_weighted'.
+
+    Returns:
+        The aggregated score, or the score of each output with 'raw_values'.
+    """
+    if isinstance(multioutput, str):
+        if multioutput == "raw_values":
+            return output_scores
+        elif multioutput == "variance_weighted" and variance is not None and np.any(variance != 0):
+            return float(np.average(output_scores, weights=variance))
+        return float(np.average(output_scores))
+    return float(np.average(output_scores, weights=multioutput))
+
+
+def _explained_score(
+    *,
+    numerator: npt.NDArray[np.float_],
+    denominator: npt.NDArray[np.float_],
+    multioutput: Union[str, npt.NDArray[np.float_]],
+    force_finite: bool = True,
+) -> Union[float, npt.NDArray[np.float_]]:
+    """Computes ``1 - numerator / denominator`` for each output, like the explained variance and :math:`R^2` scores.
+
+    Args:
+        numerator: Unexplained variance of each output.
+        denominator: Variance of the actual values of each output.
+        multioutput: 'raw_values', 'uniform_average', 'variance_weighted' or the weights of the outputs.
+        force_finite: Whether to replace scores of constant outputs with 1.0 for perfect predictions, 0.0 otherwise.
+
+    Returns:
+        The aggregated score, or the score of each output with 'raw_values'.
+    """
+    nonzero_denominator = denominator != 0
+    if not force_finite:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            output_scores = 1 - (numerator / denominator)
+    else:
+        nonzero_numerator = numerator != 0
+        output_scores = np.ones(len(numerator))
+        valid_score = nonzero_denominator & nonzero_numerator
+        output_scores[valid_score] = 1 - (numerator[valid_score] / denominator[valid_score])
+        output_scores[nonzero_numerator & ~nonzero_denominator] = 0.0
+    return _average_outputs(output_scores, multioutput, variance=denominator)
+
+
+def _d2_score(
+    *,
+    statistics: Dict[str, npt.NDArray[Any]],
+    multioutput: Union[str, npt.NDArray[np.float_]],
+) -> Union[float, npt.NDArray[np.float_]]:
+    """Computes the :math:`D^2` score of each output from the pinball losses of the predictions and of the quantile.
+
+    Args:
+        statistics: Statistics returned by `_regression_statistics`, including the pinball losses.
+        multioutput: 'raw_values', 'uniform_average' or the weights of the outputs.
+
+    Returns:
+        The aggregated score, or the score of each output with 'raw_values'.
+    """
+    if statistics[_COUNT][0] < 2:
+        warnings.warn("D^2 score is not well-defined with less than two samples.", exceptions.UndefinedMetricWarning)
+        return float("nan")
+
+    numerator = statistics[_PINBALL_LOSS]
+    denominator = statistics[_QUANTILE_PINBALL_LOSS]
+    nonzero_numerator = numerator != 0
+    nonzero_denominator = denominator != 0
+    valid_sensible = nonzero_numerator & nonzero_denominator
+    output_scores = np.ones(len(numerator))
+    output_scores[valid_sensible] = 1 - numerator[valid_sensible] / denominator[valid_sensible]
+    output_scores[nonzero_numerator & ~nonzero_denominator] = 0.0
+    return _average_outputs(output_scores, multioutput)
+
+
+def _regression_statistics(
+    *,
+    df: snowpark.DataFrame,
+    y_true_col_names: Union[str, List[str]],
+    y_pred_col_names: Union[str, List[str]],
+    sample_weight_col_name: Optional[str] = None,
+    statistics: Iterable[str],
+    alpha: float = 0.5,
+    statement_params: Dict[str, Any],
+) -> Dict[str, npt.NDArray[Any]]:
+    """Computes weighted means of the errors of each output in a single query.
+
+    Samples with a null actual value, predicted value or weight are ignored. Statistics measured against a center of
+    the actual values, i.e. the variances and the pinball loss of the alpha-quantile, first compute the centers in
+    single-row subqueries, one of the means and one of the quantiles, which are cross-joined to the data. Quantiles
+    are computed with ``PERCENTILE_CONT``, or as the lowest value reaching the alpha fraction of the cumulative
+    weights when weighted, which matches sklearn.
+
+    Args:
+        df: Input dataframe.
+        y_true_col_names: Column name(s) representing actual values.
+        y_pred_col_names: Column name(s) representing predicted values.
+        sample_weight_col_name: Column name representing sample weights.
+        statistics: Statistics to compute, e.g. `_ABSOLUTE_ERROR`.
+        alpha: Quantile level of the pinball losses.
+        statement_params: Dictionary used for tagging queries for tracking purposes.
+
+    Returns:
+        Dictionary mapping each statistic to an array of its value for each output. The number of samples is
+        included as `_COUNT`.
+    """
+    statistics = set(statistics)
+    y_true_cols = metrics_utils.flatten_cols([y_true_col_names])
+    y_pred_cols = metrics_utils.flatten_cols([y_pred_col_names])
+    n_outputs = len(y_true_cols)
+
+    y_true = [F.col(f"_Y_TRUE_{i}") for i in range(n_outputs)]
+    y_pred = [F.col(f"_Y_PRED_{i}") for i in range(n_outputs)]
+    weight = F.col(_WEIGHT)
+    data_df = df.select(
+        *[F.col(col).cast(T.DoubleType()).alias(f"_Y_TRUE_{i}") for i, col in enumerate(y_true_cols)],
+        *[F.col(col).cast(T.DoubleType()).alias(f"_Y_PRED_{i}") for i, col in enumerate(y_pred_cols)],
+        (F.col(sample_weight_col_name) if sample_weight_col_name else F.lit(1)).cast(T.DoubleType()).alias(_WEIGHT),
+    )
+    # Samples with a null value are ignored by every statistic, including the count and the sum of weights.
+    not_null = weight.is_not_null()
+    for col in y_true + y_pred:
+        not_null = not_null & col.is_not_null()
+    data_df = data_df.filter(not_null)
+
+    # Centers of the actual values and of the residuals, each kind computed by its own single-row aggregate.
+    mean_exprs: List[snowpark.Column] = []
+    if _RESIDUAL_VARIANCE in statistics:
+        mean_exprs += [
+            (F.sum(weight * (y_true[i] - y_pred[i])) / F.sum(weight)).alias(f"_RESIDUAL_MEAN_{i}")
+            for i in range(n_outputs)
+        ]
+    if _TRUE_VARIANCE in statistics:
+        mean_exprs += [(F.sum(weight * y_true[i]) / F.sum(weight)).alias(f"_Y_TRUE_MEAN_{i}") for i in range(n_outputs)]
+    center_dfs: List[snowpark.DataFrame] = []
+    if mean_exprs:
+        center_dfs.append(data_df.select(mean_exprs))
+    if _QUANTILE_PINBALL_LOSS in statistics:
+        if sample_weight_col_name is None:
+            center_dfs.append(
+                data_df.select(
+                    [
+                        F.percentile_cont(alpha).within_group(y_true[i]).alias(f"_Y_TRUE_QUANTILE_{i}")
+                        for i in range(n_outputs)
+                    ]
+                )
+            )
+        else:
+            cumulative_weights = [
+                F.sum(weight)
+                .over(
+                    snowpark.Window.order_by(y_true[i]).rows_between(
+                        snowpark.Window.UNBOUNDED_PRECEDING, snowpark.Window.CURRENT_ROW
+                    )
+                )
+                .alias(f"_CUMULATIVE_WEIGHT_{i}")
+                for i in range(n_outputs)
+            ]
+            cumulative_df = data_df.select(*y_true, *cumulative_weights, F.sum(weight).over().alias("_TOTAL_WEIGHT"))
+            quantile_exprs = []
+            for i in range(n_outputs):
+                cumulative_weight = F.col(f"_CUMULATIVE_WEIGHT_{i}")
+                reached = (
+                    cumulative_weight > 0 if alpha == 0 else cumulative_weight >= F.lit(alpha) * F.col("_TOTAL_WEIGHT")
+                )
+                quantile_exprs.append(F.min(F.when(reached, y_true[i])).alias(f"_Y_TRUE_QUANTILE_{i}"))
+            center_dfs.append(cumulative_df.select(quantile_exprs))
+    for center_df in center_dfs:
+        data_df = data_df.cross_join(center_df)
+
+    def pinball_loss(diff: snowpark.Column) -> snowpark.Column:
+        return F.iff(diff >= 0, F.lit(alpha) * diff, F.lit(alpha - 1) * diff)
+
+    stat_exprs: Dict[str, List[snowpark.Column]] = {
+        _ABSOLUTE_ERROR: [F.abs(y_true[i] - y_pred[i]) for i in range(n_outputs)],
+        _SQUARED_ERROR: [(y_true[i] - y_pred[i]) * (y_true[i] - y_pred[i]) for i in range(n_outputs)],
+        _ABSOLUTE_PERCENTAGE_ERROR: [
+            F.abs(y_pred[i] - y_true[i]) / F.greatest(F.abs(y_true[i]), F.lit(float(np.finfo(np.float64).eps)))
+            for i in range(n_outputs)
+        ],
+        _RESIDUAL_VARIANCE: [
+            (y_true[i] - y_pred[i] - F.col(f"_RESIDUAL_MEAN_{i}"))
+            * (y_true[i] - y_pred[i] - F.col(f"_RESIDUAL_MEAN_{i}"))
+            for i in range(n_outputs)
+        ],
+        _TRUE_VARIANCE: [
+            (y_true[i] - F.col(f"_Y_TRUE_MEAN_{i}")) * (y_true[i] - F.col(f"_Y_TRUE_MEAN_{i}"))
+            for i in range(n_outputs)
+        ],
+        _PINBALL_LOSS: [pinball_loss(y_true[i] - y_pred[i]) for i in range(n_outputs)],
+        _QUANTILE_PINBALL_LOSS: [pinball_loss(y_true[i] - F.col(f"_Y_TRUE_QUANTILE_{i}")) for i in range(n_outputs)],
+    }
+    sorted_statistics = sorted(statistics)
+    agg_exprs = [F.count(F.lit(1)).alias(_COUNT), F.sum(weight).alias(_SUM_WEIGHT)]
+    for statistic in sorted_statistics:
+        agg_exprs += [F.sum(weight * expr).alias(f"{statistic}_{i}") for i, expr in enumerate(stat_exprs[statistic])]
+    row = data_df.select(agg_exprs).collect(statement_params=statement_params)[0]
+
+    sum_weight = float(row[_SUM_WEIGHT])
+    res: Dict[str, npt.NDArray[Any]] = {_COUNT: np.array([row[_COUNT]], dtype=np.int_)}
+    for statistic in sorted_statistics:
+        res[statistic] = np.array([row[f"{statistic}_{i}"] for i in range(n_outputs)], dtype=np.float64) / sum_weight
+    return res
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import Dict, Iterable, List, Optional, Union, cast
+from typing import Iterable, List, Optional, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -13,12 +13,8 @@ from sklearn.preprocessing import KBinsDiscretizer as SK_KBinsDiscretizer
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
 from snowflake.ml._internal.exceptions import error_codes, exceptions
-from snowflake.ml.modeling.framework import base
+from snowflake.ml.modeling.framework import _utils, base
 from snowflake.snowpark import functions as F, types as T
-from snowflake.snowpark._internal.utils import (
-    TempObjectType,
-    random_name_for_temp_object,
-)
 
 # constants used to validate the compatibility of the kwargs passed to the sklearn
 # transformer with the sklearn version
@@ -314,6 +310,39 @@ class KBinsDiscretizer(base.BaseTransformer):
                 original_exception=ValueError(f"{self.encode} is not a valid encoding scheme."),
             )
 
+    def _bucketize(self, idx: int, input_col: str) -> snowpark.Column:
+        """
+        Build the SQL expression that maps the values of a feature column to their bin ids.
+
+        The expression is equivalent to `np.searchsorted(bin_edges[1:-1], x, side="right")`, i.e. values below the
+        first edge fall into the first bin and values above the last edge fall into the last bin. Null values are
+        mapped to null.
+
+        - 'uniform': `WIDTH_BUCKET` over the fitted range, clamped to `[0, n_bins - 1]`.
+        - 'quantile': a CASE ladder over the inner bin edges.
+
+        Args:
+            idx: Index of the feature column in `self.input_cols`.
+            input_col: Name of the feature column.
+
+        Returns:
+            Bin id expression of the feature column.
+        """
+        assert self.bin_edges_ is not None
+        bin_edges = [float(x) for x in self.bin_edges_[idx]]
+        n_bins = len(bin_edges) - 1
+        col = F.col(input_col)
+
+        # NB: WIDTH_BUCKET requires a non-empty range, fall back to the CASE ladder for constant features
+        if self.strategy == "uniform" and bin_edges[0] < bin_edges[-1]:
+            bucket = F.call_builtin("width_bucket", col, F.lit(bin_edges[0]), F.lit(bin_edges[-1]), F.lit(n_bins))
+            return F.least(F.greatest(bucket - 1, F.lit(0)), F.lit(n_bins - 1))
+
+        case_expr = F.when(col.is_null(), F.lit(None))
+        for bin_id, edge in enumerate(bin_edges[1:-1]):
+            case_expr = case_expr.when(col < F.lit(edge), F.lit(bin_id))
+        return case_expr.otherwise(F.lit(n_bins - 1))
+
     def _handle_ordinal(self, dataset: snowpark.DataFrame) -> snowpark.DataFrame:
         """
         Transform dataset with bucketization and output as ordinal encoding.
@@ -325,35 +354,10 @@ class KBinsDiscretizer(base.BaseTransformer):
             Output dataset with ordinal encoding.
         """
         passthrough_columns = [c for c in dataset.columns if c not in self.output_cols]
-        # NB: the reason we need to generate a random UDF name each time is because the UDF registration
-        # is centralized per database, so if there are multiple sessions with same UDF name, there might be
-        # a conflict and some parties could fail to fetch the UDF.
-        udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
-
-        # 1. Register vec_bucketize UDF
-        @F.pandas_udf(  # type: ignore[arg-type, misc]
-            is_permanent=False,
-            name=udf_name,
-            replace=True,
-            packages=["numpy"],
-            session=dataset._session,
-            statement_params=telemetry.get_statement_params(base.PROJECT, base.SUBPROJECT, self.__class__.__name__),
-        )
-        def vec_bucketize_temp(x: T.PandasSeries[float], boarders: T.PandasSeries[List[float]]) -> T.PandasSeries[int]:
-            # NB: vectorized udf doesn't work well with const array arg, so we pass it in as a list via PandasSeries
-            boarders = boarders[0]
-            res = np.searchsorted(boarders[1:-1], x, side="right")
-            return pd.Series(res)  # type: ignore[no-any-return]
-
-        # 2. compute bucket per feature column
-        for idx, input_col in enumerate(self.input_cols):
-            output_col = self.output_cols[idx]
-            assert self.bin_edges_ is not None
-            boarders = [F.lit(float(x)) for x in self.bin_edges_[idx]]
-            dataset = dataset.select(
-                *dataset.columns,
-                F.call_udf(udf_name, F.col(input_col), F.array_construct(*boarders)).alias(output_col),
-            )
+        output_columns = [
+            self._bucketize(idx, input_col).cast(T.IntegerType()) for idx, input_col in enumerate(self.input_cols)
+        ]
+        dataset = dataset.with_columns(self.output_cols, output_columns)
         # Reorder columns. Passthrough columns are added at the right to the output of the transformers.
         dataset = dataset[self.output_cols + passthrough_columns]
         return dataset
@@ -361,7 +365,7 @@ class KBinsDiscretizer(base.BaseTransformer):
     def _handle_onehot(self, dataset: snowpark.DataFrame) -> snowpark.DataFrame:
         """
         Transform dataset with bucketization and output as sparse representation:
-        {"{bucket_id}": 1.0, "array_length": {num_buckets}}
+        {"{bucket_id}": 1, "array_length": {num_buckets}}
 
         Args:
             dataset: Input dataset.
@@ -369,37 +373,20 @@ class KBinsDiscretizer(base.BaseTransformer):
         Returns:
             Output dataset in sparse representation.
         """
+        assert self.n_bins_ is not None
         passthrough_columns = [c for c in dataset.columns if c not in self.output_cols]
-        udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
-
-        @F.pandas_udf(  # type: ignore[arg-type, misc]
-            is_permanent=False,
-            name=udf_name,
-            replace=True,
-            packages=["numpy"],
-            session=dataset._session,
-            statement_params=telemetry.get_statement_params(base.PROJECT, base.SUBPROJECT, self.__class__.__name__),
-        )
-        def vec_bucketize_sparse_output_temp(
-            x: T.PandasSeries[float], boarders: T.PandasSeries[List[float]]
-        ) -> T.PandasSeries[Dict[str, int]]:
-            res: List[Dict[str, int]] = []
-            boarders = boarders[0]
-            buckets = np.searchsorted(boarders[1:-1], x, side="right")
-            assert isinstance(buckets, np.ndarray), f"expecting buckets to be numpy ndarray, got {type(buckets)}"
-            array_length = len(boarders) - 1
-            for bucket in buckets:
-                res.append({str(bucket): 1, "array_length": array_length})
-            return pd.Series(res)
-
+        output_columns = []
         for idx, input_col in enumerate(self.input_cols):
-            assert self.bin_edges_ is not None
-            output_col = self.output_cols[idx]
-            boarders = [F.lit(float(x)) for x in self.bin_edges_[idx]]
-            dataset = dataset.select(
-                *dataset.columns,
-                F.call_udf(udf_name, F.col(input_col), F.array_construct(*boarders)).alias(output_col),
+            # NB: OBJECT_CONSTRUCT omits pairs whose key is null, so null values are encoded as all zeros
+            output_columns.append(
+                F.object_construct(
+                    F.to_char(self._bucketize(idx, input_col)),
+                    F.lit(1),
+                    F.lit("array_length"),
+                    F.lit(int(self.n_bins_[idx])),
+                )
             )
+        dataset = dataset.with_columns(self.output_cols, output_columns)
         # Reorder columns. Passthrough columns are added at the right to the output of the transformers.
         dataset = dataset[self.output_cols + passthrough_columns]
         return dataset
@@ -415,44 +402,24 @@ class KBinsDiscretizer(base.BaseTransformer):
         Returns:
             Output dataset in dense representation.
         """
+        assert self.n_bins_ is not None
         original_dataset_columns = dataset.columns[:]
         all_output_cols = []
 
-        udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
-
-        @F.pandas_udf(  # type: ignore[arg-type, misc]
-            name=udf_name,
-            replace=True,
-            packages=["numpy"],
-            session=dataset._session,
-            statement_params=telemetry.get_statement_params(base.PROJECT, base.SUBPROJECT, self.__class__.__name__),
+        # Materialize the bin ids once per feature, so that the bucketization expression is not repeated
+        # in every output column.
+        bucket_cols = [_utils.generate_value_with_prefix("BUCKET_").upper() for _ in self.input_cols]
+        dataset = dataset.with_columns(
+            bucket_cols, [self._bucketize(idx, input_col) for idx, input_col in enumerate(self.input_cols)]
         )
-        def vec_bucketize_dense_output_temp(
-            x: T.PandasSeries[float], boarders: T.PandasSeries[List[float]]
-        ) -> T.PandasSeries[List[int]]:
-            res: List[npt.NDArray[np.int32]] = []
-            boarders = boarders[0]
-            buckets = np.searchsorted(boarders[1:-1], x, side="right")
-            assert isinstance(buckets, np.ndarray), f"expecting buckets to be numpy ndarray, got {type(buckets)}"
-            for bucket in buckets:
-                encoded = np.zeros(len(boarders), dtype=int)
-                encoded[bucket] = 1
-                res.append(encoded)
-            return pd.Series(res)
 
-        for idx, input_col in enumerate(self.input_cols):
-            assert self.bin_edges_ is not None
-            output_col = self.output_cols[idx]
-            boarders = [F.lit(float(x)) for x in self.bin_edges_[idx]]
-            dataset = dataset.select(
-                *dataset.columns,
-                F.call_udf(udf_name, F.col(input_col), F.array_construct(*boarders)).alias(output_col),
-            )
+        for idx, output_col in enumerate(self.output_cols):
+            encoded_cols = [f"{output_col}_{i}" for i in range(int(self.n_bins_[idx]))]
             dataset = dataset.with_columns(
-                [f"{output_col}_{i}" for i in range(len(boarders) - 1)],
-                [F.col(output_col)[i].cast(T.IntegerType()) for i in range(len(boarders) - 1)],
-            ).drop(output_col)
-            all_output_cols += [f"{output_col}_{i}" for i in range(len(boarders) - 1)]
+                encoded_cols,
+                [F.iff(F.col(bucket_cols[idx]) == i, 1, 0).cast(T.IntegerType()) for i in range(len(encoded_cols))],
+            )
+            all_output_cols += encoded_cols
 
         # Reorder columns. Passthrough columns are added at the right to the output of the transformers.
         dataset = dataset[all_output_cols + original_dataset_columns]
@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn import preprocessing
 from sklearn.preprocessing import _data as sklearn_preprocessing_data
 
 from snowflake import snowpark
 from snowflake.ml._internal import telemetry
-from snowflake.ml.modeling.framework import base
+from snowflake.ml.modeling.framework import _utils, base
 
 
 class MaxAbsScaler(base.BaseTransformer):
@@ -115,6 +116,45 @@ class MaxAbsScaler(base.BaseTransformer):
         self._is_fitted = True
         return self
 
+    @telemetry.send_api_usage_telemetry(
+        project=base.PROJECT,
+        subproject=base.SUBPROJECT,
+    )
+    def partial_fit(self, dataset: Union[snowpark.DataFrame, pd.DataFrame]) -> "MaxAbsScaler":
+        """
+        Update the maximum absolute values with a new batch of the dataset.
+
+        Only the maximum absolute values of the new batch are computed and merged into the fitted state, so the cost
+        of an update is proportional to the size of the batch. Calling `partial_fit` on an unfitted scaler is
+        equivalent to calling `fit`.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            Return self as fitted scaler.
+        """
+        super()._check_input_cols()
+        super()._check_dataset_type(dataset)
+        if not self._is_fitted:
+            self._reset()
+
+        if isinstance(dataset, pd.DataFrame):
+            dataset = self._use_input_cols_only(dataset)
+            max_abs_states = self._compute_pandas(dataset.abs(), self.input_cols, [_utils.NumericStatistics.MAX])
+            computed_states = {
+                input_col: {self.custom_states[0]: max_abs_states[input_col][_utils.NumericStatistics.MAX]}
+                for input_col in self.input_cols
+            }
+        else:
+            computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
+
+        # The cached sklearn object and fitted arrays hold the previous state.
+        self._clear_cached_fitted_state()
+        self._is_fitted = True
+        return self
+
     def _fit_sklearn(self, dataset: pd.DataFrame) -> None:
         dataset = self._use_input_cols_only(dataset)
         sklearn_scaler = self._create_unfitted_sklearn_object()
@@ -126,9 +166,23 @@ class MaxAbsScaler(base.BaseTransformer):
 
     def _fit_snowpark(self, dataset: snowpark.DataFrame) -> None:
         computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
 
+    def _merge_states(self, computed_states: Mapping[str, Mapping[str, Any]]) -> None:
+        """
+        Merge the states computed on a batch of the dataset into the fitted state of the scaler.
+
+        Args:
+            computed_states: A dict of {column_name: {state: value}} of each input column, as returned by `_compute`.
+        """
         for input_col in self.input_cols:
-            max_abs = float(computed_states[input_col]["SQL>>>max(abs({col_name}))"])
+            batch_max_abs = computed_states[input_col][self.custom_states[0]]
+            if input_col in self.max_abs_ and batch_max_abs is None:
+                continue
+
+            max_abs = float(batch_max_abs)
+            if input_col in self.max_abs_:
+                max_abs = max(self.max_abs_[input_col], max_abs)
             self.max_abs_[input_col] = max_abs
             self.scale_[input_col] = sklearn_preprocessing_data._handle_zeros_in_scale(
                 self.max_abs_[input_col], copy=True
@@ -160,7 +214,7 @@ class MaxAbsScaler(base.BaseTransformer):
         if isinstance(dataset, snowpark.DataFrame):
             output_df = self._transform_snowpark(dataset)
         else:
-            output_df = self._transform_sklearn(dataset)
+            output_df = self._transform_pandas_numpy(dataset)
 
         return self._drop_input_columns(output_df) if self._drop_input_cols is True else output_df
 
@@ -186,6 +240,13 @@ class MaxAbsScaler(base.BaseTransformer):
         transformed_dataset = transformed_dataset[self.output_cols + passthrough_columns]
         return transformed_dataset
 
+    def _create_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        return {"scale": self._convert_attribute_dict_to_ndarray(self.scale_, np.float64)}
+
+    def _transform_numpy(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        X /= self._get_fitted_arrays()["scale"]
+        return X
+
     def _create_unfitted_sklearn_object(self) -> preprocessing.MaxAbsScaler:
         return preprocessing.MaxAbsScaler()
 
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn import preprocessing
 from sklearn.preprocessing import _data as sklearn_preprocessing_data
@@ -124,6 +125,41 @@ class MinMaxScaler(base.BaseTransformer):
         self._is_fitted = True
         return self
 
+    @telemetry.send_api_usage_telemetry(
+        project=base.PROJECT,
+        subproject=base.SUBPROJECT,
+    )
+    def partial_fit(self, dataset: Union[snowpark.DataFrame, pd.DataFrame]) -> "MinMaxScaler":
+        """
+        Update min and max values with a new batch of the dataset.
+
+        Only the min and max values of the new batch are computed and merged into the fitted state, so the cost of
+        an update is proportional to the size of the batch. Calling `partial_fit` on an unfitted scaler is equivalent
+        to calling `fit`.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            Fitted scaler.
+        """
+        super()._check_input_cols()
+        super()._check_dataset_type(dataset)
+        if not self._is_fitted:
+            self._reset()
+
+        if isinstance(dataset, pd.DataFrame):
+            dataset = self._use_input_cols_only(dataset)
+            computed_states = self._compute_pandas(dataset, self.input_cols, self.custom_states)
+        else:
+            computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
+
+        # The cached sklearn object and fitted arrays hold the previous state.
+        self._clear_cached_fitted_state()
+        self._is_fitted = True
+        return self
+
     def _fit_sklearn(self, dataset: pd.DataFrame) -> None:
         dataset = self._use_input_cols_only(dataset)
         sklearn_scaler = self._create_unfitted_sklearn_object()
@@ -138,13 +174,28 @@ class MinMaxScaler(base.BaseTransformer):
 
     def _fit_snowpark(self, dataset: snowpark.DataFrame) -> None:
         computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
+
+    def _merge_states(self, computed_states: Mapping[str, Mapping[str, Any]]) -> None:
+        """
+        Merge the states computed on a batch of the dataset into the fitted state of the scaler.
 
-        # assign states to the object
+        Args:
+            computed_states: A dict of {column_name: {state: value}} of each input column, as returned by `_compute`.
+        """
         for input_col in self.input_cols:
             numeric_stats = computed_states[input_col]
+            batch_min = numeric_stats[_utils.NumericStatistics.MIN]
+            batch_max = numeric_stats[_utils.NumericStatistics.MAX]
+            if input_col in self.data_min_ and batch_min is None:
+                continue
+
+            data_min = float(batch_min)
+            data_max = float(batch_max)
+            if input_col in self.data_min_:
+                data_min = min(self.data_min_[input_col], data_min)
+                data_max = max(self.data_max_[input_col], data_max)
 
-            data_min = float(numeric_stats[_utils.NumericStatistics.MIN])
-            data_max = float(numeric_stats[_utils.NumericStatistics.MAX])
             data_range = data_max - data_min
             self.scale_[input_col] = (
                 self.feature_range[1] - self.feature_range[0]
@@ -180,7 +231,7 @@ class MinMaxScaler(base.BaseTransformer):
         if isinstance(dataset, snowpark.DataFrame):
             output_df = self._transform_snowpark(dataset)
         else:
-            output_df = self._transform_sklearn(dataset)
+            output_df = self._transform_pandas_numpy(dataset)
 
         return self._drop_input_columns(output_df) if self._drop_input_cols is True else output_df
 
@@ -217,6 +268,20 @@ class MinMaxScaler(base.BaseTransformer):
         transformed_dataset = transformed_dataset[self.output_cols + passthrough_columns]
         return transformed_dataset
 
+    def _create_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        return {
+            "scale": self._convert_attribute_dict_to_ndarray(self.scale_, np.float64),
+            "min": self._convert_attribute_dict_to_ndarray(self.min_, np.float64),
+        }
+
+    def _transform_numpy(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        fitted_arrays = self._get_fitted_arrays()
+        X *= fitted_arrays["scale"]
+        X += fitted_arrays["min"]
+        if self.clip:
+            np.clip(X, self.feature_range[0], self.feature_range[1], out=X)
+        return X
+
     def _create_unfitted_sklearn_object(self) -> preprocessing.MinMaxScaler:
         return preprocessing.MinMaxScaler(feature_range=self.feature_range, clip=self.clip)
 
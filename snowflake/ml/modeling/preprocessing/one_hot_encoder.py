@@ -38,7 +38,7 @@ _N_FEATURES_OUT = "_N_FEATURES_OUT"
 # transformer with the sklearn version
 _SKLEARN_INITIAL_KEYWORDS = ("sparse", "handle_unknown")  # initial keywords in sklearn
 _SKLEARN_UNUSED_KEYWORDS = "dtype"  # sklearn keywords that are unused in snowml
-_SNOWML_ONLY_KEYWORDS = ["input_cols", "output_cols"]  # snowml only keywords not present in sklearn
+_SNOWML_ONLY_KEYWORDS = ["input_cols", "output_cols", "sparse_format"]  # snowml only keywords not present in sklearn
 
 # Added keywords mapped to the sklearn versions in which they were added. Update mappings in new
 # sklearn versions to support parameter validation.
@@ -131,6 +131,16 @@ class OneHotEncoder(base.BaseTransformer):
         sparse: bool, default=False
             Will return a column with sparse representation if set True else will return
             a separate column for each category.
+        sparse_format: {'object', 'index'}, default='object'
+            Representation of the sparse output of a Snowpark DataFrame when `sparse=True`.
+            - 'object': each output value is an OBJECT of the form
+              ``{"<encoding>": 1, "array_length": <n_features_out>}``, which can be loaded with
+              :func:`snowflake.ml.utils.sparse.to_pandas_with_sparse`.
+            - 'index': each output value is the integer index of the nonzero element, or null if the
+              one-hot encoded features are all zeros. The array lengths are given by `n_features_outs_`.
+              This representation can be loaded without parsing JSON with
+              :func:`snowflake.ml.utils.sparse.to_csr_matrix` or
+              :func:`snowflake.ml.utils.sparse.to_pandas_with_sparse_indices`.
         handle_unknown: {'error', 'ignore'}, default='error'
             Specifies the way unknown categories are handled during :meth:`transform`.
             - 'error': Raise an error if an unknown category is present during transform.
@@ -171,6 +181,9 @@ class OneHotEncoder(base.BaseTransformer):
             `max_categories` to a non-default value and `drop_idx[i]` corresponds
             to a infrequent category, then the entire infrequent category is
             dropped.
+        n_features_outs_: list [int]
+            The number of output features of each input column, i.e. the array length of its sparse
+            representation.
         infrequent_categories_: list [ndarray([category])]
             Defined only if infrequent categories are enabled by setting
             `min_frequency` or `max_categories` to a non-default value.
@@ -185,6 +198,7 @@ class OneHotEncoder(base.BaseTransformer):
         categories: Union[str, Dict[str, type_utils.LiteralNDArrayType]] = "auto",
         drop: Optional[Union[str, npt.ArrayLike]] = None,
         sparse: bool = False,
+        sparse_format: str = "object",
         handle_unknown: str = "error",
         min_frequency: Optional[Union[int, float]] = None,
         max_categories: Optional[int] = None,
@@ -197,6 +211,7 @@ class OneHotEncoder(base.BaseTransformer):
         self.categories = categories
         self.drop = drop
         self.sparse = sparse
+        self.sparse_format = sparse_format
         self.handle_unknown = handle_unknown
         self.min_frequency = min_frequency
         self.max_categories = max_categories
@@ -232,6 +247,11 @@ class OneHotEncoder(base.BaseTransformer):
             )
         ]
 
+    @property
+    def n_features_outs_(self) -> List[int]:
+        """The number of output features of each input column."""
+        return list(self._n_features_outs)
+
     def _reset(self) -> None:
         """Reset internal data-dependent state. Constructor parameters are not touched."""
         super()._reset()
@@ -714,7 +734,8 @@ class OneHotEncoder(base.BaseTransformer):
         `self.sparse=True`. Return the sparse representation where
         the transformed output is
         {column_index: 1.0, "array_length": length} for each value
-        representing the corresponding 1 in the matrix.
+        representing the corresponding 1 in the matrix, or the integer
+        column_index if `self.sparse_format="index"`.
 
         Args:
             dataset: Input dataset.
@@ -736,8 +757,11 @@ class OneHotEncoder(base.BaseTransformer):
             encoded_value = {str(encoding): 1, "array_length": n_features_out}
             return encoded_value
 
-        # TODO: [SNOW-730357] Support NUMBER as the key of Snowflake OBJECT for OneHotEncoder sparse output
-        state_pandas[_ENCODED_VALUE] = state_pandas.apply(lambda x: map_encoded_value(x), axis=1)
+        if self.sparse_format == "index":
+            state_pandas[_ENCODED_VALUE] = state_pandas[_ENCODING].astype(np.int64)
+        else:
+            # TODO: [SNOW-730357] Support NUMBER as the key of Snowflake OBJECT for OneHotEncoder sparse output
+            state_pandas[_ENCODED_VALUE] = state_pandas.apply(lambda x: map_encoded_value(x), axis=1)
 
         # columns: COLUMN_NAME, CATEGORY, COUNT, FITTED_CATEGORY, ENCODING, N_FEATURES_OUT, ENCODED_VALUE
         assert dataset._session is not None
@@ -1006,6 +1030,15 @@ class OneHotEncoder(base.BaseTransformer):
                 ),
             )
 
+        # sparse_format
+        if self.sparse_format not in {"object", "index"}:
+            raise exceptions.SnowflakeMLException(
+                error_code=error_codes.INVALID_ATTRIBUTE,
+                original_exception=ValueError(
+                    f"`sparse_format` must be one of 'object', 'index', got {self.sparse_format}."
+                ),
+            )
+
         # handle_unknown
         # TODO(hayu): [SNOW-752263] Support OneHotEncoder handle_unknown="infrequent_if_exist".
         #  Add back when `handle_unknown="infrequent_if_exist"` is supported.
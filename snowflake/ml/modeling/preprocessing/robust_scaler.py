@@ -2,6 +2,7 @@
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from scipy import stats
 from sklearn import preprocessing
@@ -209,7 +210,7 @@ class RobustScaler(base.BaseTransformer):
         if isinstance(dataset, snowpark.DataFrame):
             output_df = self._transform_snowpark(dataset)
         else:
-            output_df = self._transform_sklearn(dataset)
+            output_df = self._transform_pandas_numpy(dataset)
 
         return self._drop_input_columns(output_df) if self._drop_input_cols is True else output_df
 
@@ -238,6 +239,22 @@ class RobustScaler(base.BaseTransformer):
         transformed_dataset = transformed_dataset[self.output_cols + passthrough_columns]
         return transformed_dataset
 
+    def _create_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        fitted_arrays = {}
+        if self.center_ is not None:
+            fitted_arrays["center"] = self._convert_attribute_dict_to_ndarray(self.center_, np.float64)
+        if self.scale_ is not None:
+            fitted_arrays["scale"] = self._convert_attribute_dict_to_ndarray(self.scale_, np.float64)
+        return fitted_arrays
+
+    def _transform_numpy(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        fitted_arrays = self._get_fitted_arrays()
+        if "center" in fitted_arrays:
+            X -= fitted_arrays["center"]
+        if "scale" in fitted_arrays:
+            X /= fitted_arrays["scale"]
+        return X
+
     def _create_unfitted_sklearn_object(self) -> preprocessing.RobustScaler:
         return preprocessing.RobustScaler(
             with_centering=self.with_centering,
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn import preprocessing
 from sklearn.preprocessing import _data as sklearn_preprocessing_data
@@ -33,6 +34,8 @@ class StandardScaler(base.BaseTransformer):
         mean_: Dictionary mapping input column name to the mean value for that feature. None if with_mean is False.
         var_: Dictionary mapping input column name to the variance for that feature. Used to compute scale_. None if
             with_std is False
+        n_samples_seen_: Dictionary mapping input column name to the number of non-null samples processed for that
+            feature. Used to merge new batches of data in `partial_fit`.
     """
 
     def __init__(
@@ -71,6 +74,8 @@ class StandardScaler(base.BaseTransformer):
             var_: dict {column_name: value} or None
                 The variance for each feature in the training set. Used to compute
                 `scale_`. Equal to ``None`` when ``with_std=False``.
+            n_samples_seen_: dict {column_name: value}
+                The number of non-null samples processed for each feature.
         """
         self.with_mean = with_mean
         self.with_std = with_std
@@ -78,13 +83,15 @@ class StandardScaler(base.BaseTransformer):
         self.scale_: Optional[Dict[str, float]] = {} if with_std else None
         self.mean_: Optional[Dict[str, float]] = {} if with_mean else None
         self.var_: Optional[Dict[str, float]] = {} if with_std else None
+        self.n_samples_seen_: Dict[str, int] = {}
+        # The mean is required to merge variances in `partial_fit`, even if the data is not centered.
+        self._running_mean: Dict[str, float] = {}
 
-        self.custom_states: List[str] = []
-        if with_mean:
+        self.custom_states: List[str] = [_utils.NumericStatistics.COUNT]
+        if with_mean or with_std:
             self.custom_states.append(_utils.NumericStatistics.MEAN)
         if with_std:
             self.custom_states.append(_utils.NumericStatistics.VAR_POP)
-            self.custom_states.append(_utils.NumericStatistics.STDDEV_POP)
 
         super().__init__(drop_input_cols=drop_input_cols, custom_states=self.custom_states)
 
@@ -103,6 +110,9 @@ class StandardScaler(base.BaseTransformer):
             self.mean_ = {} if self.with_mean else None
         if hasattr(self, "var_"):
             self.var_ = {} if self.with_std else None
+        if hasattr(self, "n_samples_seen_"):
+            self.n_samples_seen_ = {}
+            self._running_mean = {}
 
     @telemetry.send_api_usage_telemetry(
         project=base.PROJECT,
@@ -130,12 +140,52 @@ class StandardScaler(base.BaseTransformer):
         self._is_fitted = True
         return self
 
+    @telemetry.send_api_usage_telemetry(
+        project=base.PROJECT,
+        subproject=base.SUBPROJECT,
+    )
+    def partial_fit(self, dataset: Union[snowpark.DataFrame, pd.DataFrame]) -> "StandardScaler":
+        """
+        Update mean and std values with a new batch of the dataset.
+
+        Only the count, mean and variance of the new batch are computed. They are merged into the fitted state
+        with the parallel algorithm of Chan et al., so the cost of an update is proportional to the size of the
+        batch. Calling `partial_fit` on an unfitted scaler is equivalent to calling `fit`.
+
+        Args:
+            dataset: Input dataset.
+
+        Returns:
+            Fitted scaler.
+        """
+        super()._check_input_cols()
+        super()._check_dataset_type(dataset)
+        if not self._is_fitted:
+            self._reset()
+
+        if isinstance(dataset, pd.DataFrame):
+            dataset = self._use_input_cols_only(dataset)
+            computed_states = self._compute_pandas(dataset, self.input_cols, self.custom_states)
+        else:
+            computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
+
+        # The cached sklearn object and fitted arrays hold the previous state.
+        self._clear_cached_fitted_state()
+        self._is_fitted = True
+        return self
+
     def _fit_sklearn(self, dataset: pd.DataFrame) -> None:
         dataset = self._use_input_cols_only(dataset)
         sklearn_scaler = self._create_unfitted_sklearn_object()
         sklearn_scaler.fit(dataset[self.input_cols])
 
+        n_samples_seen = np.broadcast_to(sklearn_scaler.n_samples_seen_, len(self.input_cols))
         for i, input_col in enumerate(self.input_cols):
+            self.n_samples_seen_[input_col] = int(n_samples_seen[i])
+            # NB: sklearn computes the mean whenever `with_std` is True.
+            if sklearn_scaler.mean_ is not None:
+                self._running_mean[input_col] = float(sklearn_scaler.mean_[i])
             if self.mean_ is not None:
                 self.mean_[input_col] = float(sklearn_scaler.mean_[i])
             if self.scale_ is not None:
@@ -145,21 +195,44 @@ class StandardScaler(base.BaseTransformer):
 
     def _fit_snowpark(self, dataset: snowpark.DataFrame) -> None:
         computed_states = self._compute(dataset, self.input_cols, self.custom_states)
+        self._merge_states(computed_states)
+
+    def _merge_states(self, computed_states: Mapping[str, Mapping[str, Any]]) -> None:
+        """
+        Merge the states computed on a batch of the dataset into the fitted state of the scaler.
 
-        # assign states to the object
+        Args:
+            computed_states: A dict of {column_name: {state: value}} of each input column, as returned by `_compute`.
+        """
         for input_col in self.input_cols:
             numeric_stats = computed_states[input_col]
+            batch_count = int(numeric_stats[_utils.NumericStatistics.COUNT])
+            if batch_count == 0 and input_col in self.n_samples_seen_:
+                continue
+
+            batch_mean = numeric_stats.get(_utils.NumericStatistics.MEAN)
+            batch_var = numeric_stats.get(_utils.NumericStatistics.VAR_POP)
+            count, mean, var = _utils.merge_moments(
+                self.n_samples_seen_.get(input_col, 0),
+                self._running_mean.get(input_col, 0.0),
+                self.var_[input_col] if self.var_ is not None and input_col in self.var_ else 0.0,
+                batch_count,
+                float(batch_mean) if batch_mean is not None else np.nan,
+                float(batch_var) if batch_var is not None else np.nan,
+            )
+
+            self.n_samples_seen_[input_col] = count
+            if self.with_mean or self.with_std:
+                self._running_mean[input_col] = mean
 
             if self.mean_ is not None:
-                self.mean_[input_col] = float(numeric_stats[_utils.NumericStatistics.MEAN])
+                self.mean_[input_col] = mean
 
             if self.var_ is not None:
-                self.var_[input_col] = float(numeric_stats[_utils.NumericStatistics.VAR_POP])
+                self.var_[input_col] = var
 
             if self.scale_ is not None:
-                self.scale_[input_col] = sklearn_preprocessing_data._handle_zeros_in_scale(
-                    float(numeric_stats[_utils.NumericStatistics.STDDEV_POP])
-                )
+                self.scale_[input_col] = sklearn_preprocessing_data._handle_zeros_in_scale(float(np.sqrt(var)))
 
     @telemetry.send_api_usage_telemetry(
         project=base.PROJECT,
@@ -187,7 +260,7 @@ class StandardScaler(base.BaseTransformer):
         if isinstance(dataset, snowpark.DataFrame):
             output_df = self._transform_snowpark(dataset)
         else:
-            output_df = self._transform_sklearn(dataset)
+            output_df = self._transform_pandas_numpy(dataset)
 
         return self._drop_input_columns(output_df) if self._drop_input_cols is True else output_df
 
@@ -219,6 +292,22 @@ class StandardScaler(base.BaseTransformer):
         transformed_dataset = transformed_dataset[self.output_cols + passthrough_columns]
         return transformed_dataset
 
+    def _create_fitted_arrays(self) -> Dict[str, npt.NDArray[np.float64]]:
+        fitted_arrays = {}
+        if self.mean_ is not None:
+            fitted_arrays["mean"] = self._convert_attribute_dict_to_ndarray(self.mean_, np.float64)
+        if self.scale_ is not None:
+            fitted_arrays["scale"] = self._convert_attribute_dict_to_ndarray(self.scale_, np.float64)
+        return fitted_arrays
+
+    def _transform_numpy(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        fitted_arrays = self._get_fitted_arrays()
+        if "mean" in fitted_arrays:
+            X -= fitted_arrays["mean"]
+        if "scale" in fitted_arrays:
+            X /= fitted_arrays["scale"]
+        return X
+
     def _create_unfitted_sklearn_object(self) -> preprocessing.StandardScaler:
         return preprocessing.StandardScaler(with_mean=self.with_mean, with_std=self.with_std)
 
@@ -0,0 +1,56 @@
+import http.server
+import re
+import threading
+import time
+from typing import Any, List, Tuple
+
+# The latency of each request, so that concurrent requests overlap.
+HTTP_LATENCY_SECS = 0.1
+
+
+class RangeRequestServer(http.server.ThreadingHTTPServer):
+    """A local stand-in of a stage storage, which serves ranges of a file with latency and tracks the requests."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__(("localhost", 0), _RangeRequestHandler)
+        self.content = content
+        self.lock = threading.Lock()
+        self.ranges: List[Tuple[int, int]] = []
+        self.num_pending = 0
+        self.max_num_pending = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.server_address[1]}/file"
+
+    def reset(self) -> None:
+        with self.lock:
+            self.ranges = []
+            self.max_num_pending = 0
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    server: RangeRequestServer
+
+    def do_GET(self) -> None:
+        content = self.server.content
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        start = int(match.group(1)) if match else 0
+        end = int(match.group(2)) + 1 if match and match.group(2) else len(content)
+        with self.server.lock:
+            self.server.ranges.append((start, end))
+            self.server.num_pending += 1
+            self.server.max_num_pending = max(self.server.max_num_pending, self.server.num_pending)
+        time.sleep(HTTP_LATENCY_SECS)
+        with self.server.lock:
+            self.server.num_pending -= 1
+
+        self.send_response(206 if match else 200)
+        if match:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(content)}")
+        self.send_header("Content-Length", str(end - start))
+        self.end_headers()
+        self.wfile.write(content[start:end])
+
+    def log_message(self, *args: Any) -> None:
+        pass
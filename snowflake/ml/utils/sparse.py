@@ -1,11 +1,15 @@
 import collections
 import json
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from pandas import arrays as pandas_arrays
 from pandas.core.arrays import sparse as pandas_sparse
+from scipy import sparse as scipy_sparse
 
+from snowflake.ml._internal.utils import identifier
 from snowflake.snowpark import DataFrame
 
 
@@ -87,3 +91,154 @@ def to_pandas_with_sparse(df: DataFrame, sparse_cols: List[str]) -> pd.DataFrame
     """
     pandas_dfs = [_pandas_to_sparse_pandas(pandas_df_batch, sparse_cols) for pandas_df_batch in df.to_pandas_batches()]
     return pd.concat(pandas_dfs)
+
+
+def _validate_sparse_index_cols(sparse_cols: List[str], array_lengths: List[int]) -> None:
+    if len(sparse_cols) != len(array_lengths):
+        raise ValueError(
+            f"The number of sparse columns ({len(sparse_cols)}) mismatches the number of array lengths "
+            f"({len(array_lengths)})."
+        )
+
+
+def _sparse_indices(
+    pandas_df: pd.DataFrame, col_name: str, array_length: int
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Return the row indices and the element indices of the nonzero elements of a sparse index column."""
+    indices = pd.to_numeric(pandas_df[col_name]).to_numpy(dtype=np.float64, na_value=np.nan)
+    rows = np.flatnonzero(~np.isnan(indices))
+    element_indices = indices[rows].astype(np.int64)
+    if element_indices.size > 0 and (element_indices.min() < 0 or element_indices.max() >= array_length):
+        raise ValueError("index greater than array_length")
+    return rows, element_indices
+
+
+def _sparse_indices_to_csr_matrix(
+    pandas_df: pd.DataFrame, sparse_cols: List[str], array_lengths: List[int], dtype: npt.DTypeLike
+) -> scipy_sparse.csr_matrix:
+    """Convert a batch of sparse index columns into a CSR matrix with the arrays of the columns side by side."""
+    all_rows, all_cols = [], []
+    offset = 0
+    for col_name, array_length in zip(sparse_cols, array_lengths):
+        rows, element_indices = _sparse_indices(pandas_df, col_name, array_length)
+        all_rows.append(rows)
+        all_cols.append(element_indices + offset)
+        offset += array_length
+
+    rows = np.concatenate(all_rows) if all_rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(all_cols) if all_cols else np.empty(0, dtype=np.int64)
+    return scipy_sparse.csr_matrix(
+        (np.ones(len(rows), dtype=dtype), (rows, cols)), shape=(pandas_df.shape[0], offset), dtype=dtype
+    )
+
+
+def _sparse_indices_to_sparse_pandas(
+    pandas_df: pd.DataFrame, sparse_cols: List[str], array_lengths: List[int]
+) -> pd.DataFrame:
+    """Convert the sparse index columns of the pandas df into multiple SparseArray columns."""
+    num_rows = pandas_df.shape[0]
+    sparse_arrays = {}
+    for col_name, array_length in zip(sparse_cols, array_lengths):
+        rows, element_indices = _sparse_indices(pandas_df, col_name, array_length)
+        # Group the rows by element index with a single sort instead of scanning the column once per element.
+        order = np.argsort(element_indices, kind="stable")
+        bounds = np.searchsorted(element_indices[order], np.arange(array_length + 1))
+        for col_i in range(array_length):
+            col_rows = rows[order[bounds[col_i] : bounds[col_i + 1]]]
+            sparse_arrays[col_name + "_" + str(col_i)] = pandas_arrays.SparseArray(
+                np.ones(len(col_rows), dtype=np.int64),
+                pandas_sparse.make_sparse_index(num_rows, col_rows.astype(np.int32), "integer"),
+                dtype=np.int64,
+            )
+
+    return pd.concat([pandas_df.drop(columns=sparse_cols), pd.DataFrame(sparse_arrays, index=pandas_df.index)], axis=1)
+
+
+def to_csr_matrix(
+    df: DataFrame, sparse_cols: List[str], array_lengths: List[int], dtype: npt.DTypeLike = np.float64
+) -> scipy_sparse.csr_matrix:
+    """Load sparse columns represented as integer indices of a Snowpark df into a SciPy CSR matrix.
+
+       Each sparse column holds, for every row, the index of the only nonzero element (with value 1) of an array of
+       the given length, or null if all elements are zeros. This is the output of `OneHotEncoder` with `sparse=True`
+       and `sparse_format="index"`. The arrays of the sparse columns are placed side by side in the order of
+       `sparse_cols`.
+
+       For example, for below input:
+       ----------------------
+       |'COL1'|'COL2'|'COL3'|
+       ----------------------
+       |'a'   |1     |0     |
+       |'b'   |0     |NULL  |
+       |'c'   |NULL  |1     |
+       ----------------------
+       The call to `to_csr_matrix(df, ['COL2', 'COL3'], [3, 2])` will return a CSR matrix of shape (3, 5):
+       [[0, 1, 0, 1, 0],
+        [1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1]]
+
+       The matrix is built batch by batch with vectorized NumPy operations, so that the result is never densified.
+
+    Args:
+        df: A Snowpark data frame contains column(s) of sparse data represented as integer indices.
+        sparse_cols: names of sparse data columns.
+        array_lengths: the array length of each sparse data column, e.g. `OneHotEncoder.n_features_outs_`.
+        dtype: data type of the returned matrix.
+
+    Returns:
+        A CSR matrix of shape (number of rows, sum of array lengths).
+    """
+    _validate_sparse_index_cols(sparse_cols, array_lengths)
+    matrices = [
+        _sparse_indices_to_csr_matrix(pandas_df_batch, sparse_cols, array_lengths, dtype)
+        for pandas_df_batch in df[sparse_cols].to_pandas_batches()
+    ]
+    if not matrices:
+        return scipy_sparse.csr_matrix((0, sum(array_lengths)), dtype=dtype)
+    return scipy_sparse.vstack(matrices, format="csr")
+
+
+def to_pandas_with_sparse_indices(df: DataFrame, sparse_cols: List[str], array_lengths: List[int]) -> pd.DataFrame:
+    """Load a Snowpark df with sparse columns represented as integer indices into pandas df with multiple SparseArray
+    columns.
+
+       Each sparse column holds, for every row, the index of the only nonzero element (with value 1) of an array of
+       the given length, or null if all elements are zeros. This is the output of `OneHotEncoder` with `sparse=True`
+       and `sparse_format="index"`. Unlike `to_pandas_with_sparse`, no JSON strings are parsed.
+
+       For example, for below input:
+       ---------------
+       |'COL1'|'COL2'|
+       ---------------
+       |'a'   |1     |
+       |'b'   |0     |
+       |'c'   |NULL  |
+       ---------------
+       The call to `to_pandas_with_sparse_indices(df, ['COL2'], [3])` will return a pandas df:
+       -----------------------------------
+       |'COL1'|'COL2_0'|'COL2_1'|'COL2_2'|
+       -----------------------------------
+       |'a'   | 0      | 1      | 0      |
+       |'b'   | 1      | 0      | 0      |
+       |'c'   | 0      | 0      | 0      |
+       -----------------------------------
+       The dtype of 'COL2_0', 'COL2_1', 'COL2_2' columns is 'Sparse[int64, 0]'.
+
+    Args:
+        df: A Snowpark data frame contains column(s) of sparse data represented as integer indices.
+        sparse_cols: names of sparse data columns.
+        array_lengths: the array length of each sparse data column, e.g. `OneHotEncoder.n_features_outs_`.
+
+    Returns:
+        A pandas dataframe with each of the sparse data column from input expanded to multiple SparseArray columns.
+        It has no rows but the same columns if the input has no rows.
+    """
+    _validate_sparse_index_cols(sparse_cols, array_lengths)
+    pandas_dfs = [
+        _sparse_indices_to_sparse_pandas(pandas_df_batch, sparse_cols, array_lengths)
+        for pandas_df_batch in df.to_pandas_batches()
+    ]
+    if not pandas_dfs:
+        empty_df = pd.DataFrame(columns=identifier.get_unescaped_names(df.columns))
+        return _sparse_indices_to_sparse_pandas(empty_df, sparse_cols, array_lengths)
+    return pd.concat(pandas_dfs, ignore_index=True)
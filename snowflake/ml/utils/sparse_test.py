@@ -3,6 +3,7 @@ import pandas as pd
 from absl.testing import absltest
 from pandas.api import types as pandas_types
 
+from snowflake import snowpark
 from snowflake.ml.utils import sparse
 
 
@@ -118,6 +119,53 @@ class SparseTest(absltest.TestCase):
         with self.assertRaises(ValueError):
             sparse._pandas_to_sparse_pandas(df, ["sparse1"])
 
+    def test_sparse_indices_to_csr_matrix(self) -> None:
+        df = pd.DataFrame({"sparse1": [1.0, 0.0, np.nan, 2.0], "sparse2": [np.nan, 1, 0, 1]})
+        expected = np.array(
+            [
+                [0, 1, 0, 0, 0],
+                [1, 0, 0, 0, 1],
+                [0, 0, 0, 1, 0],
+                [0, 0, 1, 0, 1],
+            ]
+        )
+        actual = sparse._sparse_indices_to_csr_matrix(df, ["sparse1", "sparse2"], [3, 2], np.float64)
+        self.assertEqual(actual.shape, (4, 5))
+        self.assertEqual(actual.nnz, 6)
+        np.testing.assert_array_equal(actual.toarray(), expected)
+
+    def test_sparse_indices_to_csr_matrix_index_greater_than_array_length(self) -> None:
+        df = pd.DataFrame({"sparse1": [1, 3, 0]})
+        with self.assertRaises(ValueError):
+            sparse._sparse_indices_to_csr_matrix(df, ["sparse1"], [3], np.float64)
+
+    def test_sparse_indices_to_sparse_pandas(self) -> None:
+        df_expected = pd.DataFrame(
+            {
+                "str1": ["a", "b", "c", "d"],
+                "sparse1_0": [0, 1, 0, 0],
+                "sparse1_1": [1, 0, 0, 0],
+                "sparse1_2": [0, 0, 0, 1],
+            }
+        )
+        df = pd.DataFrame({"str1": ["a", "b", "c", "d"], "sparse1": [1, 0, None, 2]})
+        df_actual = sparse._sparse_indices_to_sparse_pandas(df, ["sparse1"], [3])
+        self.assertListEqual(list(df_actual.columns), list(df_expected.columns))
+        self.assertTrue(df_expected.compare(df_actual).empty)
+        for col_name in ["sparse1_0", "sparse1_1", "sparse1_2"]:
+            self.assertTrue(pandas_types.is_sparse(df_actual[col_name].dtype))
+            np.testing.assert_array_equal(df_actual[col_name].to_numpy(), df_expected[col_name].to_numpy())
+
+    def test_to_pandas_with_sparse_indices_empty(self) -> None:
+        df = absltest.mock.MagicMock(spec=snowpark.DataFrame)
+        df.columns = ["STR1", "SPARSE1"]
+        df.to_pandas_batches.return_value = iter([])
+        df_actual = sparse.to_pandas_with_sparse_indices(df, ["SPARSE1"], [2])
+        self.assertListEqual(list(df_actual.columns), ["STR1", "SPARSE1_0", "SPARSE1_1"])
+        self.assertEqual(len(df_actual), 0)
+        for col_name in ["SPARSE1_0", "SPARSE1_1"]:
+            self.assertTrue(pandas_types.is_sparse(df_actual[col_name].dtype))
+
 
 if __name__ == "__main__":
     absltest.main()
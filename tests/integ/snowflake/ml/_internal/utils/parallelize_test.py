@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 from absl.testing import parameterized
 from absl.testing.absltest import main
 
@@ -15,13 +16,11 @@ class TestParallelize(parameterized.TestCase):
     def tearDown(self):
         self._session.close()
 
-    @parameterized.parameters(
-        {"partition_size": 2},
-        {"partition_size": 3},
-        {"partition_size": 4},
-        {"partition_size": 8},
+    @parameterized.product(
+        partition_size=[2, 3, 4, 8],
+        concurrent=[False, True],
     )
-    def test_map_dataframe_by_column_by_partition_size(self, partition_size):
+    def test_map_dataframe_by_column_by_partition_size(self, partition_size, concurrent):
         schema = ["a", "b", "c", "d", "_exclude"]
         dataset = self._session.create_dataframe([[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]], schema=schema)
 
@@ -33,11 +32,16 @@ class TestParallelize(parameterized.TestCase):
             cols=["a", "b", "c", "d"],
             map_func=_negate,
             partition_size=partition_size,
+            concurrent=concurrent,
         )
 
-        assert results == [[0, -1, -2, -3], [-5, -6, -7, -8]]
+        np.testing.assert_array_equal(results, [[0, -1, -2, -3], [-5, -6, -7, -8]])
 
-    def test_map_dataframe_by_column_multiple_output_columns(self):
+    @parameterized.parameters(
+        {"concurrent": False},
+        {"concurrent": True},
+    )
+    def test_map_dataframe_by_column_multiple_output_columns(self, concurrent):
         schema = ["a", "b", "c", "d"]
         dataset = self._session.create_dataframe([[0, 1, 2, 3], [5, 6, 7, 8]], schema=schema)
 
@@ -50,9 +54,10 @@ class TestParallelize(parameterized.TestCase):
             cols=schema,
             map_func=_increment_and_negate,
             partition_size=2,
+            concurrent=concurrent,
         )
 
-        assert results == [[1, 0, 2, -1, 3, -2, 4, -3], [6, -5, 7, -6, 8, -7, 9, -8]]
+        np.testing.assert_array_equal(results, [[1, 0, 2, -1, 3, -2, 4, -3], [6, -5, 7, -6, 8, -7, 9, -8]])
 
     def test_map_dataframe_by_column_nonpositive_partition_size_not_allowed(self):
         schema = ["a", "b", "c", "d", "_exclude"]
@@ -69,7 +74,11 @@ class TestParallelize(parameterized.TestCase):
                 partition_size=0,
             )
 
-    def test_map_dataframe_by_column_variable_column_output_not_allowed(self):
+    @parameterized.parameters(
+        {"concurrent": False},
+        {"concurrent": True},
+    )
+    def test_map_dataframe_by_column_variable_column_output_not_allowed(self, concurrent):
         schema = ["1", "2", "3", "4"]
         dataset = self._session.create_dataframe([["a", "b", "c", "d"]], schema=schema)
 
@@ -83,9 +92,14 @@ class TestParallelize(parameterized.TestCase):
                 cols=schema,
                 map_func=_unroll_columns,
                 partition_size=1,
+                concurrent=concurrent,
             )
 
-    def test_map_dataframe_by_column_variable_row_output_not_allowed(self):
+    @parameterized.parameters(
+        {"concurrent": False},
+        {"concurrent": True},
+    )
+    def test_map_dataframe_by_column_variable_row_output_not_allowed(self, concurrent):
         schema = ["1", "2", "3", "4"]
         dataset = self._session.create_dataframe([["a", "b", "c", "d"]], schema=schema)
 
@@ -103,6 +117,7 @@ class TestParallelize(parameterized.TestCase):
                 cols=schema,
                 map_func=_unroll_rows,
                 partition_size=2,
+                concurrent=concurrent,
             )
 
     @parameterized.parameters(
@@ -10,6 +10,7 @@ def get_build_rules_for_native_impl():
         shard_count = SHARD_COUNT,
         timeout = TIMEOUT,
         deps = [
+            "//snowflake/ml/_internal/utils:parallelize",
             "//snowflake/ml/modeling/impute:simple_imputer",
             "//snowflake/ml/utils:connection_params",
             "//tests/integ/snowflake/ml/modeling/framework:utils",
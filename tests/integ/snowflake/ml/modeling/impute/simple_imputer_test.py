@@ -1,4 +1,5 @@
 import importlib
+import math
 import os
 import pickle
 import sys
@@ -9,9 +10,11 @@ from unittest import TestCase
 import cloudpickle
 import joblib
 import numpy as np
+import pandas as pd
 from absl.testing.absltest import main
 from sklearn.impute import SimpleImputer as SklearnSimpleImputer
 
+from snowflake.ml._internal.utils import parallelize
 from snowflake.ml.modeling.impute import SimpleImputer  # type: ignore[attr-defined]
 from snowflake.ml.utils.connection_params import SnowflakeLoginOptions
 from snowflake.snowpark import Session
@@ -84,6 +87,51 @@ class SimpleImputerTest(TestCase):
 
         np.testing.assert_equal(statistics_numpy, simple_imputer_sklearn.statistics_)
 
+    def test_partial_fit(self) -> None:
+        """
+        Verify fitted statistics after fitting on batches of the dataset.
+
+        Raises
+        ------
+        AssertionError
+            If the fit result differs from the one generated by Sklearn on the whole dataset.
+        """
+        input_cols = NUMERIC_COLS
+        output_cols = OUTPUT_COLS
+        df_pandas, df = framework_utils.get_df(self._session, DATA_NONE_NAN, SCHEMA)
+
+        simple_imputer = SimpleImputer(input_cols=input_cols, output_cols=output_cols)
+        first_ids = df[ID_COL].isin(["1", "2", "3"])
+        simple_imputer.partial_fit(df.filter(first_ids))
+        simple_imputer.partial_fit(df.filter(~first_ids))
+
+        simple_imputer_sklearn = SklearnSimpleImputer()
+        simple_imputer_sklearn.fit(df_pandas[input_cols])
+
+        statistics_numpy = np.array(list(simple_imputer.statistics_.values()))
+        np.testing.assert_allclose(statistics_numpy, simple_imputer_sklearn.statistics_)
+
+        transformed = simple_imputer.transform(df_pandas)
+        np.testing.assert_allclose(
+            transformed[output_cols].to_numpy(), simple_imputer_sklearn.transform(df_pandas[input_cols])
+        )
+
+    def test_partial_fit_invalid_strategy(self) -> None:
+        """
+        Verify that partial fit is only supported with the mean strategy.
+
+        Raises
+        ------
+        AssertionError
+            If partial fit does not fail with strategies other than "mean".
+        """
+        _, df = framework_utils.get_df(self._session, DATA, SCHEMA)
+
+        for strategy in ["median", "most_frequent", "constant"]:
+            simple_imputer = SimpleImputer(strategy=strategy, input_cols=NUMERIC_COLS, output_cols=OUTPUT_COLS)
+            with self.assertRaisesRegex(NotImplementedError, "only supported with the 'mean' strategy"):
+                simple_imputer.partial_fit(df)
+
     def test_fit_constant(self) -> None:
         """
         Verify constant fit statistics.
@@ -206,6 +254,44 @@ class SimpleImputerTest(TestCase):
 
         np.testing.assert_allclose(statistics_numpy, simple_imputer_sklearn.statistics_, equal_nan=True)
 
+    def test_fit_query_count(self) -> None:
+        """
+        Verify that the number of queries issued by fit grows with the number of partitions of the input columns,
+        and not with the number of input columns.
+
+        Raises
+        ------
+        AssertionError
+            If fitting on more columns issues more queries than the extra partitions of the columns.
+        """
+        # The number of expressions per column of each computation of the strategy that is partitioned by column.
+        strategy_exprs_per_col = {"mean": [2], "median": [1], "most_frequent": [1, 2], "constant": [1]}
+        for strategy, exprs_per_col in strategy_exprs_per_col.items():
+            query_counts = {}
+            # The widest inputs span more columns than a single partition allows.
+            for n_cols in [2, 20, 100, 600, 1200]:
+                input_cols = [f"COL{i}" for i in range(n_cols)]
+                df_pandas = pd.DataFrame({col: [1.0, 2.0, 2.0, np.nan, float(i)] for (i, col) in enumerate(input_cols)})
+                df = self._session.create_dataframe(df_pandas)
+
+                simple_imputer = SimpleImputer(strategy=strategy, input_cols=input_cols, output_cols=input_cols)
+                with self._session.query_history() as query_history:
+                    simple_imputer.fit(df)
+                n_partitions = sum(
+                    math.ceil(n_cols / parallelize.get_partition_size(n_cols=n_cols, n_exprs_per_col=n_exprs))
+                    for n_exprs in exprs_per_col
+                )
+                query_counts[n_cols] = (n_partitions, len(query_history.queries))
+
+            self.assertGreater(query_counts[1200][0], query_counts[2][0])
+            base_partitions, base_query_count = query_counts[2]
+            for n_partitions, query_count in query_counts.values():
+                self.assertEqual(
+                    query_count - base_query_count,
+                    n_partitions - base_partitions,
+                    f"Query counts grow faster than partitions for {strategy}: {query_counts}",
+                )
+
     def test_reset(self) -> None:
         """
         Verify reset logic.
@@ -121,6 +121,51 @@ class ConfusionMatrixTest(parameterized.TestCase):
                     normalize=params["normalize"],
                 )
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL]}},
+    )
+    def test_large_num_of_rows(self, params: Dict[str, Any]) -> None:
+        # The row count is not a multiple of any batch size, to cover partial batches.
+        data, _ = utils.gen_fuzz_data(
+            rows=10 * 1000 + 7,
+            types=[utils.DataType.INTEGER] * 2 + [utils.DataType.FLOAT],
+            low=-1,
+            high=5,
+        )
+        input_df = self._session.create_dataframe(data, schema=_SCHEMA)
+        pandas_df = input_df.to_pandas()
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            actual_cm = snowml_metrics.confusion_matrix(
+                df=input_df,
+                y_true_col_name=_Y_TRUE_COL,
+                y_pred_col_name=_Y_PRED_COL,
+                sample_weight_col_name=sample_weight_col_name,
+            )
+            sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+            sklearn_cm = sklearn_metrics.confusion_matrix(
+                pandas_df[_Y_TRUE_COL],
+                pandas_df[_Y_PRED_COL],
+                sample_weight=sample_weight,
+            )
+            np.testing.assert_allclose(actual_cm, sklearn_cm)
+
+    def test_null_labels(self) -> None:
+        data = [[0, 1, 1, 1.0], [1, None, 2, 1.0], [2, 2, None, 1.0], [3, 2, 2, 2.0], [4, 1, 2, 0.5]]
+        input_df = self._session.create_dataframe(data, schema=_SCHEMA)
+
+        with self._session.query_history() as query_history:
+            actual_cm = snowml_metrics.confusion_matrix(
+                df=input_df,
+                y_true_col_name=_Y_TRUE_COL,
+                y_pred_col_name=_Y_PRED_COL,
+                sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+            )
+        self.assertEqual(len(query_history.queries), 1)
+
+        sklearn_cm = sklearn_metrics.confusion_matrix([1, 2, 1], [1, 2, 2], sample_weight=[1.0, 2.0, 0.5])
+        np.testing.assert_allclose(actual_cm, sklearn_cm)
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 from absl.testing.absltest import TestCase, main
@@ -103,6 +105,33 @@ class CorrelationTest(TestCase):
 
         assert np.allclose(corr_matrix, expected_corr_matrix)
 
+    @mock.patch("snowflake.ml.modeling.metrics.metrics_utils.COLUMN_BLOCK_SIZE", 3)
+    def test_with_column_blocks(self) -> None:
+        num_rows = 1000 + 7
+        num_cols = 7  # not a multiple of the block size
+        arr = np.random.rand(num_rows, num_cols)
+        pddf = pd.DataFrame(arr, columns=[f"COL_{i}" for i in range(num_cols)])
+        input_df = self._session.create_dataframe(pddf)
+
+        corr_matrix = metrics.correlation(df=input_df).to_numpy()
+        expected_corr_matrix = np.corrcoef(arr, rowvar=False)
+
+        assert np.allclose(corr_matrix, expected_corr_matrix)
+
+    def test_udtfs_registered_once(self) -> None:
+        input_df = self._session.create_dataframe(
+            [Row(-1.0, -1.5), Row(8.3, 7.6), Row(2.0, 2.5), Row(3.5, 4.7)],
+            schema=["COL1", "COL2"],
+        )
+        metrics.correlation(df=input_df)
+
+        with self._session.query_history() as query_history:
+            corr_matrix = metrics.correlation(df=input_df).to_numpy()
+        assert not any(query.sql_text.upper().startswith("CREATE") for query in query_history.queries)
+
+        expected_corr_matrix = input_df.to_pandas().corr().to_numpy()
+        assert np.allclose(corr_matrix, expected_corr_matrix)
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 from absl.testing.absltest import TestCase, main
@@ -120,6 +122,19 @@ class CovarianceTest(TestCase):
 
         assert np.allclose(cov_matrix, expected_cov_matrix)
 
+    @mock.patch("snowflake.ml.modeling.metrics.metrics_utils.MAX_VALUES_PER_SHARD", 1000)
+    def test_with_many_shards(self) -> None:
+        num_rows = 10 * 1000 + 7
+        num_cols = 5
+        arr = np.random.rand(num_rows, num_cols)
+        pddf = pd.DataFrame(arr, columns=[f"COL_{i}" for i in range(num_cols)])
+        input_df = self._session.create_dataframe(pddf)
+
+        cov_matrix = metrics.covariance(df=input_df).to_numpy()
+        expected_cov_matrix = np.cov(arr, rowvar=False)
+
+        assert np.allclose(cov_matrix, expected_cov_matrix)
+
 
 if __name__ == "__main__":
     main()
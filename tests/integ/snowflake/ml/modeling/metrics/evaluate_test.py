@@ -0,0 +1,159 @@
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from absl.testing import parameterized
+from absl.testing.absltest import main
+from sklearn import calibration, metrics as sklearn_metrics
+
+from snowflake import snowpark
+from snowflake.ml.modeling import metrics as snowml_metrics
+from snowflake.ml.utils import connection_params
+from tests.integ.snowflake.ml.modeling.framework import utils
+
+_ROWS = 100
+_TYPES = [utils.DataType.INTEGER] * 2 + [utils.DataType.FLOAT] * 2
+_BINARY_DATA, _SCHEMA = utils.gen_fuzz_data(
+    rows=_ROWS,
+    types=_TYPES,
+    low=0,
+    high=[2, 2, 1, 2],
+)
+_Y_TRUE_COL = _SCHEMA[1]
+_Y_PRED_COL = _SCHEMA[2]
+_Y_PROBA_COL = _SCHEMA[3]
+_SAMPLE_WEIGHT_COL = _SCHEMA[4]
+_MULTICLASS_DATA = [
+    [0, 2, 0.1, 0.2, 0.7],
+    [1, 1, 0.3, 0.6, 0.1],
+    [2, 0, 0.8, 0.1, 0.1],
+    [3, 2, 0.2, 0.5, 0.3],
+    [4, 1, 0.4, 0.4, 0.2],
+]
+_MULTICLASS_SCHEMA = ["ID", "Y", "P_0", "P_1", "P_2"]
+_MULTICLASS_Y_PROBA_COLS = _MULTICLASS_SCHEMA[2:]
+
+
+class EvaluateTest(parameterized.TestCase):
+    """Test evaluate."""
+
+    def setUp(self) -> None:
+        """Creates Snowpark and Snowflake environments for testing."""
+        self._session = snowpark.Session.builder.configs(connection_params.SnowflakeLoginOptions()).create()
+
+    def tearDown(self) -> None:
+        self._session.close()
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL]}},
+    )
+    def test_binary(self, params: Dict[str, Any]) -> None:
+        input_df = self._session.create_dataframe(_BINARY_DATA, schema=_SCHEMA)
+        pandas_df = input_df.to_pandas()
+        y_true = pandas_df[_Y_TRUE_COL]
+        y_pred = pandas_df[_Y_PRED_COL]
+        y_proba = pandas_df[_Y_PROBA_COL]
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            with self._session.query_history() as query_history:
+                actual_report = snowml_metrics.evaluate(
+                    df=input_df,
+                    y_true_col_name=_Y_TRUE_COL,
+                    y_pred_col_name=_Y_PRED_COL,
+                    y_proba_col_names=_Y_PROBA_COL,
+                    sample_weight_col_name=sample_weight_col_name,
+                )
+            self.assertLessEqual(len(query_history.queries), 3)
+
+            sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+            self.assertAlmostEqual(
+                sklearn_metrics.accuracy_score(y_true, y_pred, sample_weight=sample_weight),
+                actual_report["accuracy"],
+            )
+            self.assertAlmostEqual(
+                sklearn_metrics.precision_score(y_true, y_pred, sample_weight=sample_weight),
+                actual_report["precision"],
+            )
+            self.assertAlmostEqual(
+                sklearn_metrics.recall_score(y_true, y_pred, sample_weight=sample_weight),
+                actual_report["recall"],
+            )
+            self.assertAlmostEqual(
+                sklearn_metrics.f1_score(y_true, y_pred, sample_weight=sample_weight),
+                actual_report["f1"],
+            )
+            np.testing.assert_allclose(
+                actual_report["confusion_matrix"],
+                sklearn_metrics.confusion_matrix(y_true, y_pred, sample_weight=sample_weight),
+            )
+            self.assertAlmostEqual(
+                sklearn_metrics.log_loss(y_true, y_proba, sample_weight=sample_weight),
+                actual_report["log_loss"],
+            )
+            self.assertAlmostEqual(
+                sklearn_metrics.roc_auc_score(y_true, y_proba, sample_weight=sample_weight),
+                actual_report["roc_auc"],
+            )
+            if sample_weight_col_name is None:
+                prob_true, prob_pred = calibration.calibration_curve(y_true, y_proba)
+                np.testing.assert_allclose(actual_report["calibration"][0], prob_true)
+                np.testing.assert_allclose(actual_report["calibration"][1], prob_pred)
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"n_bins": 2},
+        {"n_bins": 5},
+        {"n_bins": 10},
+    )
+    def test_calibration_bin_edges(self, n_bins: int) -> None:
+        edges = np.linspace(0, 1, n_bins + 1)
+        y_proba = np.concatenate([edges, np.arange(n_bins + 1) / n_bins, np.nextafter(edges, 0.5)])
+        y_true = np.arange(len(y_proba)) % 2
+        input_df = self._session.create_dataframe(pd.DataFrame({"Y": y_true, "P": y_proba}))
+
+        actual_report = snowml_metrics.evaluate(
+            df=input_df,
+            y_true_col_name="Y",
+            y_proba_col_names=["P"],
+            metrics=["calibration"],
+            n_bins=n_bins,
+        )
+        prob_true, prob_pred = calibration.calibration_curve(y_true, y_proba, n_bins=n_bins)
+        np.testing.assert_allclose(actual_report["calibration"][0], prob_true)
+        np.testing.assert_allclose(actual_report["calibration"][1], prob_pred)
+
+    def test_multiclass_log_loss(self) -> None:
+        pandas_df = pd.DataFrame(_MULTICLASS_DATA, columns=_MULTICLASS_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        actual_report = snowml_metrics.evaluate(
+            df=input_df,
+            y_true_col_name="Y",
+            y_proba_col_names=_MULTICLASS_Y_PROBA_COLS,
+            metrics=["log_loss"],
+        )
+        self.assertEqual(list(actual_report.keys()), ["log_loss"])
+        self.assertAlmostEqual(
+            sklearn_metrics.log_loss(pandas_df["Y"], pandas_df[_MULTICLASS_Y_PROBA_COLS]),
+            actual_report["log_loss"],
+        )
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"metrics": ["accuracy", "mean_absolute_error"]}},
+        {"params": {"metrics": ["roc_auc"], "y_proba_col_names": None}},
+        {"params": {"metrics": ["roc_auc"], "y_proba_col_names": _MULTICLASS_Y_PROBA_COLS}},
+    )
+    def test_invalid_params(self, params: Dict[str, Any]) -> None:
+        input_df = self._session.create_dataframe(pd.DataFrame(_MULTICLASS_DATA, columns=_MULTICLASS_SCHEMA))
+
+        with self.assertRaises(ValueError):
+            snowml_metrics.evaluate(
+                df=input_df,
+                y_true_col_name="Y",
+                y_pred_col_name="Y",
+                y_proba_col_names=params.get("y_proba_col_names", _MULTICLASS_Y_PROBA_COLS[0]),
+                metrics=params["metrics"],
+            )
+
+
+if __name__ == "__main__":
+    main()
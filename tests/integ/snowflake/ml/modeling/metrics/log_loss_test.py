@@ -173,6 +173,30 @@ class LogLossTest(parameterized.TestCase):
             )
             self.assertAlmostEqual(sklearn_loss, actual_loss)
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"data": _BINARY_DATA, "y_true": _BINARY_Y_TRUE_COL, "y_pred": _BINARY_Y_PRED_COL}},
+        {"params": {"data": _MULTICLASS_DATA, "y_true": _MULTICLASS_Y_TRUE_COL, "y_pred": _MULTICLASS_Y_PRED_COLS}},
+    )
+    def test_single_query(self, params: Dict[str, Any]) -> None:
+        pandas_df = pd.DataFrame(params["data"], columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        with self._session.query_history() as query_history:
+            actual_loss = snowml_metrics.log_loss(
+                df=input_df,
+                y_true_col_names=params["y_true"],
+                y_pred_col_names=params["y_pred"],
+                sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+            )
+        self.assertEqual(len(query_history.queries), 1)
+
+        sklearn_loss = sklearn_metrics.log_loss(
+            pandas_df[params["y_true"]],
+            pandas_df[params["y_pred"]],
+            sample_weight=pandas_df[_SAMPLE_WEIGHT_COL].to_numpy(),
+        )
+        self.assertAlmostEqual(sklearn_loss, actual_loss)
+
     def test_multilabel(self) -> None:
         pandas_df = pd.DataFrame(_MULTILABEL_DATA, columns=_MULTILABEL_SCHEMA)
         input_df = self._session.create_dataframe(pandas_df)
@@ -1,5 +1,4 @@
 from typing import Any, Dict
-from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -122,16 +121,18 @@ class MeanAbsoluteErrorTest(parameterized.TestCase):
         )
         self.assertAlmostEqual(sklearn_loss, actual_loss)
 
-    @mock.patch("snowflake.ml.modeling.metrics.regression.result._RESULT_SIZE_THRESHOLD", 0)
-    def test_metric_size_threshold(self) -> None:
+    def test_single_query(self) -> None:
         pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
         input_df = self._session.create_dataframe(pandas_df)
 
-        actual_loss = snowml_metrics.mean_absolute_error(
-            df=input_df,
-            y_true_col_names=_Y_TRUE_COLS,
-            y_pred_col_names=_Y_PRED_COLS,
-        )
+        with self._session.query_history() as query_history:
+            actual_loss = snowml_metrics.mean_absolute_error(
+                df=input_df,
+                y_true_col_names=_Y_TRUE_COLS,
+                y_pred_col_names=_Y_PRED_COLS,
+            )
+        self.assertEqual(len(query_history.queries), 1)
+
         sklearn_loss = sklearn_metrics.mean_absolute_error(
             pandas_df[_Y_TRUE_COLS],
             pandas_df[_Y_PRED_COLS],
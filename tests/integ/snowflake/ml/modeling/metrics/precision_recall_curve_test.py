@@ -82,6 +82,28 @@ class PrecisionRecallCurveTest(parameterized.TestCase):
             np.testing.assert_allclose(actual_recall, sklearn_recall)
             np.testing.assert_allclose(actual_thresholds, sklearn_thresholds)
 
+    def test_single_query(self) -> None:
+        pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        with self._session.query_history() as query_history:
+            actual_precision, actual_recall, actual_thresholds = snowml_metrics.precision_recall_curve(
+                df=input_df,
+                y_true_col_name=_Y_TRUE_COL,
+                probas_pred_col_name=_PROBAS_PRED_COL,
+                pos_label=1,
+            )
+        self.assertEqual(len(query_history.queries), 1)
+
+        sklearn_precision, sklearn_recall, sklearn_thresholds = sklearn_metrics.precision_recall_curve(
+            pandas_df[_Y_TRUE_COL],
+            pandas_df[_PROBAS_PRED_COL],
+            pos_label=1,
+        )
+        np.testing.assert_allclose(actual_precision, sklearn_precision)
+        np.testing.assert_allclose(actual_recall, sklearn_recall)
+        np.testing.assert_allclose(actual_thresholds, sklearn_thresholds)
+
     @mock.patch("snowflake.ml.modeling.metrics.ranking.result._RESULT_SIZE_THRESHOLD", 0)
     def test_metric_size_threshold(self) -> None:
         pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
@@ -269,6 +269,36 @@ class PrecisionRecallFscoreSupportTest(parameterized.TestCase):
                 np.array((sklearn_p, sklearn_r, sklearn_f, sklearn_s)),
             )
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"data": _BINARY_DATA, "y_true": _Y_TRUE_COLS, "y_pred": _Y_PRED_COLS, "average": "samples"}},
+        {"params": {"data": _MULTICLASS_DATA, "y_true": _Y_TRUE_COL, "y_pred": _Y_PRED_COL, "average": "macro"}},
+    )
+    def test_single_query(self, params: Dict[str, Any]) -> None:
+        pandas_df = pd.DataFrame(params["data"], columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        with self._session.query_history() as query_history:
+            actual_p, actual_r, actual_f, actual_s = snowml_metrics.precision_recall_fscore_support(
+                df=input_df,
+                y_true_col_names=params["y_true"],
+                y_pred_col_names=params["y_pred"],
+                average=params["average"],
+                sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+            )
+        self.assertEqual(len(query_history.queries), 1)
+
+        sklearn_p, sklearn_r, sklearn_f, sklearn_s = sklearn_metrics.precision_recall_fscore_support(
+            pandas_df[params["y_true"]],
+            pandas_df[params["y_pred"]],
+            average=params["average"],
+            sample_weight=pandas_df[_SAMPLE_WEIGHT_COL],
+        )
+        np.testing.assert_allclose(
+            np.array((actual_p, actual_r, actual_f), dtype=np.float_),
+            np.array((sklearn_p, sklearn_r, sklearn_f), dtype=np.float_),
+        )
+        self.assertIsNone(actual_s)
+
 
 if __name__ == "__main__":
     main()
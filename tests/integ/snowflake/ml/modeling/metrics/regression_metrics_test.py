@@ -0,0 +1,165 @@
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from absl.testing import parameterized
+from absl.testing.absltest import main
+from sklearn import metrics as sklearn_metrics
+
+from snowflake import snowpark
+from snowflake.ml.modeling import metrics as snowml_metrics
+from snowflake.ml.utils import connection_params
+from tests.integ.snowflake.ml.modeling.framework import utils
+
+_ROWS = 100
+_TYPES = [utils.DataType.INTEGER] * 4 + [utils.DataType.FLOAT]
+_DATA, _SCHEMA = utils.gen_fuzz_data(
+    rows=_ROWS,
+    types=_TYPES,
+    low=0,
+    high=5,
+)
+_Y_TRUE_COL = _SCHEMA[1]
+_Y_PRED_COL = _SCHEMA[2]
+_Y_TRUE_COLS = [_SCHEMA[1], _SCHEMA[2]]
+_Y_PRED_COLS = [_SCHEMA[3], _SCHEMA[4]]
+_SAMPLE_WEIGHT_COL = _SCHEMA[5]
+
+
+def _sklearn_metric(name: str, y_true: Any, y_pred: Any, sample_weight: Any, multioutput: Any) -> Any:
+    if name == "root_mean_squared_error":
+        return sklearn_metrics.mean_squared_error(
+            y_true, y_pred, sample_weight=sample_weight, multioutput=multioutput, squared=False
+        )
+    return getattr(sklearn_metrics, name)(y_true, y_pred, sample_weight=sample_weight, multioutput=multioutput)
+
+
+class RegressionMetricsTest(parameterized.TestCase):
+    """Test regression_metrics."""
+
+    def setUp(self) -> None:
+        """Creates Snowpark and Snowflake environments for testing."""
+        self._session = snowpark.Session.builder.configs(connection_params.SnowflakeLoginOptions()).create()
+
+    def tearDown(self) -> None:
+        self._session.close()
+
+    @parameterized.parameters(  # type: ignore[misc]
+        {
+            "params": {
+                "sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL],
+                "values": [
+                    {"y_true": _Y_TRUE_COLS, "y_pred": _Y_PRED_COLS, "multioutput": "raw_values"},
+                    {"y_true": _Y_TRUE_COLS, "y_pred": _Y_PRED_COLS, "multioutput": "uniform_average"},
+                    {"y_true": _Y_TRUE_COL, "y_pred": _Y_PRED_COL, "multioutput": "uniform_average"},
+                ],
+            }
+        },
+    )
+    def test_all_metrics(self, params: Dict[str, Any]) -> None:
+        pandas_df = pd.DataFrame(_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        for values in params["values"]:
+            for sample_weight_col_name in params["sample_weight_col_name"]:
+                with self._session.query_history() as query_history:
+                    actual_metrics = snowml_metrics.regression_metrics(
+                        df=input_df,
+                        y_true_col_names=values["y_true"],
+                        y_pred_col_names=values["y_pred"],
+                        sample_weight_col_name=sample_weight_col_name,
+                        multioutput=values["multioutput"],
+                    )
+                self.assertEqual(len(query_history.queries), 1)
+
+                sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+                for name, actual_metric in actual_metrics.items():
+                    sklearn_metric = _sklearn_metric(
+                        name,
+                        pandas_df[values["y_true"]],
+                        pandas_df[values["y_pred"]],
+                        sample_weight,
+                        values["multioutput"],
+                    )
+                    np.testing.assert_allclose(actual_metric, sklearn_metric, err_msg=name)
+
+    def test_metrics_subset(self) -> None:
+        pandas_df = pd.DataFrame(_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        actual_metrics = snowml_metrics.regression_metrics(
+            df=input_df,
+            y_true_col_names=_Y_TRUE_COL,
+            y_pred_col_names=_Y_PRED_COL,
+            metrics=["mean_absolute_error", "r2_score"],
+        )
+        self.assertEqual(list(actual_metrics.keys()), ["mean_absolute_error", "r2_score"])
+        self.assertAlmostEqual(
+            sklearn_metrics.mean_absolute_error(pandas_df[_Y_TRUE_COL], pandas_df[_Y_PRED_COL]),
+            actual_metrics["mean_absolute_error"],
+        )
+        self.assertAlmostEqual(
+            sklearn_metrics.r2_score(pandas_df[_Y_TRUE_COL], pandas_df[_Y_PRED_COL]),
+            actual_metrics["r2_score"],
+        )
+
+    def test_weighted_variance_and_quantile_metrics(self) -> None:
+        pandas_df = pd.DataFrame(_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+        # The variances and the quantile of the actual values are centers computed by separate subqueries.
+        metric_names = ["r2_score", "explained_variance_score", "d2_absolute_error_score"]
+
+        actual_metrics = snowml_metrics.regression_metrics(
+            df=input_df,
+            y_true_col_names=_Y_TRUE_COLS,
+            y_pred_col_names=_Y_PRED_COLS,
+            sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+            metrics=metric_names,
+            multioutput="raw_values",
+        )
+        sample_weight = pandas_df[_SAMPLE_WEIGHT_COL].to_numpy()
+        for name in metric_names:
+            sklearn_metric = _sklearn_metric(
+                name, pandas_df[_Y_TRUE_COLS], pandas_df[_Y_PRED_COLS], sample_weight, "raw_values"
+            )
+            np.testing.assert_allclose(actual_metrics[name], sklearn_metric, err_msg=name)
+
+    def test_null_values(self) -> None:
+        pandas_df = pd.DataFrame(_DATA, columns=_SCHEMA)
+        null_df = pandas_df.astype({_Y_TRUE_COL: "float64"})
+        null_df.loc[:9, _Y_TRUE_COL] = None
+        input_df = self._session.create_dataframe(null_df)
+
+        actual_metrics = snowml_metrics.regression_metrics(
+            df=input_df,
+            y_true_col_names=_Y_TRUE_COL,
+            y_pred_col_names=_Y_PRED_COL,
+            sample_weight_col_name=_SAMPLE_WEIGHT_COL,
+            metrics=["mean_absolute_error", "r2_score", "d2_absolute_error_score"],
+        )
+        # Samples with a null value are ignored.
+        kept_df = pandas_df.iloc[10:]
+        for name, actual_metric in actual_metrics.items():
+            sklearn_metric = _sklearn_metric(
+                name,
+                kept_df[_Y_TRUE_COL],
+                kept_df[_Y_PRED_COL],
+                kept_df[_SAMPLE_WEIGHT_COL].to_numpy(),
+                "uniform_average",
+            )
+            np.testing.assert_allclose(actual_metric, sklearn_metric, err_msg=name)
+
+    def test_invalid_metrics(self) -> None:
+        input_df = self._session.create_dataframe(pd.DataFrame(_DATA, columns=_SCHEMA))
+
+        with self.assertRaises(ValueError):
+            snowml_metrics.regression_metrics(
+                df=input_df,
+                y_true_col_names=_Y_TRUE_COL,
+                y_pred_col_names=_Y_PRED_COL,
+                metrics=["mean_absolute_error", "log_loss"],
+            )
+
+
+if __name__ == "__main__":
+    main()
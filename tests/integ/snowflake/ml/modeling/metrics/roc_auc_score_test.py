@@ -220,6 +220,39 @@ class RocAucScoreTest(parameterized.TestCase):
         )
         self.assertAlmostEqual(sklearn_auc, actual_auc)
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL]}},
+    )
+    def test_n_bins(self, params: Dict[str, Any]) -> None:
+        pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        for sample_weight_col_name in params["sample_weight_col_name"]:
+            sample_weight = pandas_df[sample_weight_col_name].to_numpy() if sample_weight_col_name else None
+            sklearn_auc = sklearn_metrics.roc_auc_score(
+                pandas_df[_BINARY_Y_TRUE_COL],
+                pandas_df[_BINARY_Y_SCORE_COL],
+                sample_weight=sample_weight,
+            )
+            # Buckets holding at most one distinct score give the exact area.
+            actual_auc = snowml_metrics.roc_auc_score(
+                df=input_df,
+                y_true_col_names=_BINARY_Y_TRUE_COL,
+                y_score_col_names=_BINARY_Y_SCORE_COL,
+                sample_weight_col_name=sample_weight_col_name,
+                n_bins=1_000_000,
+            )
+            self.assertAlmostEqual(sklearn_auc, actual_auc)
+
+            actual_auc = snowml_metrics.roc_auc_score(
+                df=input_df,
+                y_true_col_names=_BINARY_Y_TRUE_COL,
+                y_score_col_names=_BINARY_Y_SCORE_COL,
+                sample_weight_col_name=sample_weight_col_name,
+                n_bins=20,
+            )
+            self.assertAlmostEqual(sklearn_auc, actual_auc, delta=0.05)
+
     @mock.patch("snowflake.ml.modeling.metrics.ranking.result._RESULT_SIZE_THRESHOLD", 0)
     def test_metric_size_threshold(self) -> None:
         pandas_df = pd.DataFrame(_MULTILABEL_DATA, columns=_MULTILABEL_SCHEMA)
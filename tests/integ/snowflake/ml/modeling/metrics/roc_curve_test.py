@@ -47,7 +47,7 @@ class RocCurveTest(parameterized.TestCase):
         {"params": {"pos_label": [0, 2, 4]}},
     )
     def test_pos_label(self, params: Dict[str, Any]) -> None:
-        pandas_df = pd.DataFrame(_MULTICLASS_DATA, columns=_SCHEMA)
+        pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
         input_df = self._session.create_dataframe(pandas_df)
 
         for pos_label in params["pos_label"]:
@@ -67,6 +67,21 @@ class RocCurveTest(parameterized.TestCase):
                 np.array((sklearn_fpr, sklearn_tpr, sklearn_thresholds)),
             )
 
+    @parameterized.parameters(  # type: ignore[misc]
+        {"pos_label": None},
+        {"pos_label": 2},
+    )
+    def test_multiclass(self, pos_label: Any) -> None:
+        input_df = self._session.create_dataframe(pd.DataFrame(_MULTICLASS_DATA, columns=_SCHEMA))
+
+        with self.assertRaisesRegex(ValueError, "multiclass format is not supported"):
+            snowml_metrics.roc_curve(
+                df=input_df,
+                y_true_col_name=_Y_TRUE_COL,
+                y_score_col_name=_Y_SCORE_COL,
+                pos_label=pos_label,
+            )
+
     @parameterized.parameters(  # type: ignore[misc]
         {"params": {"sample_weight_col_name": [None, _SAMPLE_WEIGHT_COL]}},
     )
@@ -116,6 +131,30 @@ class RocCurveTest(parameterized.TestCase):
                 np.array((sklearn_fpr, sklearn_tpr, sklearn_thresholds)),
             )
 
+    def test_n_bins(self) -> None:
+        pandas_df = pd.DataFrame(_BINARY_DATA, columns=_SCHEMA)
+        input_df = self._session.create_dataframe(pandas_df)
+
+        actual_fpr, actual_tpr, actual_thresholds = snowml_metrics.roc_curve(
+            df=input_df,
+            y_true_col_name=_Y_TRUE_COL,
+            y_score_col_name=_Y_SCORE_COL,
+            drop_intermediate=False,
+            n_bins=10,
+        )
+        sklearn_fpr, sklearn_tpr, sklearn_thresholds = sklearn_metrics.roc_curve(
+            pandas_df[_Y_TRUE_COL],
+            pandas_df[_Y_SCORE_COL],
+            drop_intermediate=False,
+        )
+
+        # Every binned threshold is a point of the exact curve.
+        self.assertLessEqual(len(actual_thresholds), 11)
+        indices = np.searchsorted(-sklearn_thresholds, -actual_thresholds)
+        np.testing.assert_allclose(actual_thresholds, sklearn_thresholds[indices])
+        np.testing.assert_allclose(actual_fpr, sklearn_fpr[indices])
+        np.testing.assert_allclose(actual_tpr, sklearn_tpr[indices])
+
     def test_multi_query_df(self) -> None:
         """Test ROC curve for DataFrames that require multiple queries to reconstruct."""
         stage = "temp"
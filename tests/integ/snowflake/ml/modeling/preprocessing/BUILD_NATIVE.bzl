@@ -140,3 +140,15 @@ def get_build_rules_for_native_impl():
             "//tests/integ/snowflake/ml/modeling/framework:utils",
         ],
     )
+
+    py_test(
+        name = "transform_latency_test",
+        srcs = ["transform_latency_test.py"],
+        deps = [
+            "//snowflake/ml/modeling/framework",
+            "//snowflake/ml/modeling/preprocessing:max_abs_scaler",
+            "//snowflake/ml/modeling/preprocessing:min_max_scaler",
+            "//snowflake/ml/modeling/preprocessing:robust_scaler",
+            "//snowflake/ml/modeling/preprocessing:standard_scaler",
+        ],
+    )
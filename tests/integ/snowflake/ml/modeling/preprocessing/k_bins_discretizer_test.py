@@ -320,6 +320,49 @@ class KBinsDiscretizerTest(TestCase):
             ]
             np.testing.assert_equal(target_output, pd_actual_output)
 
+    def test_transform_null_values(self) -> None:
+        N_BINS = [3, 2]
+        INPUT_COLS, ID_COL, OUTPUT_COLS = (
+            utils.NUMERIC_COLS,
+            utils.ID_COL,
+            utils.OUTPUT_COLS,
+        )
+
+        _, snowpark_df = utils.get_df(self._session, utils.DATA, utils.SCHEMA, np.nan)
+        _, snowpark_none_df = utils.get_df(self._session, utils.DATA_NONE_NAN, utils.SCHEMA)
+        null_mask = snowpark_none_df.sort(ID_COL)[INPUT_COLS].to_pandas().isnull().to_numpy()
+
+        for strategy in self._strategies:
+            # 1. Ordinal encoding maps null values to null
+            discretizer = KBinsDiscretizer(
+                n_bins=N_BINS,
+                encode="ordinal",
+                strategy=strategy,
+                input_cols=INPUT_COLS,
+                output_cols=OUTPUT_COLS,
+            )
+            discretizer.fit(snowpark_df)
+            actual_output = discretizer.transform(snowpark_none_df).sort(ID_COL)[OUTPUT_COLS].to_pandas()
+            np.testing.assert_equal(null_mask, actual_output.isnull().to_numpy())
+
+            # 2. One-hot encoding maps null values to all zeros
+            discretizer = KBinsDiscretizer(
+                n_bins=N_BINS,
+                encode="onehot-dense",
+                strategy=strategy,
+                input_cols=INPUT_COLS,
+                output_cols=OUTPUT_COLS,
+            )
+            discretizer.fit(snowpark_df)
+            actual_output = (
+                discretizer.transform(snowpark_none_df).sort(ID_COL)[discretizer.get_output_cols()].to_pandas()
+            )
+            start = 0
+            for idx, n_bins in enumerate(N_BINS):
+                row_sums = actual_output.iloc[:, start : start + n_bins].sum(axis=1).to_numpy()
+                np.testing.assert_equal(np.where(null_mask[:, idx], 0, 1), row_sums)
+                start += n_bins
+
 
 if __name__ == "__main__":
     main()
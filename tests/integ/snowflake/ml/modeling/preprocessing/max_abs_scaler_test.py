@@ -68,6 +68,36 @@ class MaxAbsScalerTest(TestCase):
             np.testing.assert_allclose(actual_max_abs, scaler_sklearn.max_abs_)
             np.testing.assert_allclose(actual_scale, scaler_sklearn.scale_)
 
+    def test_partial_fit(self) -> None:
+        """
+        Verify fitted states after fitting on batches of the dataset.
+
+        Raises
+        ------
+        AssertionError
+            If the fitted states do not match those of the sklearn scaler fitted on the whole dataset.
+        """
+        input_cols = NUMERIC_COLS
+        df_pandas, df = framework_utils.get_df(self._session, DATA, SCHEMA, np.nan)
+        batches_pandas = [df_pandas.iloc[:3], df_pandas.iloc[3:]]
+        first_ids = df[ID_COL].isin(["1", "2", "3"])
+        batches = [df.filter(first_ids), df.filter(~first_ids)]
+
+        for _batches in [batches_pandas, batches]:
+            scaler = MaxAbsScaler().set_input_cols(input_cols)
+            for batch in _batches:
+                scaler.partial_fit(batch)
+
+            actual_scale = scaler._convert_attribute_dict_to_ndarray(scaler.scale_)
+            actual_max_abs = scaler._convert_attribute_dict_to_ndarray(scaler.max_abs_)
+
+            # sklearn
+            scaler_sklearn = SklearnMaxAbsScaler()
+            scaler_sklearn.fit(df_pandas[input_cols])
+
+            np.testing.assert_allclose(actual_scale, scaler_sklearn.scale_)
+            np.testing.assert_allclose(actual_max_abs, scaler_sklearn.max_abs_)
+
     def test_transform(self) -> None:
         input_cols, output_cols, id_col = NUMERIC_COLS, OUTPUT_COLS, ID_COL
         input_cols_extended = input_cols.copy()
@@ -74,6 +74,42 @@ class MinMaxScalerTest(TestCase):
             np.testing.assert_allclose(actual_data_max, scaler_sklearn.data_max_)
             np.testing.assert_allclose(actual_data_range, scaler_sklearn.data_range_)
 
+    def test_partial_fit(self) -> None:
+        """
+        Verify fitted states after fitting on batches of the dataset.
+
+        Raises
+        ------
+        AssertionError
+            If the fitted states do not match those of the sklearn scaler fitted on the whole dataset.
+        """
+        input_cols = NUMERIC_COLS
+        df_pandas, df = framework_utils.get_df(self._session, DATA, SCHEMA, np.nan)
+        batches_pandas = [df_pandas.iloc[:3], df_pandas.iloc[3:]]
+        first_ids = df[ID_COL].isin(["1", "2", "3"])
+        batches = [df.filter(first_ids), df.filter(~first_ids)]
+
+        for _batches in [batches_pandas, batches]:
+            scaler = MinMaxScaler(feature_range=(-1, 1)).set_input_cols(input_cols)
+            for batch in _batches:
+                scaler.partial_fit(batch)
+
+            actual_min = scaler._convert_attribute_dict_to_ndarray(scaler.min_)
+            actual_scale = scaler._convert_attribute_dict_to_ndarray(scaler.scale_)
+            actual_data_min = scaler._convert_attribute_dict_to_ndarray(scaler.data_min_)
+            actual_data_max = scaler._convert_attribute_dict_to_ndarray(scaler.data_max_)
+            actual_data_range = scaler._convert_attribute_dict_to_ndarray(scaler.data_range_)
+
+            # sklearn
+            scaler_sklearn = SklearnMinMaxScaler(feature_range=(-1, 1))
+            scaler_sklearn.fit(df_pandas[input_cols])
+
+            np.testing.assert_allclose(actual_min, scaler_sklearn.min_)
+            np.testing.assert_allclose(actual_scale, scaler_sklearn.scale_)
+            np.testing.assert_allclose(actual_data_min, scaler_sklearn.data_min_)
+            np.testing.assert_allclose(actual_data_max, scaler_sklearn.data_max_)
+            np.testing.assert_allclose(actual_data_range, scaler_sklearn.data_range_)
+
     def test_transform(self) -> None:
         """
         Verify transformed results.
@@ -484,6 +484,46 @@ class OneHotEncoderTest(parameterized.TestCase):
 
         self.assertTrue(self.compare_sparse_transform_results(actual_arr, sklearn_arr))
 
+    def test_transform_sparse_index_format(self) -> None:
+        """
+        Verify sparse transformed results represented as integer indices.
+
+        Raises
+        ------
+        AssertionError
+            If the transformed output does not match that of the sklearn encoder.
+        """
+        input_cols, output_cols, id_col = CATEGORICAL_COLS, OUTPUT_COLS, ID_COL
+        input_cols_extended = input_cols.copy()
+        input_cols_extended.append(id_col)
+        df_pandas, df = framework_utils.get_df(self._session, DATA_NONE_NAN, SCHEMA, np.nan)
+
+        for drop in [None, "first"]:
+            encoder = OneHotEncoder(sparse=True, sparse_format="index", drop=drop, handle_unknown="ignore")
+            encoder.set_input_cols(input_cols).set_output_cols(output_cols)
+            encoder.fit(df)
+
+            transformed_df = encoder.transform(df[input_cols_extended]).sort(id_col)
+            actual_matrix = utils_sparse.to_csr_matrix(transformed_df, output_cols, encoder.n_features_outs_)
+            actual_pandas = utils_sparse.to_pandas_with_sparse_indices(
+                transformed_df[output_cols], output_cols, encoder.n_features_outs_
+            )
+
+            # sklearn
+            encoder_sklearn = SklearnOneHotEncoder(sparse=True, drop=drop, handle_unknown="ignore")
+            encoder_sklearn.fit(df_pandas[input_cols])
+            sklearn_matrix = encoder_sklearn.transform(df_pandas.sort_values(by=[id_col])[input_cols])
+
+            self.assertEqual(actual_matrix.nnz, sklearn_matrix.nnz)
+            np.testing.assert_array_equal(actual_matrix.toarray(), sklearn_matrix.toarray())
+            np.testing.assert_array_equal(actual_pandas.to_numpy(), sklearn_matrix.toarray())
+
+    def test_invalid_sparse_format(self) -> None:
+        _, df = framework_utils.get_df(self._session, DATA, SCHEMA, np.nan)
+        encoder = OneHotEncoder(sparse=True, sparse_format="json").set_input_cols(CATEGORICAL_COLS)
+        with self.assertRaisesRegex(ValueError, "`sparse_format` must be one of"):
+            encoder.fit(df)
+
     def test_transform_boolean_dense(self) -> None:
         """
         Verify dense transformed results on boolean categories.
@@ -69,6 +69,43 @@ class StandardScalerTest(TestCase):
             np.testing.assert_allclose(actual_mean, scaler_sklearn.mean_)
             np.testing.assert_allclose(actual_var, scaler_sklearn.var_)
 
+    def test_partial_fit(self) -> None:
+        """
+        Verify fitted states after fitting on batches of the dataset.
+
+        Raises
+        ------
+        AssertionError
+            If the fitted states do not match those of the sklearn scaler fitted on the whole dataset.
+        """
+        input_cols = NUMERIC_COLS
+        df_pandas, df = framework_utils.get_df(self._session, DATA, SCHEMA, np.nan)
+        batches_pandas = [df_pandas.iloc[:3], df_pandas.iloc[3:]]
+        first_ids = df[ID_COL].isin(["1", "2", "3"])
+        batches = [df.filter(first_ids), df.filter(~first_ids)]
+
+        for with_mean, with_std in [(True, True), (False, True), (True, False)]:
+            for _batches in [batches_pandas, batches]:
+                scaler = StandardScaler(with_mean=with_mean, with_std=with_std).set_input_cols(input_cols)
+                for batch in _batches:
+                    scaler.partial_fit(batch)
+
+                # sklearn
+                scaler_sklearn = SklearnStandardScaler(with_mean=with_mean, with_std=with_std)
+                scaler_sklearn.fit(df_pandas[input_cols])
+
+                np.testing.assert_equal(
+                    scaler._convert_attribute_dict_to_ndarray(scaler.n_samples_seen_), scaler_sklearn.n_samples_seen_
+                )
+                if with_mean:
+                    actual_mean = scaler._convert_attribute_dict_to_ndarray(scaler.mean_)
+                    np.testing.assert_allclose(actual_mean, scaler_sklearn.mean_)
+                if with_std:
+                    actual_scale = scaler._convert_attribute_dict_to_ndarray(scaler.scale_)
+                    actual_var = scaler._convert_attribute_dict_to_ndarray(scaler.var_)
+                    np.testing.assert_allclose(actual_scale, scaler_sklearn.scale_)
+                    np.testing.assert_allclose(actual_var, scaler_sklearn.var_)
+
     def test_transform(self) -> None:
         """
         Verify transformed results.
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import timeit
+from typing import Any, Dict, Type
+
+import numpy as np
+import pandas as pd
+from absl import logging
+from absl.testing import parameterized
+from absl.testing.absltest import main
+
+from snowflake.ml.modeling.framework import base
+from snowflake.ml.modeling.preprocessing import (  # type: ignore[attr-defined]
+    MaxAbsScaler,
+    MinMaxScaler,
+    RobustScaler,
+    StandardScaler,
+)
+
+_N_FEATURES = 20
+_N_CALLS = 200
+
+
+class TransformLatencyTest(parameterized.TestCase):
+    """Micro-benchmark of the per-call latency of local pandas transforms on small batches."""
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(seed=0)
+        self._input_cols = [f"FEATURE_{i}" for i in range(_N_FEATURES)]
+        self._output_cols = [f"OUTPUT_{i}" for i in range(_N_FEATURES)]
+        self._train_df = pd.DataFrame(rng.normal(size=(1000, _N_FEATURES)), columns=self._input_cols)
+        self._train_df["ID"] = np.arange(1000)
+
+    @parameterized.product(  # type: ignore[misc]
+        transformer_class=[StandardScaler, MinMaxScaler, MaxAbsScaler, RobustScaler],
+        n_rows=[1, 100],
+    )
+    def test_transform_latency(self, transformer_class: Type[base.BaseTransformer], n_rows: int) -> None:
+        params: Dict[str, Any] = {"input_cols": self._input_cols, "output_cols": self._output_cols}
+        transformer = transformer_class(**params).fit(self._train_df)
+        batch = self._train_df.iloc[:n_rows]
+
+        def transform_sklearn() -> pd.DataFrame:
+            return transformer._transform_sklearn(batch)
+
+        def transform_numpy() -> pd.DataFrame:
+            return transformer.transform(batch)
+
+        pd.testing.assert_frame_equal(transform_numpy(), transform_sklearn())
+
+        sklearn_latency = min(timeit.repeat(transform_sklearn, number=_N_CALLS, repeat=3)) / _N_CALLS
+        numpy_latency = min(timeit.repeat(transform_numpy, number=_N_CALLS, repeat=3)) / _N_CALLS
+        logging.info(
+            "%s transform of %d rows: %.1f us per call (sklearn path: %.1f us per call)",
+            transformer_class.__name__,
+            n_rows,
+            numpy_latency * 1e6,
+            sklearn_latency * 1e6,
+        )
+
+    def test_partial_fit_invalidates_fitted_arrays(self) -> None:
+        scaler = StandardScaler(input_cols=self._input_cols, output_cols=self._output_cols)
+        scaler.partial_fit(self._train_df.iloc[:500])
+        scaler.transform(self._train_df.iloc[:1])
+        scaler.partial_fit(self._train_df.iloc[500:])
+
+        expected = StandardScaler(input_cols=self._input_cols, output_cols=self._output_cols).fit(self._train_df)
+        pd.testing.assert_frame_equal(scaler.transform(self._train_df), expected.transform(self._train_df))
+
+
+if __name__ == "__main__":
+    main()